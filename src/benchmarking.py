@@ -0,0 +1,348 @@
+from datastructures.custom_queue.bucketqueue import BucketQueue
+from datastructures.custom_queue.normalqueue import NormalQueue
+from datastructures.custom_queue.priorityqueue import PriorityQueue
+from datastructures.custom_queue.queue import WikiGraphQueue
+from datastructures.custom_queue.queueentry import QueueEntry
+from datastructures.custom_queue.spillqueue import SpillQueue
+from logic.build_journal import BuildJournal
+from logic.fetch.article_extractor import ArticleExtractor
+from logic.fetch.requester import Requester
+from logic.fetch.response_cache import ResponseCache
+from logic.graphbuilder import GraphBuilder
+from standin.corpus import Corpus
+from standin.standin_server import StandinServer
+
+import copy
+import os
+import random
+import re
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+
+def main() -> int:
+    #Used to measure components against their previous implementation on a fixture corpus
+    benchmark_extractor(None)
+    benchmark_build(Corpus())
+    benchmark_priority_queue([1000, 10000, 50000, 200000])
+    benchmark_queue_updates(None)
+    benchmark_entry_memory(100000)
+    return 0
+
+def benchmark_extractor(corpus_folder:str | None) -> None:
+    articles = load_fixture_articles(corpus_folder)
+
+    for name, extract in [("regex", extract_with_regex), ("streaming", extract_with_extractor)]:
+        start = time.perf_counter()
+
+        for article in articles:
+            extract(article)
+
+        duration = time.perf_counter() - start
+
+        tracemalloc.start()
+        peak = 0
+
+        for article in articles:
+            tracemalloc.reset_peak()
+            extract(article)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+
+        tracemalloc.stop()
+
+        print(f"{name}: {duration / len(articles) * 1000:.2f} ms per article, {peak / 1024:.0f} KiB peak memory")
+
+    links_unchunked, keywords_unchunked = extract_with_extractor(articles[0], len(articles[0]))
+    links_chunked, keywords_chunked = extract_with_extractor(articles[0], 17)
+    assert links_unchunked == links_chunked and keywords_unchunked == keywords_chunked
+    return None
+
+def extract_with_regex(article_text:str) -> tuple[list[str], list[str]]:
+    #The link and keyword extraction of Sorter before the streaming extractor
+    link_matches = re.findall(r'<a href="/wiki/(.+?)".+?>.+?<\/a>', article_text)
+    filtered_matches = [match for match in link_matches if "Datei:" not in match and "Spezial:" not in match]
+    trimmed_matches = [re.match(r'([^#]+?)(#.+)', match) for match in filtered_matches]
+    links = [match.group(1) for match in trimmed_matches if match]
+
+    words = article_text.split(" ")
+    cleaned_words = [word .rstrip(",.;") for word in words]
+    nominals = [word for word in cleaned_words if word.isalpha() and word[0].isupper() and len(word) > 2]
+    blacklist = ["Abschnitts", "Der", "Die", "Das", "Den", "Dem", "Des", "Ein", "Eine", "Einen", "Einem", "Eines", "Im", "In", "Dies", "Diese", "Dieser", "Dieses", "Er", "Sie", "Es", "Man", "Bei"]
+    filtered_nominals = [nominal for nominal in nominals if nominal not in blacklist]
+    keywords = [entry[0] for entry in Counter(filtered_nominals).most_common()[:10]]
+
+    return links, keywords
+
+def extract_with_extractor(article_text:str, chunk_size:int = 16384) -> tuple[list[str], list[str]]:
+    extractor = ArticleExtractor()
+
+    for chunk_start in range(0, len(article_text), chunk_size):
+        extractor.feed(article_text[chunk_start:chunk_start + chunk_size])
+
+    extractor.close()
+    return extractor.get_links(), extractor.get_keywords(10)
+
+def benchmark_build(corpus:Corpus, latency:float = 0.05) -> None:
+    #Builds the same graph against the local stand-in api with different fetch settings,
+    #with an empty cache, a fresh cache and a stale cache that has to be revalidated
+    start_name = corpus.get_titles()[0]
+
+    for workers, batch_size in [(1, 1), (8, 1), (1, 50), (8, 50)]:
+        cache_file = os.path.join(tempfile.gettempdir(), f"standin-benchmark-{workers}-{batch_size}.sqlite")
+
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+
+        for cache_state, ttl in [("cold", 3600.0), ("warm", 3600.0), ("stale", 0.0)]:
+            server = StandinServer(corpus, latency = latency, jitter = latency / 2)
+            requester = Requester(pool_size = max(10, workers), api_url = server.start(), cache = ResponseCache(cache_file, ttl = ttl))
+            builder = GraphBuilder(200, 10, requester = requester, workers = workers, batch_size = batch_size)
+
+            start = time.perf_counter()
+            graph = builder.build_graph_from_article(start_name, "n", False)
+            duration = time.perf_counter() - start
+
+            assert graph
+            stats = server.get_stats()
+            requester.close()
+            server.stop()
+
+            print(f"workers {workers}, batch {batch_size}, {cache_state} cache: {graph.get_node_count() / duration:.1f} articles/s, {stats['requests']} requests, {stats['duplicates']} duplicates, {stats['not_modified']} not modified")
+
+    return None
+
+def benchmark_priority_queue(frontier_sizes:list[int], operations:int = 200) -> None:
+    #Measures taking the next entry and raising the degree of a random entry on frontiers of the given sizes,
+    #for the heap of PriorityQueue, the buckets of BucketQueue and the sort on every take the heap replaced
+    for frontier_size in frontier_sizes:
+        randomizer = random.Random(frontier_size)
+        degrees = [randomizer.randrange(1, 20) for _ in range(frontier_size)]
+        updated_positions = [randomizer.randrange(frontier_size) for _ in range(operations)]
+        results = []
+
+        for queue_name, queue in [("heap", PriorityQueue("root")), ("buckets", BucketQueue("root"))]:
+            for position, degree in enumerate(degrees):
+                queue_entry = QueueEntry(f"Artikel {position}", 0, 1)
+
+                for _ in range(degree - 1):
+                    queue_entry.add_origin(0, 0)
+
+                queue.index[queue_entry.get_name()] = queue_entry
+                queue.put_entry(queue_entry)
+
+            start = time.perf_counter()
+
+            for position in updated_positions:
+                entry = queue.index[f"Artikel {position}"]
+                entry.add_origin(1, 0)
+                queue.entry_updated(entry)
+
+            update_duration = time.perf_counter() - start
+            start = time.perf_counter()
+
+            for _ in range(operations):
+                queue.get_next_entry()
+
+            take_duration = time.perf_counter() - start
+            results.append(f"{queue_name} {take_duration / operations * 1e6:.1f} us per take, {update_duration / operations * 1e6:.1f} us per update")
+
+        sorted_entries = []
+
+        for position, degree in enumerate(degrees):
+            sorted_entry = QueueEntry(f"Artikel {position}", 0, 1)
+
+            for _ in range(degree - 1):
+                sorted_entry.add_origin(0, 0)
+
+            sorted_entries.append(sorted_entry)
+
+        start = time.perf_counter()
+
+        for position in updated_positions:
+            sorted_entries[position].add_origin(1, 0)
+
+        update_duration = time.perf_counter() - start
+        start = time.perf_counter()
+
+        for _ in range(operations):
+            pop_by_sorting(sorted_entries)
+
+        take_duration = time.perf_counter() - start
+        results.append(f"sort {take_duration / operations * 1e6:.1f} us per take, {update_duration / operations * 1e6:.1f} us per update")
+
+        print(f"frontier {frontier_size}: " + ", ".join(results))
+
+    return None
+
+def pop_by_sorting(entries:list[QueueEntry]) -> QueueEntry:
+    #The take of PriorityQueue before the heap: sort by degree, take the first and filter out its name
+    entries.sort(key = lambda entry : entry.get_degree(), reverse = True)
+    next_entry = entries.pop(0)
+    entries[:] = [entry for entry in entries if entry.get_name() != next_entry.get_name()]
+    return next_entry
+
+def benchmark_queue_updates(journal_file:str | None) -> None:
+    #Replays the queue records of a build journal and measures the link batches of add_new_entries and only_update_entries
+    #for every queue type and for the scans over the frontier the name index replaced. Records a 5k node build if no journal is given.
+    #Every queue takes its own next entry where the journal took one, so all frontiers keep the size of the journaled one
+    if not journal_file:
+        journal_file = record_build_journal(5000)
+
+    loaded = BuildJournal(journal_file).load()
+    assert loaded
+    settings, records = loaded
+
+    queues:dict[str, WikiGraphQueue] = {
+        "normal" : NormalQueue(settings["root"]),
+        "priority" : PriorityQueue(settings["root"]),
+        "bucket" : BucketQueue(settings["root"]),
+        "spilling" : SpillQueue(settings["root"])
+    }
+    indexed_durations = dict.fromkeys(queues.keys(), 0.0)
+    scanned_entries:list[QueueEntry] = []
+    scanned_blacklist = {settings["root"]}
+    scanned_duration = 0.0
+    batches = 0
+    largest_frontier = 0
+
+    for record in records:
+        match record[0]:
+            case "Q" | "U":
+                for queue_name, queue in queues.items():
+                    start = time.perf_counter()
+
+                    if record[0] == "Q":
+                        queue.add_new_entries(record[1], record[2], record[3], False)
+                    else:
+                        queue.only_update_entries(record[1], record[2], record[3], False)
+
+                    indexed_durations[queue_name] += time.perf_counter() - start
+
+                start = time.perf_counter()
+                update_by_scanning(scanned_entries, scanned_blacklist, record[1], record[2], record[3], record[0] == "Q")
+                scanned_duration += time.perf_counter() - start
+
+                batches += 1
+                largest_frontier = max(largest_frontier, queues["normal"].get_entry_count())
+            case "T":
+                for queue in queues.values():
+                    queue.get_next_entry()
+
+                scanned_entries[:] = [entry for entry in scanned_entries if entry.get_name() != record[1]]
+                scanned_blacklist.add(record[1])
+            case "X":
+                for queue in queues.values():
+                    queue.add_article_to_blacklist(record[1])
+
+                scanned_blacklist.add(record[1])
+
+    spill_queue = queues["spilling"]
+    assert isinstance(spill_queue, SpillQueue)
+    spill_queue.close()
+
+    results = [f"{queue_name} {duration / batches * 1e6:.1f} us" for queue_name, duration in indexed_durations.items()]
+    results.append(f"scan {scanned_duration / batches * 1e6:.1f} us")
+
+    print(f"{batches} link batches, frontier up to {largest_frontier} entries: " + ", ".join(results) + " per batch")
+
+    return None
+
+def update_by_scanning(entries:list[QueueEntry], blacklist:set[str], new_links:list[str], origin_id:int, origin_depth:int, add_new:bool) -> None:
+    #The link batch of WikiGraphQueue before the name index: list membership tests and a scan over all entries per batch
+    filtered_links = [link for link in new_links if link not in blacklist]
+    known_entries = [entry.get_name() for entry in entries]
+    updatable_links = [link for link in filtered_links if link in known_entries]
+
+    for entry in entries:
+        if (name := entry.get_name()) in updatable_links:
+            updatable_links.remove(name)
+            entry.add_origin(origin_id, origin_depth)
+
+        if not updatable_links:
+            break
+
+    if add_new:
+        entries.extend(QueueEntry(link, origin_id, origin_depth + 1) for link in filtered_links if link not in known_entries)
+
+    return None
+
+def benchmark_entry_memory(frontier_size:int) -> None:
+    #Measures the memory a frontier of frontier_size entries takes per entry, with the degrees of a crawl:
+    #most entries are linked once, few are linked often. Compares the compact QueueEntry against the layout before it.
+    #The names are created before, as the link lists already hold them
+    randomizer = random.Random(frontier_size)
+    names = [f"Artikel {position}" for position in range(frontier_size)]
+    degrees = [min(int(randomizer.paretovariate(1.2)), 200) for _ in range(frontier_size)]
+
+    for layout, entry_type in [("list", ListQueueEntry), ("compact", QueueEntry)]:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        index:dict[str, QueueEntry | ListQueueEntry] = {}
+
+        for name, degree in zip(names, degrees):
+            entry = entry_type(name, 0, 1)
+
+            for origin_id in range(1, degree):
+                entry.add_origin(origin_id, 0)
+
+            index[name] = entry
+
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+
+        for entry in index.values():
+            for _ in entry.get_origins():
+                pass
+
+        duration = time.perf_counter() - start
+
+        print(f"{layout}: frontier {frontier_size}, {sum(degrees) / frontier_size:.1f} origins per entry: {used / frontier_size:.0f} bytes per entry, " \
+              f"reading all origins {duration * 1000:.1f} ms")
+
+    return None
+
+class ListQueueEntry:
+    #The layout of QueueEntry before it was made compact: an attribute dict, a separate degree counter
+    #and a list of origins that is deep-copied whenever the origins are read
+    def __init__(self, name:str, origin_id:int, depth:int) -> None:
+        self.name:str = name
+        self.degree:int = 1
+        self.origins:list[int] = [origin_id]
+        self.depth:int = depth
+        return None
+
+    def add_origin(self, origin_id:int, origin_depth:int) -> None:
+        self.degree += 1
+        self.origins.append(origin_id)
+        self.depth = min(self.depth, origin_depth + 1)
+        return None
+
+    def get_origins(self) -> list[int]:
+        return copy.deepcopy(self.origins)
+
+def record_build_journal(size:int) -> str:
+    #Builds a graph of size nodes against the local stand-in api with a large corpus and returns the location of its journal
+    corpus = Corpus(size = 4 * size, paragraphs = 3, links_per_article = 150)
+    server = StandinServer(corpus, latency = 0.0)
+    requester = Requester(api_url = server.start())
+    journal_file = os.path.join(tempfile.gettempdir(), f"standin-benchmark-{size}.journal")
+    builder = GraphBuilder(size, 10, requester = requester, workers = 8, batch_size = 50, journal = BuildJournal(journal_file))
+
+    graph = builder.build_graph_from_article(corpus.get_titles()[0], "p", False)
+
+    assert graph
+    requester.close()
+    server.stop()
+    return journal_file
+
+def load_fixture_articles(corpus_folder:str | None) -> list[str]:
+    #Reads recorded action=parse responses (*.json) or generates synthetic articles if no folder is given
+    corpus = Corpus(corpus_folder, size = 20, paragraphs = 400, links_per_article = 1200)
+    return [corpus.get_article(title)["html"] for title in corpus.get_titles()]
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 from datastructures.graph.graph import Graph
 from datastructures.graph.node import Node
 from datastructures.graph.edge import Edge
+from datastructures.graph.lazy_graph import LazyGraph
 from datastructures.cycles.cycle_manager import CycleManager
 from datastructures.cycles.cycle import Cycle
 
@@ -9,6 +10,15 @@ from custom_io.visualizer.visualizer import Visualizer
 from custom_io.visualizer.fancy_visualizer import FancyVisualizer
 
 from logic.graphbuilder import GraphBuilder
+from logic.graph_refresher import GraphRefresher
+from logic.fetch.response_cache import ResponseCache
+from logic.fetch.article_store import ArticleStore
+from logic.fetch.redirect_map import RedirectMap
+from logic.fetch.title_resolver import TitleResolver
+from logic.fetch.parse_pool import ParsePool
+from logic.build_journal import BuildJournal
+from logic.dump.dump_index import DumpIndex
+from logic.dump.link_dump_importer import LinkDumpImporter
 
 import os
 import re
@@ -85,6 +95,12 @@ class Parser:
                 case "build":
                     self.__build(options)
 
+                case "import":
+                    self.__import(options)
+
+                case "refresh":
+                    self.__refresh(options)
+
                 case "cycles":
                     self.__cycles(options)
 
@@ -110,6 +126,11 @@ class Parser:
         saved = 0
 
         for name, graph in self.__graphs.items():
+            if isinstance(graph, LazyGraph):
+                saved += 1
+                print('Graph' + name + ' is read from an adjacency file and is already saved.')
+                continue
+
             file_name = name + ".txt"
             self.__filehelper.write_graph_to_file(graph, file_name, False)
             saved += 1
@@ -183,6 +204,8 @@ class Parser:
         'read: Read a saved graph file into memory to use it.\n' \
         'save: Save an active graph into a file.\n' \
         'build: Create a new active graph.\n' \
+        'refresh: Update the articles of an active graph that changed since it was built.\n' \
+        'import: Create an adjacency file of a whole wiki from its page and pagelinks dumps.\n' \
         'visualize: Create a visualization of an active graph\n' \
         'traverse: Get further information about an active graph.\n' \
         'cycles: Detect circular links in an active graph.\n' \
@@ -281,7 +304,8 @@ class Parser:
         if "-h" in valid_user_options.keys():
             help_statement = ''\
             'This command is used to read graphs from textfiles created by this CLI for further use.\n' \
-            'Files are only found in the \"txtfiles\" folder inside the project folder\n\n' \
+            'Files are only found in the \"txtfiles\" folder inside the project folder\n' \
+            'Adjacency files (.adj) created by the \"import\" command are opened and read on demand\n\n' \
             'Mandatory Options:\n' \
             ' -f [filename] : specify the filename to read from, only selecting from the txtfiles directory\n\n' \
             'Available Options:\n' \
@@ -311,7 +335,12 @@ class Parser:
         assert filename_option
         file_name = filename_option[0]
 
-        read_graph = self.__filehelper.read_graph_from_file(file_name, verbose) 
+        read_graph:Graph | None
+
+        if file_name.endswith(".adj"):
+            read_graph = self.__filehelper.read_lazy_graph_from_file(file_name, verbose)
+        else:
+            read_graph = self.__filehelper.read_graph_from_file(file_name, verbose)
         
         if read_graph == None:
             failure_statement = '' \
@@ -366,6 +395,14 @@ class Parser:
         
         root_name = graph.get_root()
 
+        if isinstance(graph, LazyGraph):
+            failure_statement = '' \
+            'This graph is read from an adjacency file, which already contains it.\n' \
+            'Skipping saving of graph'
+
+            print(failure_statement)
+            return None
+
         if not self.__warn_options(invalid_user_options):
             return None
 
@@ -410,7 +447,7 @@ class Parser:
             The given user options
         """
 
-        available_options = {"-h" : 0, "-v" : 0, "-k" : 1, "-d" : 1, "-r" : 1, "-q" : 1}
+        available_options = {"-h" : 0, "-v" : 0, "-k" : 1, "-d" : 1, "-r" : 1, "-q" : 1, "-j" : 1, "-w" : 1, "-f" : 1, "-b" : 1, "-c" : 1, "-p" : 1, "-a" : 1, "-s" : 1, "-o" : 1, "-g" : 1, "--resume" : 1}
         valid_user_options, invalid_user_options = self.__parse_options(options, available_options)
 
         if "-h" in valid_user_options.keys():
@@ -418,18 +455,68 @@ class Parser:
             'This command is used to build an active graph from the name of an article.\n' \
             'Mandatory Options:\n' \
             ' -r [articlename] : The name of the wikipedia article that you want to use as a root for the graph\n' \
-            ' -q [n|p] : The type of queue to select the next article (n) normal queue or (p) priority queue\n' \
+            ' -q [n|p|b|s] : The type of queue to select the next article (n) normal queue, (p) priority queue, (b) bucket queue,\n' \
+            '   a priority queue that stays fast on very large frontiers, or (s) spilling queue, a normal queue that keeps most of a large frontier on disk\n' \
             'Available Options:\n' \
             ' -h : help option, to display further information. Disables functionality (Currently used)\n' \
             ' -v : verbose logging to get further information about the graph saving\n' \
             ' -k [num] : the amount of articles to be included. (Default is 500)\n' \
-            ' -d [num] : the maximal depth or distance to the original article that should be included. (Default is 10)'
+            ' -d [num] : the maximal depth or distance to the original article that should be included. (Default is 10)\n' \
+            ' -j [num] : the amount of requests sent at the same time. (Default is 1, building one article after another)\n' \
+            ' -w [num] : the amount of worker processes the fetched articles are parsed in, use together with -j to parse on several cores.\n' \
+            '   (Default is 0, parsing in the requesting threads)\n' \
+            ' -f [full|light] : the fetch profile, (full) requests the rendered html of every article,\n' \
+            '   (light) only its links and wikitext, which is several times smaller. Not used with -b. (Default is full)\n' \
+            ' -b [num] : the amount of articles fetched together in one batched request, at most 50. (Default is 1, fetching full articles)\n' \
+            ' -a [num] : the amount of next queue entries fetched ahead while building one article after another, at most 50. (Default is 0)\n' \
+            ' -c [on|off] : if already downloaded and sorted articles, known redirects and known missing titles should be reused from the cache.\n' \
+            '   The cache is kept in the cache folder between builds. (Default is off)\n' \
+            ' -p [on|off] : if new links should be resolved 50 at a time before queueing, so missing articles and other namespaces are never requested.\n' \
+            '   Costs extra title queries, which pay off on larger graphs. (Default is off)\n' \
+            ' -s [num] : the amount of added articles after which the build is checkpointed into its journal, 0 disables the journal.\n' \
+            '   Needed to resume the build with --resume. (Default is 0, no journal)\n' \
+            ' -o [dumpfile] : build offline from a local pages-articles.xml(.bz2) dump instead of requesting wikipedia.\n' \
+            '   The dump is indexed once on first use, which can take a while for a whole wiki\n' \
+            ' --resume [graphname] : continue the interrupted build of the graph \"[rootname-size]\" from its last checkpoint.\n' \
+            '   Root, queue type, size and depth are taken from the journal, -r and -q are not needed\n' \
+            ' -g [graphname] : grow the active graph to the size given by -k instead of building from scratch, -r is not needed.\n' \
+            '   Its nodes are not requested again if their articles are in the cache'
 
             print(help_statement)
             return None
         
+        resume_wrapped = valid_user_options.get("--resume")
+        journal_settings = None
+
+        if resume_wrapped:
+            journal_settings = BuildJournal(resume_wrapped[0] + ".journal").load_settings()
+
+            if not journal_settings:
+                failure_statement = '' \
+                f'Found no build journal for the graph \"{resume_wrapped[0]}\" to resume.\n' \
+                'Aborting graph building.'
+
+                print(failure_statement)
+                return None
+
+        seed_graph = None
+
+        if "-g" in valid_user_options.keys() and not journal_settings:
+            seed_graph = self.__check_graph_option(valid_user_options)
+
+            if not seed_graph:
+                return None
+
+            if isinstance(seed_graph, LazyGraph):
+                failure_statement = '' \
+                'Graphs read from an adjacency file can\'t be grown, as their articles are not stored.\n' \
+                'Aborting graph building.'
+
+                print(failure_statement)
+                return None
+
         root_given = "-r" in valid_user_options.keys()
-        if not root_given:
+        if not root_given and not journal_settings and not seed_graph:
             failure_statement = '' \
             'No root for graph building given. Can\'t start building graph without a starting point.\n' \
             'Please give a root by using \'-r [root] \'\n' \
@@ -438,37 +525,102 @@ class Parser:
             print(failure_statement)
             return None
 
-        graph_root_option = valid_user_options.get("-r")
-        assert graph_root_option
-        graph_root = graph_root_option[0]
+        if journal_settings:
+            graph_root = journal_settings["root"]
+            graph_size = journal_settings["size"]
+            graph_depth = journal_settings["depth"]
+        else:
+            if seed_graph:
+                graph_root = seed_graph.get_root()
+            else:
+                graph_root_option = valid_user_options.get("-r")
+                assert graph_root_option
+                graph_root = graph_root_option[0]
+
+            graph_size = self.__get_graph_size(valid_user_options)
+            if graph_size == -1:
+                return None
+            
+            graph_depth = self.__get_graph_depth(valid_user_options)
+            if graph_depth == -1:
+                return None
 
-        graph_size = self.__get_graph_size(valid_user_options)
-        if graph_size == -1:
+        worker_count = self.__get_worker_count(valid_user_options)
+        if worker_count == -1:
             return None
-        
-        graph_depth = self.__get_graph_depth(valid_user_options)
-        if graph_depth == -1:
+
+        process_count = self.__get_process_count(valid_user_options)
+        if process_count == -1:
+            return None
+
+        batch_size = self.__get_batch_size(valid_user_options)
+        if batch_size == -1:
+            return None
+
+        prefetch_window = self.__get_prefetch_window(valid_user_options)
+        if prefetch_window == -1:
+            return None
+
+        checkpoint_interval = self.__get_checkpoint_interval(valid_user_options)
+        if checkpoint_interval == -1:
+            return None
+
+        cache_setting_wrapped = valid_user_options.get("-c", ["off"])
+        cache_setting = cache_setting_wrapped[0]
+
+        if cache_setting not in ["on", "off"]:
+            failure_statement = '' \
+            f'Given cache setting \"{cache_setting}\" is neither \"on\" nor \"off\".\n' \
+            'Aborting graph building'
+
+            print(failure_statement)
+            return None
+
+        resolve_setting_wrapped = valid_user_options.get("-p", ["off"])
+        resolve_setting = resolve_setting_wrapped[0]
+
+        if resolve_setting not in ["on", "off"]:
+            failure_statement = '' \
+            f'Given title resolving setting \"{resolve_setting}\" is neither \"on\" nor \"off\".\n' \
+            'Aborting graph building'
+
+            print(failure_statement)
+            return None
+
+        fetch_profile = valid_user_options.get("-f", ["full"])[0]
+
+        if fetch_profile not in ["full", "light"]:
+            failure_statement = '' \
+            f'Given fetch profile \"{fetch_profile}\" is neither \"full\" nor \"light\".\n' \
+            'Aborting graph building'
+
+            print(failure_statement)
             return None
         
         queue_type_given = "-q" in valid_user_options.keys()
-        if not queue_type_given:
+        if not queue_type_given and not journal_settings:
             failure_statement = '' \
             'No queue type given. Can\'t start building graph without a queue type.\n' \
-            'Please specify a queue type by using \"-q [n|p]\" to either use a (n) normal queue or a (p) priority queue\n' \
+            'Please specify a queue type by using \"-q [n|p|b|s]\" to either use a (n) normal queue, a (p) priority queue, a (b) bucket queue or a (s) spilling queue\n' \
             'Aborting graph building.'
 
             print(failure_statement)
             return None
         
-        queue_type_wrapped = valid_user_options.get("-q")
-        assert queue_type_wrapped
-        queue_type = queue_type_wrapped[0]
+        if journal_settings:
+            queue_type = journal_settings["queue"]
+        else:
+            queue_type_wrapped = valid_user_options.get("-q")
+            assert queue_type_wrapped
+            queue_type = queue_type_wrapped[0]
 
-        if queue_type not in ["n", "p"]:
+        if queue_type not in ["n", "p", "b", "s"]:
             failure_statement = '' \
             f'Given queue type \"{queue_type}\" is not in the supported types:\n' \
             '\"n\": normal queue\n' \
             '\"p\": priority queue\n' \
+            '\"b\": bucket queue\n' \
+            '\"s\": spilling queue\n' \
             'Aborting graphbuilding'
 
             print(failure_statement)
@@ -479,22 +631,80 @@ class Parser:
         
         verbose = "-v" in valid_user_options.keys()
 
+        dump_file_wrapped = valid_user_options.get("-o")
+        dump_file = dump_file_wrapped[0] if dump_file_wrapped else None
+
         if verbose:
             arguments_statement = '' \
             'Starting graph building:\n' \
             f'Root: {graph_root}\n' \
             f'Max graph size: {graph_size}\n' \
             f'Max graph depth: {graph_depth}\n' \
+            f'Concurrent requests: {worker_count}\n' \
+            f'Parsing processes: {process_count if process_count else "none, parsing in the requesting threads"}\n' \
+            f'Fetch profile: {fetch_profile}\n' \
+            f'Articles per request: {batch_size}\n' \
+            f'Articles fetched ahead: {prefetch_window}\n' \
+            f'Checkpoint interval: {checkpoint_interval if checkpoint_interval else "no journal"}\n' \
+            f'Resuming: {"yes" if journal_settings else "no"}\n' \
+            f'Growing: {f"from {seed_graph.get_node_count()} nodes" if seed_graph else "no"}\n' \
+            f'Response cache: {cache_setting}\n' \
+            f'Title resolving: {resolve_setting}\n' \
+            f'Dump file: {dump_file if dump_file else "none, requesting wikipedia"}\n' \
             'Queue type: '
             
-            queue_type_name = 'normal' if queue_type == "n" else 'priority'
+            queue_type_name = {"n" : 'normal', "p" : 'priority', "b" : 'bucket', "s" : 'spilling'}[queue_type]
             arguments_statement += queue_type_name + ' queue\n'
 
             print(arguments_statement)
 
-        builder = GraphBuilder(graph_size, graph_depth)
-        
-        graph = builder.build_graph_from_article(graph_root, queue_type, verbose)
+        dump_index = None
+
+        if dump_file:
+            dump_index = self.__get_dump_index(dump_file, verbose)
+
+            if not dump_index:
+                return None
+
+        cache = ResponseCache() if cache_setting == "on" and not dump_index else None
+        article_store = ArticleStore() if cache_setting == "on" and not dump_index else None
+        redirect_map = RedirectMap() if cache_setting == "on" and not dump_index else None
+        title_resolver = None
+
+        if resolve_setting == "on" and not dump_index:
+            title_resolver = TitleResolver(None if cache_setting == "on" else ":memory:", redirect_map)
+
+        parse_pool = ParsePool(process_count) if process_count and not dump_index else None
+
+        graph_name = f"{graph_root}-{graph_size}"
+        journal = BuildJournal(graph_name + ".journal", checkpoint_interval if checkpoint_interval else 100) if checkpoint_interval or journal_settings else None
+        builder = GraphBuilder(graph_size, graph_depth, workers = worker_count, batch_size = batch_size, cache = cache, article_store = article_store, dump_index = dump_index, redirect_map = redirect_map, title_resolver = title_resolver, prefetch_window = prefetch_window, journal = journal, parse_pool = parse_pool, fetch_profile = fetch_profile)
+
+        try:
+            if journal_settings:
+                graph = builder.resume_graph(verbose)
+            elif seed_graph:
+                graph = builder.grow_graph(seed_graph, queue_type, verbose)
+            else:
+                graph = builder.build_graph_from_article(graph_root, queue_type, verbose)
+        finally:
+            if parse_pool:
+                parse_pool.close()
+
+            if cache:
+                cache.close()
+
+            if article_store:
+                article_store.close()
+
+            if title_resolver:
+                title_resolver.close()
+
+            if redirect_map:
+                redirect_map.close()
+
+            if dump_index:
+                dump_index.close()
 
         if graph == None:
             building_failed_statement = '' \
@@ -503,7 +713,6 @@ class Parser:
             print(building_failed_statement)
             return None
         
-        graph_name = f"{graph_root}-{graph_size}"
         self.__graphs[graph_name] = graph
 
         success_statement = '' \
@@ -513,6 +722,195 @@ class Parser:
         print(success_statement)
         return None
     
+    def __import(self, options:list[str]|None) -> None:
+        """
+        Creating an adjacency file of a whole wiki from its SQL dumps and adding it as active graph
+
+        Parameters:
+        -----------
+        options : list[str] | None
+            The given user options
+        """
+
+        available_options = {"-h" : 0, "-v" : 0, "-p" : 1, "-l" : 1, "-t" : 1, "-e" : 1, "-r" : 1, "-n" : 1}
+        valid_user_options, invalid_user_options = self.__parse_options(options, available_options)
+
+        if "-h" in valid_user_options.keys():
+            help_statement = '' \
+            'This command is used to create an adjacency file of all articles of a wiki and the links between them\n' \
+            'from the SQL dumps (e.g. dewiki-latest-page.sql.gz), without requesting any article.\n' \
+            'The file is saved in the txtfiles folder and added as active graph that is read on demand.\n' \
+            'Mandatory Options:\n' \
+            ' -p [pagefile] : The page dump\n' \
+            ' -l [pagelinksfile] : The pagelinks dump\n' \
+            'Available Options:\n' \
+            ' -h : help option, to display further information. Disables functionality (Currently used)\n' \
+            ' -v : verbose logging to get further information about the import\n' \
+            ' -t [linktargetfile] : The linktarget dump, needed for newer pagelinks dumps without titles\n' \
+            ' -e [redirectfile] : The redirect dump, to keep links to redirects. (Default drops them)\n' \
+            ' -r [articlename] : The article used as root. (Default is the article with the most incoming links)\n' \
+            ' -n [filename] : a custom file name for the adjacency file. Default is \"[wikiname].adj\"'
+
+            print(help_statement)
+            return None
+
+        if "-p" not in valid_user_options.keys() or "-l" not in valid_user_options.keys():
+            failure_statement = '' \
+            'The options \"-p [pagefile]\" and \"-l [pagelinksfile]\" are mandatory.\n' \
+            'Aborting import'
+
+            print(failure_statement)
+            return None
+
+        dump_files = {option : valid_user_options[option][0] for option in ["-p", "-l", "-t", "-e"] if option in valid_user_options.keys()}
+        missing_files = [dump_file for dump_file in dump_files.values() if not os.path.isfile(dump_file)]
+
+        if missing_files:
+            failure_statement = '' \
+            f'Given dump files {", ".join(missing_files)} do not exist.\n' \
+            'Aborting import'
+
+            print(failure_statement)
+            return None
+
+        if not self.__warn_options(invalid_user_options):
+            return None
+
+        verbose = "-v" in valid_user_options.keys()
+        root = valid_user_options["-r"][0] if "-r" in valid_user_options.keys() else None
+
+        if "-n" in valid_user_options.keys():
+            file_name = valid_user_options["-n"][0]
+        else:
+            file_name = os.path.basename(dump_files["-p"]).split("-page")[0] + ".adj"
+
+        importer = LinkDumpImporter(dump_files["-p"], dump_files["-l"], dump_files.get("-t"), dump_files.get("-e"))
+
+        if not importer.import_links(self.__filehelper.get_graph_file_location(file_name), root, verbose):
+            return None
+
+        graph = self.__filehelper.read_lazy_graph_from_file(file_name, verbose)
+
+        if graph == None:
+            return None
+
+        graph_name = f"{graph.get_root()}-{graph.get_node_count()}"
+        self.__graphs[graph_name] = graph
+
+        success_statement = '' \
+        'Successfully imported graph which is now available for other commands using the name:\n' \
+        f'{graph_name}\n'
+
+        print(success_statement)
+        return None
+
+    def __refresh(self, options:list[str]|None) -> None:
+        """
+        Updating the nodes of an active graph whose articles changed since they were fetched
+
+        Parameters:
+        -----------
+        options : list[str] | None
+            The given user options
+        """
+
+        available_options = {"-h" : 0, "-v" : 0, "-g" : 1, "-j" : 1, "-b" : 1, "-f" : 1, "-c" : 1, "-p" : 1}
+        valid_user_options, invalid_user_options = self.__parse_options(options, available_options)
+
+        if "-h" in valid_user_options.keys():
+            help_statement = '' \
+            'This command is used to bring an active graph up to date with wikipedia without building it again.\n' \
+            'The current revisions of all nodes are requested 50 at a time, only changed articles are fetched again\n' \
+            'and their keywords and outgoing edges are replaced. The graph keeps its nodes.\n' \
+            'Mandatory Options:\n' \
+            ' -g [graphname] : The name of the active graph to refresh\n' \
+            'Available Options:\n' \
+            ' -h : help option, to display further information. Disables functionality (Currently used)\n' \
+            ' -v : verbose logging to get further information about the refresh\n' \
+            ' -j [num] : the amount of requests sent at the same time. (Default is 1)\n' \
+            ' -b [num] : the amount of changed articles fetched together in one batched request, at most 50.\n' \
+            '   Use the batch size the graph was built with, as batched requests read keywords from the intro only. (Default is 1)\n' \
+            ' -f [full|light] : the fetch profile of changed articles, use the profile the graph was built with. (Default is full)\n' \
+            ' -c [on|off] : if already sorted revisions and known redirects should be reused from the cache. (Default is off)\n' \
+            ' -p [on|off] : if unknown links of changed articles should be resolved 50 at a time to find redirects to nodes. (Default is off)'
+
+            print(help_statement)
+            return None
+
+        graph = self.__check_graph_option(valid_user_options)
+
+        if not graph:
+            return None
+
+        if isinstance(graph, LazyGraph):
+            failure_statement = '' \
+            'Graphs read from an adjacency file can\'t be refreshed, as they don\'t know the revisions of their articles.\n' \
+            'Please import newer dumps instead.'
+
+            print(failure_statement)
+            return None
+
+        worker_count = self.__get_worker_count(valid_user_options)
+        if worker_count == -1:
+            return None
+
+        batch_size = self.__get_batch_size(valid_user_options)
+        if batch_size == -1:
+            return None
+
+        cache_setting = valid_user_options.get("-c", ["off"])[0]
+        resolve_setting = valid_user_options.get("-p", ["off"])[0]
+
+        if cache_setting not in ["on", "off"] or resolve_setting not in ["on", "off"]:
+            failure_statement = '' \
+            f'Given cache setting \"{cache_setting}\" or title resolving setting \"{resolve_setting}\" is neither \"on\" nor \"off\".\n' \
+            'Aborting graph refresh'
+
+            print(failure_statement)
+            return None
+
+        fetch_profile = valid_user_options.get("-f", ["full"])[0]
+
+        if fetch_profile not in ["full", "light"]:
+            failure_statement = '' \
+            f'Given fetch profile \"{fetch_profile}\" is neither \"full\" nor \"light\".\n' \
+            'Aborting graph refresh'
+
+            print(failure_statement)
+            return None
+
+        if not self.__warn_options(invalid_user_options):
+            return None
+
+        verbose = "-v" in valid_user_options.keys()
+
+        cache = ResponseCache() if cache_setting == "on" else None
+        article_store = ArticleStore() if cache_setting == "on" else None
+        redirect_map = RedirectMap() if cache_setting == "on" else None
+        title_resolver = TitleResolver(None if cache_setting == "on" else ":memory:", redirect_map) if resolve_setting == "on" else None
+
+        refresher = GraphRefresher(workers = worker_count, batch_size = batch_size, cache = cache, article_store = article_store, redirect_map = redirect_map, title_resolver = title_resolver, fetch_profile = fetch_profile)
+        try:
+            refresher.refresh_graph(graph, verbose)
+        finally:
+            if cache:
+                cache.close()
+
+            if article_store:
+                article_store.close()
+
+            if title_resolver:
+                title_resolver.close()
+
+            if redirect_map:
+                redirect_map.close()
+
+        success_statement = '' \
+        'Successfully refreshed the graph. Save it to keep the changes.\n'
+
+        print(success_statement)
+        return None
+
     def __get_graph_size(self, valid_user_options:dict[str, list[str]]) -> int:
         """
         Extract maximum graph size from valid_user_options. Helper function for the build command.
@@ -574,6 +972,198 @@ class Parser:
 
         return graph_depth
     
+    def __get_worker_count(self, valid_user_options:dict[str, list[str]]) -> int:
+        """
+        Extract the amount of concurrent requests from valid_user_options. Helper function for the build command
+
+        Parameters:
+        -----------
+        valid_user_options : dict[str, list[str]]
+            The valid options given by the user
+        """
+
+        custom_workers_used = "-j" in valid_user_options.keys()
+        if custom_workers_used:
+            user_workers_option = valid_user_options.get("-j")
+            assert user_workers_option
+            user_workers = user_workers_option[0]
+            valid_custom_workers = user_workers.isdigit() and user_workers != "0"
+
+            if valid_custom_workers:
+                worker_count = int(user_workers)
+            else:
+                fallback_statement = '' \
+                f'Given amount of concurrent requests \"{user_workers}\" is not a positive integer bigger than 0. Aborting graph building.'
+
+                print(fallback_statement)
+                worker_count = -1
+        else:
+            worker_count = 1
+
+        return worker_count
+
+    def __get_process_count(self, valid_user_options:dict[str, list[str]]) -> int:
+        """
+        Extract the amount of parsing worker processes from valid_user_options. Helper function for the build command
+
+        Parameters:
+        -----------
+        valid_user_options : dict[str, list[str]]
+            The valid options given by the user
+        """
+
+        custom_processes_used = "-w" in valid_user_options.keys()
+        if custom_processes_used:
+            user_processes_option = valid_user_options.get("-w")
+            assert user_processes_option
+            user_processes = user_processes_option[0]
+            valid_custom_processes = user_processes.isdigit() and int(user_processes) <= (os.cpu_count() or 1) * 2
+
+            if valid_custom_processes:
+                process_count = int(user_processes)
+            else:
+                fallback_statement = '' \
+                f'Given amount of worker processes "{user_processes}" is not an integer between 0 and twice the {os.cpu_count() or 1} cores. Aborting graph building.'
+
+                print(fallback_statement)
+                process_count = -1
+        else:
+            process_count = 0
+
+        return process_count
+
+    def __get_batch_size(self, valid_user_options:dict[str, list[str]]) -> int:
+        """
+        Extract the amount of articles per batched request from valid_user_options. Helper function for the build command
+
+        Parameters:
+        -----------
+        valid_user_options : dict[str, list[str]]
+            The valid options given by the user
+        """
+
+        custom_batch_used = "-b" in valid_user_options.keys()
+        if custom_batch_used:
+            user_batch_option = valid_user_options.get("-b")
+            assert user_batch_option
+            user_batch = user_batch_option[0]
+            valid_custom_batch = user_batch.isdigit() and 0 < int(user_batch) <= 50
+
+            if valid_custom_batch:
+                batch_size = int(user_batch)
+            else:
+                fallback_statement = '' \
+                f'Given batch size \"{user_batch}\" is not an integer between 1 and 50. Aborting graph building.'
+
+                print(fallback_statement)
+                batch_size = -1
+        else:
+            batch_size = 1
+
+        return batch_size
+
+    def __get_prefetch_window(self, valid_user_options:dict[str, list[str]]) -> int:
+        """
+        Extract the amount of queue entries fetched ahead from valid_user_options. Helper function for the build command
+
+        Parameters:
+        -----------
+        valid_user_options : dict[str, list[str]]
+            The valid options given by the user
+        """
+
+        custom_window_used = "-a" in valid_user_options.keys()
+        if custom_window_used:
+            user_window_option = valid_user_options.get("-a")
+            assert user_window_option
+            user_window = user_window_option[0]
+            valid_custom_window = user_window.isdigit() and 0 <= int(user_window) <= 50
+
+            if valid_custom_window:
+                prefetch_window = int(user_window)
+            else:
+                fallback_statement = '' \
+                f'Given prefetch window \"{user_window}\" is not an integer between 0 and 50. Aborting graph building.'
+
+                print(fallback_statement)
+                prefetch_window = -1
+        else:
+            prefetch_window = 0
+
+        return prefetch_window
+
+    def __get_checkpoint_interval(self, valid_user_options:dict[str, list[str]]) -> int:
+        """
+        Extract the amount of added articles between two checkpoints from valid_user_options. Helper function for the build command
+
+        Parameters:
+        -----------
+        valid_user_options : dict[str, list[str]]
+            The valid options given by the user
+        """
+
+        custom_interval_used = "-s" in valid_user_options.keys()
+        if custom_interval_used:
+            user_interval_option = valid_user_options.get("-s")
+            assert user_interval_option
+            user_interval = user_interval_option[0]
+
+            if user_interval.isdigit():
+                checkpoint_interval = int(user_interval)
+            else:
+                fallback_statement = '' \
+                f'Given checkpoint interval \"{user_interval}\" is not a positive integer or 0. Aborting graph building.'
+
+                print(fallback_statement)
+                checkpoint_interval = -1
+        else:
+            checkpoint_interval = 0
+
+        return checkpoint_interval
+
+    def __get_dump_index(self, dump_file:str, verbose:bool) -> DumpIndex | None:
+        """
+        Opens the index of a local dump and builds it first if the dump wasn't indexed yet or changed since.
+        Helper function for the build command
+
+        Parameters:
+        -----------
+        dump_file : str
+            The location of the dump file given by the user
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        if not os.path.isfile(dump_file):
+            failure_statement = '' \
+            f'Given dump file \"{dump_file}\" does not exist.\n' \
+            'Aborting graph building'
+
+            print(failure_statement)
+            return None
+
+        dump_index = DumpIndex(dump_file)
+
+        if dump_index.is_ingested():
+            return dump_index
+
+        index_statement = '' \
+        f'Indexing dump file \"{dump_file}\". This is only done once per dump'
+
+        print(index_statement)
+
+        if not dump_index.ingest(verbose):
+            failure_statement = '' \
+            'Indexing the dump failed.\n' \
+            'Aborting graph building'
+
+            print(failure_statement)
+            dump_index.close()
+            return None
+
+        return dump_index
+
     def __warn_options(self, invalid_user_options:dict[str, list[str]]) -> bool:
         """
         Prints invalid options and checks with the user if the command should still be run. General helper function
@@ -2,6 +2,8 @@ from datastructures.cycles.cycle import Cycle
 from datastructures.graph.graph import Graph
 from datastructures.graph.node import Node
 from datastructures.graph.edge import Edge
+from datastructures.graph.adjacency_store import AdjacencyStore
+from datastructures.graph.lazy_graph import LazyGraph
 
 import os
 
@@ -20,6 +22,12 @@ class FileHelper:
 
     write_cycles_to_file(origin_graph:Graph, cycles:list[Cycle]) -> None
         Writes cycles to a file
+
+    read_lazy_graph_from_file(file_name : str, verbose : bool) -> LazyGraph | None
+        Opens the adjacency file at file_name as a graph that is read on demand
+
+    get_graph_file_location(file_name : str) -> str
+        Returns the location of a graph file in the txtfiles folder
     """
 
     def __init__(self) -> None:
@@ -99,7 +107,7 @@ class FileHelper:
             print(f"Sorted {node_count} nodes by id for edge-matrix")
 
         for node in nodes:
-            to_write += f"{node.get_id()};{node.get_name()};{node.get_depth()};{u",".join(node.get_keywords())}\n"
+            to_write += f"{node.get_id()};{node.get_name()};{node.get_depth()};{u",".join(node.get_keywords())};{node.get_revision()}\n"
 
         if verbose:
             print("Successfully generated node-text")
@@ -225,8 +233,9 @@ class FileHelper:
         if verbose:
             print(f"Expecting {node_count} nodes for root: {root}")
 
-        nodes = set(self.__extract_nodes(node_lines))
-        node_ids = [node.get_id() for node in nodes]
+        node_list = self.__extract_nodes(node_lines)
+        nodes = set(node_list)
+        node_ids = [node.get_id() for node in node_list]
 
         if verbose:
             print(f"Successfully read {len(node_ids)} Nodes")
@@ -239,6 +248,48 @@ class FileHelper:
 
         return Graph(root, nodes, edges)
 
+    def read_lazy_graph_from_file(self, file_name:str, verbose:bool) -> LazyGraph | None:
+        """
+        Opens the adjacency file named file_name in the txtfiles folder as a graph that is read on demand
+
+        Parameters:
+        -----------
+        file_name : str
+            The name of the adjacency file
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        full_file_name = self.get_graph_file_location(file_name)
+
+        try:
+            store = AdjacencyStore(full_file_name)
+        except (OSError, ValueError) as error:
+            failure_statement = '' \
+            f'Could not open adjacency file {full_file_name}: {error}\n' \
+            'Abort graph reading'
+
+            print(failure_statement)
+            return None
+
+        if verbose:
+            print(f"Opened adjacency file: {full_file_name}\nFound {store.get_node_count()} nodes and {store.get_edge_count()} edges")
+
+        return LazyGraph(store)
+
+    def get_graph_file_location(self, file_name:str) -> str:
+        """
+        Returns the location of a graph file in the txtfiles folder
+
+        Parameters:
+        -----------
+        file_name : str
+            The name of the graph file
+        """
+
+        return self.__directory + "txtfiles\\" + file_name
+
     def __extract_nodes(self, node_lines:list[str]) -> list[Node]:
         """
         Converts the saved text format into a list of Node objects
@@ -257,7 +308,8 @@ class FileHelper:
             depth = int(node_attributes[2])
             cleaned = node_attributes[3].rstrip()
             keywords = cleaned.split(",")
-            nodes.append(Node(id = node_id, name = name, depth = depth, keywords = keywords))
+            revision = int(node_attributes[4]) if len(node_attributes) > 4 else 0
+            nodes.append(Node(id = node_id, name = name, depth = depth, keywords = keywords, revision = revision))
         return nodes
 
     def __extract_edges(self, edge_lines:list[str], node_ids:list[int]) -> set[Edge]:
@@ -0,0 +1,195 @@
+from datastructures.custom_queue.queueentry import QueueEntry
+from datastructures.custom_queue.queue import WikiGraphQueue
+
+from collections import deque
+
+class BucketQueue(WikiGraphQueue):
+    """
+    A class that is a queue of node candidates, inheriting from WikiGraphQueue.
+    The degrees of entries are small and only ever grow by one, so the entries are kept in one bucket per degree
+    with a pointer to the highest bucket that isn't empty. Taking the entry with the highest degree and moving an entry
+    to the next bucket after a new origin cost O(1) amortized, independent of the size of the queue.
+    An entry moving up leaves a stale reference in its old bucket, which is dropped when it reaches the front of that bucket.
+    Once the stale references outnumber the queued entries, all buckets are compacted, so the memory of the buckets
+    follows the size of the queue and not the amount of updates. Entries of the same degree are taken in the order they reached that degree
+
+    Attributes:
+    -----------
+    __buckets : list[deque[QueueEntry]]
+        The buckets of entries by degree, each in the order the entries are taken
+
+    __max_degree : int
+        The highest degree that may have a queued entry. Every bucket above it is empty
+
+    __stale_count : int
+        The amount of stale references in the buckets
+
+    Methods:
+    --------
+    get_next_entry() -> NodeQueueEntry
+        Gives an entry of the queue and deletes it from the entries
+
+    peek_entries(amount : int) -> list[QueueEntry]
+        Gives the entries with the highest degree without deleting them
+
+    put_entry(new_entry : QueueEntry) -> None
+        Adds an entry to the bucket of its degree
+
+    entry_updated(updated_entry : QueueEntry) -> None
+        Moves an entry to the bucket of its new degree
+    """
+
+
+    def __init__(self, starting_name:str) -> None:
+        """
+        Sets up the entries and blacklist
+
+        Parameters:
+        -----------
+        starting_name : str
+            the name of the article that is used as a start of the current graph the queue object belongs to
+        """
+
+        WikiGraphQueue.__init__(self, starting_name)
+        self.__buckets:list[deque[QueueEntry]] = [deque()]
+        self.__max_degree:int = 0
+        self.__stale_count:int = 0
+        return None
+
+
+    def get_next_entry(self) -> QueueEntry | None:
+        """
+        Returns a queue entry with maximum degree, removes it from the entries and adds it to blacklist so it isn't explored again
+        or returns None if the queue is empty
+        """
+
+        while self.__max_degree > 0:
+            bucket = self.__buckets[self.__max_degree]
+
+            while bucket:
+                next_entry = bucket.popleft()
+
+                if self.__is_current(next_entry, self.__max_degree):
+                    del self.index[next_entry.get_name()]
+                    self.blacklist.add(next_entry.get_name())
+
+                    if self.__stale_count > len(self.index):
+                        self.__compact()
+
+                    return next_entry
+
+                self.__stale_count -= 1
+
+            self.__max_degree -= 1
+
+        return None
+
+    def peek_entries(self, amount:int) -> list[QueueEntry]:
+        """
+        Returns up to amount entries with maximum degree, highest first, without removing them.
+        Ties are ordered like get_next_entry orders them
+
+        Parameters:
+        -----------
+        amount : int
+            The maximum amount of entries to return
+        """
+
+        peeked_entries:list[QueueEntry] = []
+
+        for degree in range(self.__max_degree, 0, -1):
+            for entry in self.__buckets[degree]:
+                if len(peeked_entries) == amount:
+                    return peeked_entries
+
+                if self.__is_current(entry, degree):
+                    peeked_entries.append(entry)
+
+        return peeked_entries
+
+    def put_entry(self, new_entry:QueueEntry) -> None:
+        """
+        Adds a new entry at the back of the bucket of its degree
+
+        Parameters:
+        -----------
+        new_entry : QueueEntry
+            The entry to add
+        """
+
+        self.__bucket(new_entry.get_degree()).append(new_entry)
+        return None
+
+    def entry_updated(self, updated_entry:QueueEntry) -> None:
+        """
+        Adds an entry to the back of the bucket of its new degree after an origin was added.
+        The reference left in its old bucket is dropped once it is found there or the buckets are compacted
+
+        Parameters:
+        -----------
+        updated_entry : QueueEntry
+            The entry that was updated
+        """
+
+        self.__bucket(updated_entry.get_degree()).append(updated_entry)
+        self.__stale_count += 1
+
+        if self.__stale_count > len(self.index):
+            self.__compact()
+
+        return None
+
+    def __compact(self) -> None:
+        """
+        Drops every stale reference from the buckets, keeping the order of the queued entries.
+        Costs O(references), which the updates and takes that left the stale references behind pay for
+        """
+
+        for degree, bucket in enumerate(self.__buckets):
+            if bucket:
+                self.__buckets[degree] = deque(entry for entry in bucket if self.__is_current(entry, degree))
+
+        self.__stale_count = 0
+        return None
+
+    def __bucket(self, degree:int) -> deque[QueueEntry]:
+        """
+        Returns the bucket of the given degree, adding buckets up to it if needed, and raises the max pointer to it
+
+        Parameters:
+        -----------
+        degree : int
+            The degree of the bucket
+        """
+
+        while len(self.__buckets) <= degree:
+            self.__buckets.append(deque())
+
+        if degree > self.__max_degree:
+            self.__max_degree = degree
+
+        return self.__buckets[degree]
+
+    def __is_current(self, entry:QueueEntry, degree:int) -> bool:
+        """
+        Returns if the reference to entry in the bucket of degree is the queued entry itself and not a stale one,
+        left behind when the entry moved to a higher bucket or was taken
+
+        Parameters:
+        -----------
+        entry : QueueEntry
+            The referenced entry
+
+        degree : int
+            The degree of the bucket the reference was found in
+        """
+
+        return entry.get_degree() == degree and self.index.get(entry.get_name()) is entry
+
+
+def main() -> int:
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
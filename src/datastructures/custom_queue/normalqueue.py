@@ -1,14 +1,29 @@
 from datastructures.custom_queue.queueentry import QueueEntry
 from datastructures.custom_queue.queue import WikiGraphQueue
 
+from collections import deque
+from itertools import islice
+
 class NormalQueue(WikiGraphQueue):
     """
-    A class that is a queue of node candidates, inheriting from WikiGraphQueue
+    A class that is a queue of node candidates, inheriting from WikiGraphQueue.
+    The entries are kept in a deque, so taking the next entry and adding an entry only cost O(1)
+
+    Attributes:
+    -----------
+    __entries : deque[QueueEntry]
+        The entries in the order they are taken, the oldest first
 
     Methods:
     --------
     get_next_entry() -> NodeQueueEntry
         Gives an entry of the queue and deletes it from the entries
+
+    peek_entries(amount : int) -> list[QueueEntry]
+        Gives the oldest entries of the queue without deleting them
+
+    put_entry(new_entry : QueueEntry) -> None
+        Adds an entry at the back of the queue
     """
 
 
@@ -23,6 +38,7 @@ class NormalQueue(WikiGraphQueue):
         """
 
         WikiGraphQueue.__init__(self, starting_name)
+        self.__entries:deque[QueueEntry] = deque()
         return None
 
 
@@ -32,16 +48,40 @@ class NormalQueue(WikiGraphQueue):
         or returns None if the queue is empty
         """
 
-        if len(self.entries) == 0:
+        if len(self.__entries) == 0:
             return None
 
-        next_entry = self.entries.pop(0)
+        next_entry = self.__entries.popleft()
+        del self.index[next_entry.get_name()]
         self.blacklist.add(next_entry.get_name())
-    
-        self.entries = [entry for entry in self.entries if entry.get_name() != next_entry.get_name()]
 
         return next_entry
 
+    def peek_entries(self, amount:int) -> list[QueueEntry]:
+        """
+        Returns up to amount entries in the order they were added, without removing them
+
+        Parameters:
+        -----------
+        amount : int
+            The maximum amount of entries to return
+        """
+
+        return list(islice(self.__entries, amount))
+
+    def put_entry(self, new_entry:QueueEntry) -> None:
+        """
+        Adds a new entry at the back of the queue
+
+        Parameters:
+        -----------
+        new_entry : QueueEntry
+            The entry to add
+        """
+
+        self.__entries.append(new_entry)
+        return None
+
 
 def main() -> int:
     return 0
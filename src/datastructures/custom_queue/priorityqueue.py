@@ -1,14 +1,42 @@
 from datastructures.custom_queue.queueentry import QueueEntry
 from datastructures.custom_queue.queue import WikiGraphQueue
 
+import heapq
+
 class PriorityQueue(WikiGraphQueue):
     """
-    A class that is a queue of node candidates, inheriting from WikiGraphQueue
+    A class that is a queue of node candidates, inheriting from WikiGraphQueue.
+    The entries are kept in a binary max heap by degree, with the position of every entry indexed by name,
+    so taking the next entry and moving an entry forward after a new origin only cost O(log n).
+    Entries of the same degree are taken in the order they were added
+
+    Attributes:
+    -----------
+    __entries : list[QueueEntry]
+        The entries as binary heap, the entry with the highest degree first
+
+    __keys : list[tuple[int, int]]
+        The heap key of the entry at the same position in entries, the negated degree and the order the entry was added in
+
+    __positions : dict[str, int]
+        The position of every entry in entries by name
+
+    __next_order : int
+        The order given to the next added entry
 
     Methods:
     --------
     get_next_entry() -> NodeQueueEntry
         Gives an entry of the queue and deletes it from the entries
+
+    peek_entries(amount : int) -> list[QueueEntry]
+        Gives the entries with the highest degree without deleting them
+
+    put_entry(new_entry : QueueEntry) -> None
+        Adds an entry to the heap
+
+    entry_updated(updated_entry : QueueEntry) -> None
+        Moves an entry forward in the heap after its degree increased
     """
 
 
@@ -23,8 +51,12 @@ class PriorityQueue(WikiGraphQueue):
         """
 
         WikiGraphQueue.__init__(self, starting_name)
+        self.__entries:list[QueueEntry] = []
+        self.__keys:list[tuple[int, int]] = []
+        self.__positions:dict[str, int] = {}
+        self.__next_order:int = 0
         return None
- 
+
 
     def get_next_entry(self) -> QueueEntry | None:
         """
@@ -32,19 +64,187 @@ class PriorityQueue(WikiGraphQueue):
         or returns None if the queue is empty
         """
 
-        if len(self.entries) == 0:
+        if len(self.__entries) == 0:
             return None
 
-        self.entries.sort(key = lambda entry : entry.get_degree(), reverse = True)
+        next_entry = self.__entries[0]
+        last_entry = self.__entries.pop()
+        last_key = self.__keys.pop()
+        del self.__positions[next_entry.get_name()]
+        del self.index[next_entry.get_name()]
 
-        next_entry = self.entries.pop(0)
-        self.blacklist.add(next_entry.get_name())
+        if self.__entries:
+            self.__entries[0] = last_entry
+            self.__keys[0] = last_key
+            self.__positions[last_entry.get_name()] = 0
+            self.__sift_down(0)
 
-        self.entries = [entry for entry in self.entries if entry.get_name() != next_entry.get_name()]
+        self.blacklist.add(next_entry.get_name())
 
         return next_entry
-   
-        
+
+    def peek_entries(self, amount:int) -> list[QueueEntry]:
+        """
+        Returns up to amount entries with maximum degree, highest first, without removing them.
+        Ties are ordered like get_next_entry orders them. Walks the heap from the top, so it costs O(amount log amount)
+
+        Parameters:
+        -----------
+        amount : int
+            The maximum amount of entries to return
+        """
+
+        peeked_entries = []
+        candidates = [(self.__keys[0], 0)] if self.__entries else []
+
+        while candidates and len(peeked_entries) < amount:
+            _, position = heapq.heappop(candidates)
+            peeked_entries.append(self.__entries[position])
+
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(self.__entries):
+                    heapq.heappush(candidates, (self.__keys[child], child))
+
+        return peeked_entries
+
+    def put_entry(self, new_entry:QueueEntry) -> None:
+        """
+        Adds a new entry to the heap, behind the entries of the same degree
+
+        Parameters:
+        -----------
+        new_entry : QueueEntry
+            The entry to add
+        """
+
+        self.__insert(new_entry, self.__next_order)
+        self.__next_order += 1
+        return None
+
+    def entry_updated(self, updated_entry:QueueEntry) -> None:
+        """
+        Moves an entry forward in the heap after an origin was added and its degree increased
+
+        Parameters:
+        -----------
+        updated_entry : QueueEntry
+            The entry that was updated
+        """
+
+        position = self.__positions[updated_entry.get_name()]
+        self.__keys[position] = (-updated_entry.get_degree(), self.__keys[position][1])
+        self.__sift_up(position)
+        return None
+
+    def __insert(self, new_entry:QueueEntry, order:int) -> None:
+        """
+        Adds an entry to the heap with the given order among entries of the same degree
+
+        Parameters:
+        -----------
+        new_entry : QueueEntry
+            The entry to add
+
+        order : int
+            The order of the entry among entries of the same degree, lower is taken first
+        """
+
+        self.__entries.append(new_entry)
+        self.__keys.append((-new_entry.get_degree(), order))
+        self.__positions[new_entry.get_name()] = len(self.__entries) - 1
+        self.__sift_up(len(self.__entries) - 1)
+        return None
+
+    def __sift_up(self, position:int) -> None:
+        """
+        Moves the entry at position up the heap until its parent is taken before it
+
+        Parameters:
+        -----------
+        position : int
+            The position of the entry in entries
+        """
+
+        entry = self.__entries[position]
+        key = self.__keys[position]
+
+        while position > 0:
+            parent = (position - 1) // 2
+
+            if self.__keys[parent] <= key:
+                break
+
+            self.__move(parent, position)
+            position = parent
+
+        self.__place(entry, key, position)
+        return None
+
+    def __sift_down(self, position:int) -> None:
+        """
+        Moves the entry at position down the heap until both of its children are taken after it
+
+        Parameters:
+        -----------
+        position : int
+            The position of the entry in entries
+        """
+
+        entry = self.__entries[position]
+        key = self.__keys[position]
+        size = len(self.__entries)
+
+        while (child := 2 * position + 1) < size:
+            if child + 1 < size and self.__keys[child + 1] < self.__keys[child]:
+                child += 1
+
+            if key <= self.__keys[child]:
+                break
+
+            self.__move(child, position)
+            position = child
+
+        self.__place(entry, key, position)
+        return None
+
+    def __move(self, source:int, target:int) -> None:
+        """
+        Moves the entry at source to target, overwriting the entry there
+
+        Parameters:
+        -----------
+        source : int
+            The current position of the entry
+
+        target : int
+            The new position of the entry
+        """
+
+        self.__place(self.__entries[source], self.__keys[source], target)
+        return None
+
+    def __place(self, entry:QueueEntry, key:tuple[int, int], position:int) -> None:
+        """
+        Puts an entry with its key at position and indexes it
+
+        Parameters:
+        -----------
+        entry : QueueEntry
+            The entry
+
+        key : tuple[int, int]
+            The heap key of the entry
+
+        position : int
+            The position in entries
+        """
+
+        self.__entries[position] = entry
+        self.__keys[position] = key
+        self.__positions[entry.get_name()] = position
+        return None
+
+
 def main() -> int:
     return 0
 
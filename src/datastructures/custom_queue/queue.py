@@ -7,22 +7,35 @@ class WikiGraphQueue(ABC):
 
     Attributes:
     -----------
-    entries : list[QueueEntry]
-        The list of queue entries
-
     blacklist : set[str]
         The names of blacklisted entries
 
+    index : dict[str, QueueEntry]
+        The queued entries by name. Holds exactly the entries the queue holds, so a name is queued at most once.
+        How the entries are ordered is up to each queue, which keeps them in a private structure of its own
+
     Methods:
     --------
     get_next_entry() -> QueueEntry | None:
         Returns the next entry, remove it from the queue and adds the name to the blacklist so it isn't queued again
+
+    peek_entries(amount : int) -> list[QueueEntry]
+        Returns the entries that would be returned next, in order, without removing them
     
     add_article_to_blacklist(blacklisted_article : str) -> None
         Add given name to the blacklist
 
+    put_entry(new_entry : QueueEntry) -> None
+        Adds a new entry to the queue
+
+    entry_updated(updated_entry : QueueEntry) -> None
+        Lets the queue react to a new origin of one of its entries
+
+    get_entry_count() -> int
+        Returns the amount of queued entries
+
     only_update_entries(new_links : list[str], origin_id : int, origin_depth : int) -> None
-        Updates the already existing entries in entries based if the are in new_links based on the origin_id and origin_depth
+        Updates the already existing entries based if the are in new_links based on the origin_id and origin_depth
 
     add_new_entries(new_links : list[str], origin_id : int, origin_depth : int) -> None:
         Updates known articles and creates new queue entries for unknown article names in new_links based on the origin_id and origin_depth
@@ -30,7 +43,7 @@ class WikiGraphQueue(ABC):
 
     def __init__(self, starting_name:str) -> None:
         """
-        Sets up the entries and blacklist
+        Sets up the index and blacklist
 
         Parameters:
         -----------
@@ -38,17 +51,30 @@ class WikiGraphQueue(ABC):
             the name of the article that is used as a start of the current graph the queue object belongs to
         """
 
-        self.entries:list[QueueEntry] = []
-        self.blacklist:set[str] = set(starting_name)
+        self.blacklist:set[str] = {starting_name}
+        self.index:dict[str, QueueEntry] = {}
         return None
     
     @abstractmethod
     def get_next_entry(self) -> QueueEntry | None:
         """
-        Returns a queue entry, removes it from the entries and adds it to blacklist so it isn't explored again
+        Returns a queue entry, removes it from the entries and the index and adds it to blacklist so it isn't explored again
         or returns None if the queue is empty
         """
         pass
+
+    @abstractmethod
+    def peek_entries(self, amount:int) -> list[QueueEntry]:
+        """
+        Returns up to amount entries in the order get_next_entry would return them if the queue didn't change,
+        without removing them or adding them to the blacklist
+
+        Parameters:
+        -----------
+        amount : int
+            The maximum amount of entries to return
+        """
+        pass
     
     def add_article_to_blacklist(self, blacklisted_article:str) -> None:
         """
@@ -66,6 +92,39 @@ class WikiGraphQueue(ABC):
 
         return None
 
+    @abstractmethod
+    def put_entry(self, new_entry:QueueEntry) -> None:
+        """
+        Adds a new entry at the back of the queue. Queues that keep their entries ordered put it in place instead.
+        Only called for names that are not queued yet, after the entry was added to the index
+
+        Parameters:
+        -----------
+        new_entry : QueueEntry
+            The entry to add
+        """
+        pass
+
+    def entry_updated(self, updated_entry:QueueEntry) -> None:
+        """
+        Called after an origin was added to an entry of the queue. Queues that order their entries by degree move it forward,
+        the queue order of the others doesn't change
+
+        Parameters:
+        -----------
+        updated_entry : QueueEntry
+            The entry that was updated
+        """
+
+        return None
+
+    def get_entry_count(self) -> int:
+        """
+        Returns the amount of queued entries
+        """
+
+        return len(self.index)
+
     def only_update_entries(self, new_links:list[str], origin_id:int, origin_depth:int, verbose:bool) -> None:
         """
         Updates existing queue entries by adding the given origin id
@@ -86,23 +145,25 @@ class WikiGraphQueue(ABC):
             Should the execution be verbose
         """
 
-        filtered_links = [link for link in new_links if link not in self.blacklist]
-        known_entries = [entry.get_name() for entry in self.entries]
-        updatable_links = [link for link in filtered_links if link in known_entries]
+        updated_count = 0
+
+        for link in new_links:
+            if link not in self.blacklist and (entry := self.index.get(link)):
+                self.__update_entry(entry, origin_id, origin_depth)
+                updated_count += 1
 
         if verbose:
             report_statement = '' \
-            f'Found {len(updatable_links)} updates to existing queue entries'
+            f'Found {updated_count} updates to existing queue entries'
 
             print(report_statement)
-                    
-        self.__update_entries(updatable_links, origin_id, origin_depth)
         
         return None
   
     def add_new_entries(self, new_links:list[str], origin_id:int, origin_depth:int, verbose:bool) -> None:
         """
-        Adds the article names to the queue or updates their entries if they are already present
+        Adds the article names to the queue or updates their entries if they are already present.
+        Every link is looked up in the index and the blacklist once, so a batch costs O(len(new_links))
 
         Parameters:
         -----------
@@ -119,75 +180,70 @@ class WikiGraphQueue(ABC):
             Should the execution be verbose
         """
 
-        filtered_links = [link for link in new_links if link not in self.blacklist]
-        known_entries = [entry.get_name() for entry in self.entries]
-        updatable_links = [link for link in filtered_links if link in known_entries]
-        
-        if verbose:
-            report_statement = '' \
-            f'Found {len(updatable_links)} updates to existing queue entries'
-
-            print(report_statement)
-
-        self.__update_entries(updatable_links, origin_id, origin_depth)
+        updated_count = 0
+        created_count = 0
 
-        creatable_links = [link for link in filtered_links if link not in known_entries]
+        for link in new_links:
+            if link in self.blacklist:
+                continue
 
+            if (entry := self.index.get(link)):
+                self.__update_entry(entry, origin_id, origin_depth)
+                updated_count += 1
+            else:
+                self.__add_entry(link, origin_id, origin_depth)
+                created_count += 1
+        
         if verbose:
             report_statement = '' \
-            f'Found {len(creatable_links)} links to unknown articles. Creating new queue entries'
+            f'Found {updated_count} updates to existing queue entries\n' \
+            f'Found {created_count} links to unknown articles. Creating new queue entries'
 
             print(report_statement)
 
-        self.__add_entries(creatable_links, origin_id, origin_depth)
-
         return None
 
-    def __add_entries(self, links:list[str], origin_id:int, origin_depth:int) -> None:
+    def __add_entry(self, link:str, origin_id:int, origin_depth:int) -> None:
         """
-        Adds given links to the queue
+        Creates a queue entry for the link, indexes it and adds it to the queue
 
         Parameters:
         -----------
-        links : list[str]
-            The links to add to the queue
+        link : str
+            The article name to add to the queue
 
         origin_id : int
-            The id of the article / node from which the links stem from
+            The id of the article / node from which the link stems from
 
         origin_depth : int
-            The depth of the origin article of the links
+            The depth of the origin article of the link
         """
 
-        for link in links:
-            new_entry = QueueEntry(link, origin_id, origin_depth + 1)
-            self.entries.append(new_entry)
+        new_entry = QueueEntry(link, origin_id, origin_depth + 1)
+        self.index[link] = new_entry
+        self.put_entry(new_entry)
 
         return None
     
-    def __update_entries(self, links:list[str], origin_id:int, origin_depth:int) -> None:
+    def __update_entry(self, entry:QueueEntry, origin_id:int, origin_depth:int) -> None:
         """
-        Updates the queue based on the given links
+        Adds an origin to a queued entry and lets the queue react to it
 
         Parameters:
         -----------
-        links : list[str]
-            The links to update the queue
+        entry : QueueEntry
+            The queued entry
 
         origin_id : int
-            The id of the article / node the links stem from
+            The id of the article / node the link stems from
 
         origin_depth : int
-            The depth of the origin article of the links
+            The depth of the origin article of the link
         """
 
-        for entry in self.entries:
-            if (name := entry.get_name()) in links:
-                links.remove(name)
-                entry.add_origin(origin_id, origin_depth)
+        entry.add_origin(origin_id, origin_depth)
+        self.entry_updated(entry)
 
-            if not links:
-                break
         return None
 
 def main() -> int:
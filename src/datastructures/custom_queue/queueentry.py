@@ -1,20 +1,20 @@
-import copy
+from array import array
 
 
 class QueueEntry:
     """
-    A Class to encapsulate the tuple that is an entry in the queue used to build the graph
+    A Class to encapsulate the tuple that is an entry in the queue used to build the graph.
+    Frontiers hold many more entries than the graph holds nodes, so the entry is kept compact:
+    it has slots instead of an attribute dict, and keeps its origins in an array of 64 bit integers, whose length is the degree.
+    Most entries are only ever linked once, so the array is only created for the second origin, until then the single origin ID is kept
 
     Attributes:
     -----------
     __name : str
         The name of the article
 
-    __degree : int
-        The amount of times this article has been linked to in the currently explored articles
-
-    __origins : list[int]
-        The list of ID's of the explored articles that link to this article
+    __origins : int | array[int]
+        The ID of the explored article that links to this article, or the ID's of all of them once there are several, one per link
 
     __depth : int
         The minimum depth that this article has been seen at in the links of the explored articles
@@ -25,22 +25,24 @@ class QueueEntry:
         Adds a new source to the article and updates __depth if applicable
 
     get_degree() -> int
-        Return __degree
+        Returns the amount of times this article has been linked to in the currently explored articles
 
     get_name() -> str
         Returns __name
 
-    get_origins() -> list[int]
-        Returns __origins
+    get_origins() -> tuple[int, ...]
+        Returns the ID's in __origins
 
     get_depth() -> int
         Returns __depth
     """
 
+    __slots__ = ("__name", "__origins", "__depth")
+
 
     def __init__(self, name:str, origin_id:int, depth:int) -> None:
         """
-        Sets up the queue entry object, by setting the name and depth, initializing the sources list with the original source and setting the degree to one
+        Sets up the queue entry object, by setting the name and depth and initializing the sources with the original source
         
         Parameters:
         -----------
@@ -55,9 +57,8 @@ class QueueEntry:
         """
 
         self.__name:str = name
-        self.__degree:int = 1
-        self.__origins:list[int] = [origin_id]
-        self.__depth = depth
+        self.__origins:int | array[int] = origin_id
+        self.__depth:int = depth
         return None
 
     def add_origin(self, origin_id:int, origin_depth:int) -> None:
@@ -73,18 +74,21 @@ class QueueEntry:
             The Depth of the explored article that the article was found to be linked in
         """
 
-        self.__degree += 1
-        self.__origins.append(origin_id)
+        if isinstance(self.__origins, int):
+            self.__origins = array("q", (self.__origins, origin_id))
+        else:
+            self.__origins.append(origin_id)
+
         if (origin_depth + 1 < self.__depth):
             self.__depth = origin_depth + 1
         return None
 
     def get_degree(self) -> int:
         """
-        Returns __degree
+        Returns the amount of times this article has been linked to in the currently explored articles
         """
 
-        return self.__degree
+        return 1 if isinstance(self.__origins, int) else len(self.__origins)
     
     def get_name(self) -> str:
         """
@@ -93,12 +97,12 @@ class QueueEntry:
 
         return self.__name
     
-    def get_origins(self) -> list[int]:
+    def get_origins(self) -> tuple[int, ...]:
         """
-        Returns __origins
+        Returns the ID's in __origins as a tuple, which stays valid while origins are added to the entry
         """
 
-        return copy.deepcopy(self.__origins)
+        return (self.__origins,) if isinstance(self.__origins, int) else tuple(self.__origins)
 
     def get_depth(self) -> int:
         """
@@ -0,0 +1,352 @@
+from datastructures.custom_queue.queueentry import QueueEntry
+from datastructures.custom_queue.queue import WikiGraphQueue
+
+from collections import deque
+from itertools import islice
+
+import sqlite3
+
+class SpillQueue(WikiGraphQueue):
+    """
+    A class that is a queue of node candidates, inheriting from WikiGraphQueue.
+    Takes entries in the order they were added like NormalQueue, but keeps only a bounded amount of them in memory:
+    the front of the queue, which is taken next, and the newest entries. Once more than memory_entries entries are held,
+    the newest ones are spilled to a temporary sqlite database with their name, degree, depth and origins,
+    and read back in chunks when the front runs empty. Links to spilled entries update them on disk,
+    so the frontier of a large crawl costs disk space instead of memory
+
+    Attributes:
+    -----------
+    __front : deque[QueueEntry]
+        The front of the queue in memory, taken next
+
+    __tail : list[QueueEntry]
+        The newest entries in memory, queued behind the spilled ones
+
+    __memory_entries : int
+        The amount of entries held in memory after which the newest ones are spilled
+
+    __spilled_count : int
+        The amount of entries on disk
+
+    __connection : sqlite3.Connection
+        The connection to the temporary database of spilled entries
+
+    Methods:
+    --------
+    get_next_entry() -> NodeQueueEntry
+        Gives an entry of the queue and deletes it from the entries
+
+    peek_entries(amount : int) -> list[QueueEntry]
+        Gives the oldest entries of the queue without deleting them
+
+    put_entry(new_entry : QueueEntry) -> None
+        Adds an entry at the back of the queue
+
+    get_entry_count() -> int
+        Returns the amount of queued entries in memory and on disk
+
+    only_update_entries(new_links : list[str], origin_id : int, origin_depth : int, verbose : bool) -> None
+        Updates the queued entries in memory and on disk
+
+    add_new_entries(new_links : list[str], origin_id : int, origin_depth : int, verbose : bool) -> None
+        Updates the queued entries in memory and on disk and adds the others, spilling the newest entries if needed
+
+    close() -> None
+        Closes and deletes the database of spilled entries
+    """
+
+
+    def __init__(self, starting_name:str, memory_entries:int = 10000, file_name:str = "") -> None:
+        """
+        Sets up the entries, blacklist and the database of spilled entries
+
+        Parameters:
+        -----------
+        starting_name : str
+            the name of the article that is used as a start of the current graph the queue object belongs to
+
+        memory_entries : int
+            The amount of entries held in memory after which the newest ones are spilled to disk
+
+        file_name : str
+            The location of the database of spilled entries. Defaults to a private temporary file
+            that sqlite deletes when the queue is closed or garbage collected
+        """
+
+        WikiGraphQueue.__init__(self, starting_name)
+        self.__front:deque[QueueEntry] = deque()
+        self.__tail:list[QueueEntry] = []
+        self.__memory_entries:int = memory_entries
+        self.__spilled_count:int = 0
+        self.__connection:sqlite3.Connection = sqlite3.connect(file_name)
+        self.__setup_tables()
+        return None
+
+
+    def get_next_entry(self) -> QueueEntry | None:
+        """
+        Returns a queue entry, removes it from the entries and adds it to blacklist so it isn't explored again
+        or returns None if the queue is empty
+        """
+
+        self.__fill_front(1)
+
+        if len(self.__front) == 0:
+            return None
+
+        next_entry = self.__front.popleft()
+        del self.index[next_entry.get_name()]
+        self.blacklist.add(next_entry.get_name())
+
+        return next_entry
+
+    def peek_entries(self, amount:int) -> list[QueueEntry]:
+        """
+        Returns up to amount entries in the order they were added, without removing them.
+        Reads spilled entries back into memory if the front holds fewer than amount entries
+
+        Parameters:
+        -----------
+        amount : int
+            The maximum amount of entries to return
+        """
+
+        self.__fill_front(amount)
+        return list(islice(self.__front, amount))
+
+    def put_entry(self, new_entry:QueueEntry) -> None:
+        """
+        Adds a new entry at the back of the queue
+
+        Parameters:
+        -----------
+        new_entry : QueueEntry
+            The entry to add
+        """
+
+        self.__tail.append(new_entry)
+        return None
+
+    def get_entry_count(self) -> int:
+        """
+        Returns the amount of queued entries in memory and on disk
+        """
+
+        return len(self.index) + self.__spilled_count
+
+    def only_update_entries(self, new_links:list[str], origin_id:int, origin_depth:int, verbose:bool) -> None:
+        """
+        Updates existing queue entries in memory and on disk by adding the given origin id
+        to their list of discovery sources and updating the minimum discovery depth if applicable
+
+        Parameters:
+        -----------
+        new_links : list[str]
+            The list of article names to be updated
+
+        origin_id : int
+            ID of the node that is a source of the article names in new_links
+
+        origin_depth : int
+            Depth of the node that is a source of the article names in new_links
+
+        verbose : bool
+            Should the execution be verbose
+        """
+
+        spilled_links = self.__update_spilled_entries(new_links, origin_id, origin_depth, verbose)
+        WikiGraphQueue.only_update_entries(self, [link for link in new_links if link not in spilled_links], origin_id, origin_depth, verbose)
+        return None
+
+    def add_new_entries(self, new_links:list[str], origin_id:int, origin_depth:int, verbose:bool) -> None:
+        """
+        Adds the article names to the queue or updates their entries in memory or on disk if they are already present.
+        Spills the newest entries afterwards if more than memory_entries entries are held in memory
+
+        Parameters:
+        -----------
+        new_links : list[str]
+            The list of article names to be added to the queue
+
+        origin_id : int
+            ID of the node that is a source of the article names in new_links
+
+        origin_depth : int
+            Depth of the node that is a source of the article names in new_links
+
+        verbose : bool
+            Should the execution be verbose
+        """
+
+        spilled_links = self.__update_spilled_entries(new_links, origin_id, origin_depth, verbose)
+        WikiGraphQueue.add_new_entries(self, [link for link in new_links if link not in spilled_links], origin_id, origin_depth, verbose)
+
+        if len(self.index) > self.__memory_entries and self.__tail:
+            self.__spill(verbose)
+
+        return None
+
+    def close(self) -> None:
+        """
+        Closes the database of spilled entries, which deletes it if it is the default temporary file
+        """
+
+        self.__connection.close()
+        return None
+
+    def __setup_tables(self) -> None:
+        """
+        Creates the table of spilled entries, ordered by the sequence they were spilled in.
+        The database only lives as long as the queue, so it is neither journaled nor synced
+        """
+
+        self.__connection.execute("PRAGMA journal_mode = OFF")
+        self.__connection.execute("PRAGMA synchronous = OFF")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS spilled ("
+            "sequence INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, degree INTEGER NOT NULL, depth INTEGER NOT NULL, origins TEXT NOT NULL)"
+        )
+        self.__connection.execute("DELETE FROM spilled")
+        self.__connection.commit()
+        return None
+
+    def __update_spilled_entries(self, links:list[str], origin_id:int, origin_depth:int, verbose:bool) -> set[str]:
+        """
+        Adds the origin to the spilled entries of the given links on disk and returns their names,
+        so they aren't queued again
+
+        Parameters:
+        -----------
+        links : list[str]
+            The article names to update
+
+        origin_id : int
+            The id of the article / node the links stem from
+
+        origin_depth : int
+            The depth of the origin article of the links
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        if not self.__spilled_count:
+            return set()
+
+        candidates = list(dict.fromkeys(link for link in links if link not in self.blacklist and link not in self.index))
+        spilled_links:set[str] = set()
+
+        for chunk_start in range(0, len(candidates), 500):
+            chunk = candidates[chunk_start:chunk_start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.__connection.execute(f"SELECT name FROM spilled WHERE name IN ({placeholders})", chunk).fetchall()
+            spilled_links.update(row[0] for row in rows)
+
+        if not spilled_links:
+            return spilled_links
+
+        with self.__connection:
+            self.__connection.executemany(
+                "UPDATE spilled SET degree = degree + 1, depth = MIN(depth, ?), origins = origins || ',' || ? WHERE name = ?",
+                [(origin_depth + 1, str(origin_id), link) for link in links if link in spilled_links]
+            )
+
+        if verbose:
+            report_statement = '' \
+            f'Found {len(spilled_links)} updates to queue entries spilled to disk'
+
+            print(report_statement)
+
+        return spilled_links
+
+    def __spill(self, verbose:bool) -> None:
+        """
+        Writes the newest entries to disk and removes them from memory. They stay behind the spilled entries before them
+
+        Parameters:
+        -----------
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        with self.__connection:
+            self.__connection.executemany(
+                "INSERT INTO spilled (name, degree, depth, origins) VALUES (?, ?, ?, ?)",
+                [(entry.get_name(), entry.get_degree(), entry.get_depth(), ",".join(map(str, entry.get_origins()))) for entry in self.__tail]
+            )
+
+        for entry in self.__tail:
+            del self.index[entry.get_name()]
+
+        self.__spilled_count += len(self.__tail)
+
+        if verbose:
+            report_statement = '' \
+            f'Spilled {len(self.__tail)} queue entries to disk, {self.__spilled_count} entries are on disk'
+
+            print(report_statement)
+
+        self.__tail = []
+        return None
+
+    def __fill_front(self, amount:int) -> None:
+        """
+        Moves entries to the front of the queue until it holds at least amount entries or the queue is exhausted.
+        Spilled entries are read back in chunks of half of memory_entries before the newest entries in memory are moved
+
+        Parameters:
+        -----------
+        amount : int
+            The amount of entries the front should hold
+        """
+
+        while len(self.__front) < amount:
+            if self.__spilled_count:
+                self.__load(max(amount - len(self.__front), self.__memory_entries // 2))
+            elif self.__tail:
+                self.__front.extend(self.__tail)
+                self.__tail = []
+            else:
+                break
+
+        return None
+
+    def __load(self, amount:int) -> None:
+        """
+        Reads up to amount of the oldest spilled entries back into memory, at the back of the front,
+        and deletes them from disk
+
+        Parameters:
+        -----------
+        amount : int
+            The maximum amount of entries to read
+        """
+
+        rows = self.__connection.execute(
+            "SELECT sequence, name, depth, origins FROM spilled ORDER BY sequence LIMIT ?", (amount,)
+        ).fetchall()
+
+        with self.__connection:
+            self.__connection.execute("DELETE FROM spilled WHERE sequence <= ?", (rows[-1][0],))
+
+        for _, name, depth, origins in rows:
+            origin_ids = [int(origin_id) for origin_id in origins.split(",")]
+            entry = QueueEntry(name, origin_ids[0], depth)
+
+            for origin_id in origin_ids[1:]:
+                entry.add_origin(origin_id, depth)
+
+            self.index[name] = entry
+            self.__front.append(entry)
+
+        self.__spilled_count -= len(rows)
+        return None
+
+
+def main() -> int:
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,5 +1,6 @@
 from datastructures.graph.graph import Graph
 from datastructures.graph.node import Node
+from datastructures.graph.lazy_graph import LazyGraph
 from datastructures.cycles.tarjan.tarjan_graph import TarjanGraph
 from datastructures.cycles.tarjan.tarjan_node import TarjanNode
 from datastructures.cycles.tarjan.tarjan_calculator import TarjanCalculator
@@ -47,15 +48,18 @@ class CycleManager:
         max_cycle_size : int | None
             The maximum size of cycle to search for. If None is given, all cycles will be found
         """
-        converted_graph = self.__generate_tarjan_graph(graph, verbose)
-
         tarjan_calc = TarjanCalculator()
-        sccs = tarjan_calc.calculate_sccs(converted_graph, verbose)
+
+        if isinstance(graph, LazyGraph):
+            sccs = tarjan_calc.calculate_adjacency_sccs(graph.get_store(), verbose)
+        else:
+            converted_graph = self.__generate_tarjan_graph(graph, verbose)
+            sccs = tarjan_calc.calculate_sccs(converted_graph, verbose)
 
         self.__partitions = self.__convert_sccs(sccs, graph, verbose)
 
         if not max_cycle_size:
-            max_cycle_size = len(graph.get_nodes())
+            max_cycle_size = graph.get_node_count()
 
         cycles = self.__get_directed_cycles_from_partitions(max_cycle_size, verbose)
 
@@ -80,7 +84,7 @@ class CycleManager:
         """
                 
         if not max_cycle_size:
-            max_cycle_size = len(graph.get_nodes())
+            max_cycle_size = graph.get_node_count()
 
         cycles = self.__get_nondirectional_cycles(graph, max_cycle_size, verbose)
 
@@ -298,9 +302,10 @@ class CycleManager:
 
             print(report_statement)
 
+        scc_ids = set(scc)
         edges = set()
         for node in nodes:
-            filtered_out_going = [edge for edge in node.get_outgoing() if edge.get_end_id() in scc]
+            filtered_out_going = [edge for edge in node.get_outgoing() if edge.get_end_id() in scc_ids]
 
             for edge in filtered_out_going:
                 edges.add(edge)
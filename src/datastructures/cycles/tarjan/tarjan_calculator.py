@@ -1,5 +1,8 @@
 from datastructures.cycles.tarjan.tarjan_graph import TarjanGraph
 from datastructures.cycles.tarjan.tarjan_node import TarjanNode
+from datastructures.graph.adjacency_store import AdjacencyStore
+
+from array import array
 
 
 class TarjanCalculator:
@@ -24,6 +27,9 @@ class TarjanCalculator:
     --------
     find_strongly_connected_components(graph : Graph) -> set[Cycle]
         Finds all strongly connected components in the given graph and returns them as a set
+
+    calculate_adjacency_sccs(store : AdjacencyStore, verbose : bool) -> list[list[int]]
+        Finds all strongly connected components of an adjacency file without recursion
     """
 
 
@@ -66,6 +72,89 @@ class TarjanCalculator:
 
         return self.__sccs
     
+    def calculate_adjacency_sccs(self, store:AdjacencyStore, verbose:bool) -> list[list[int]]:
+        """
+        The Tarjan algorithm on the arrays of an adjacency file. Uses an explicit stack instead of recursion
+        and integer arrays instead of node objects, so it works on graphs with millions of nodes.
+        Returns the components as lists of page IDs
+
+        Parameters:
+        -----------
+        store : AdjacencyStore
+            The adjacency file to be searched
+
+        verbose : bool
+            If the process should have verbose logging
+        """
+
+        node_count = store.get_node_count()
+        indices = array("q", [-1]) * node_count
+        lowlinks = array("q", bytes(8 * node_count))
+        on_stack = bytearray(node_count)
+        stack = array("i")
+        sccs = []
+        index = 0
+
+        for root in range(node_count):
+            if indices[root] != -1:
+                continue
+
+            call_stack = [(root, 0)]
+
+            while call_stack:
+                node, child_position = call_stack.pop()
+
+                if child_position == 0:
+                    indices[node] = index
+                    lowlinks[node] = index
+                    index += 1
+                    stack.append(node)
+                    on_stack[node] = 1
+
+                children = store.get_outgoing(node)
+                descended = False
+
+                while child_position < len(children):
+                    child = children[child_position]
+                    child_position += 1
+
+                    if indices[child] == -1:
+                        call_stack.append((node, child_position))
+                        call_stack.append((child, 0))
+                        descended = True
+                        break
+
+                    if on_stack[child]:
+                        lowlinks[node] = min(lowlinks[node], indices[child])
+
+                if descended:
+                    continue
+
+                if lowlinks[node] == indices[node]:
+                    scc = []
+
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        scc.append(store.get_page_id(member))
+
+                        if member == node:
+                            break
+
+                    sccs.append(scc)
+
+                if call_stack:
+                    parent = call_stack[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+
+        if verbose:
+            report_statement = '' \
+            f'Building components done, found {len(sccs)} components in {node_count} nodes'
+
+            print(report_statement)
+
+        return sccs
+
     def __strong_connect(self, node:TarjanNode, verbose:bool) -> None:
         """
         Recursive function using a depth search to traverse the graph and updating __lowlink of the nodes
@@ -0,0 +1,378 @@
+from array import array
+
+import mmap
+import struct
+
+
+class AdjacencyStore:
+    """
+    A class giving read access to a compact adjacency file of a whole link graph without loading it.
+    The file is mapped into memory and its arrays are read in place, so opening it is instant
+    and only the touched pages are ever read from disk.
+
+    Nodes are numbered by their position (index) in the file, ordered by page ID.
+    The file consists of a header and the following arrays, each padded to 8 bytes:
+    page IDs (int64, N), outgoing offsets (int64, N + 1), outgoing targets (int32, M),
+    incoming offsets (int64, N + 1), incoming sources (int32, M), title offsets (int64, N + 1),
+    the indices sorted by title (int32, N) and the UTF8 titles
+
+    Attributes:
+    -----------
+    __file : BinaryIO
+        The opened adjacency file
+
+    __map : mmap.mmap
+        The memory map of the file
+
+    __view : memoryview
+        The view on the whole memory map the arrays are cut from
+
+    __root_index : int
+        The index of the root article
+
+    __page_ids : memoryview
+        The page ID of every index, ascending
+
+    __out_offsets : memoryview
+        The start of the outgoing targets of every index, followed by the amount of edges
+
+    __out_targets : memoryview
+        The target indices of all edges, grouped by source
+
+    __in_offsets : memoryview
+        The start of the incoming sources of every index, followed by the amount of edges
+
+    __in_sources : memoryview
+        The source indices of all edges, grouped by target
+
+    __title_offsets : memoryview
+        The start of the title of every index in the title bytes, followed by their length
+
+    __title_order : memoryview
+        The indices sorted by the UTF8 bytes of their titles
+
+    __titles : memoryview
+        The UTF8 bytes of all titles
+
+    Methods:
+    --------
+    write(file_name : str, page_ids : array, titles : list[str], out_offsets : array, out_targets : array, root_index : int) -> None
+        Writes a graph into a new adjacency file
+
+    get_node_count() -> int
+        Returns the amount of nodes
+
+    get_edge_count() -> int
+        Returns the amount of edges
+
+    get_root_index() -> int
+        Returns the index of the root article
+
+    get_page_id(index : int) -> int
+        Returns the page ID of an index
+
+    get_title(index : int) -> str
+        Returns the title of an index
+
+    find_index(page_id : int) -> int | None
+        Returns the index of a page ID
+
+    find_title(title : str) -> int | None
+        Returns the index of a title
+
+    get_outgoing(index : int) -> memoryview
+        Returns the target indices of the edges leaving an index
+
+    get_incoming(index : int) -> memoryview
+        Returns the source indices of the edges reaching an index
+
+    get_out_degree(index : int) -> int
+        Returns the amount of edges leaving an index
+
+    get_in_degree(index : int) -> int
+        Returns the amount of edges reaching an index
+
+    close() -> None
+        Closes the file
+    """
+
+
+    __magic = b"WGADJ001"
+    __header = struct.Struct("<8sqqqq")
+
+
+    def __init__(self, file_name:str) -> None:
+        """
+        Opens the adjacency file and maps it into memory
+
+        Parameters:
+        -----------
+        file_name : str
+            The location of the adjacency file
+        """
+
+        self.__file = open(file_name, "rb")
+        self.__map:mmap.mmap = mmap.mmap(self.__file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        magic, node_count, edge_count, title_length, root_index = self.__header.unpack_from(self.__map, 0)
+
+        if magic != self.__magic:
+            self.__map.close()
+            self.__file.close()
+            raise ValueError(f"{file_name} is not an adjacency file")
+
+        self.__root_index:int = root_index
+        self.__view:memoryview = memoryview(self.__map)
+        position = self.__header.size
+        sections = []
+
+        for length, item_size, type_code in [
+            (node_count, 8, "q"), (node_count + 1, 8, "q"), (edge_count, 4, "i"), (node_count + 1, 8, "q"),
+            (edge_count, 4, "i"), (node_count + 1, 8, "q"), (node_count, 4, "i"), (title_length, 1, "B")
+        ]:
+            size = length * item_size
+            sections.append(self.__view[position:position + size].cast(type_code))
+            position += size + (-size % 8)
+
+        self.__page_ids:memoryview = sections[0]
+        self.__out_offsets:memoryview = sections[1]
+        self.__out_targets:memoryview = sections[2]
+        self.__in_offsets:memoryview = sections[3]
+        self.__in_sources:memoryview = sections[4]
+        self.__title_offsets:memoryview = sections[5]
+        self.__title_order:memoryview = sections[6]
+        self.__titles:memoryview = sections[7]
+        return None
+
+    @staticmethod
+    def write(file_name:str, page_ids:array, titles:list[str], out_offsets:array, out_targets:array, root_index:int) -> None:
+        """
+        Writes a graph into a new adjacency file. The incoming edges and the title order are derived from the given arrays
+
+        Parameters:
+        -----------
+        file_name : str
+            The location of the new file
+
+        page_ids : array
+            The ascending page IDs (int64) of all nodes
+
+        titles : list[str]
+            The title of every node
+
+        out_offsets : array
+            The start of the outgoing targets of every node (int64), followed by the amount of edges
+
+        out_targets : array
+            The target indices (int32) of all edges, grouped by source
+
+        root_index : int
+            The index of the root article
+        """
+
+        node_count = len(page_ids)
+        in_offsets = array("q", bytes(8 * (node_count + 1)))
+
+        for target in out_targets:
+            in_offsets[target + 1] += 1
+
+        for index in range(node_count):
+            in_offsets[index + 1] += in_offsets[index]
+
+        in_sources = array("i", bytes(4 * len(out_targets)))
+        fill = array("q", in_offsets[:node_count])
+
+        for source in range(node_count):
+            for position in range(out_offsets[source], out_offsets[source + 1]):
+                target = out_targets[position]
+                in_sources[fill[target]] = source
+                fill[target] += 1
+
+        encoded_titles = [title.encode("UTF8") for title in titles]
+        title_offsets = array("q", [0])
+
+        for encoded_title in encoded_titles:
+            title_offsets.append(title_offsets[-1] + len(encoded_title))
+
+        title_order = array("i", sorted(range(node_count), key = encoded_titles.__getitem__))
+
+        with open(file_name, "wb") as file:
+            file.write(AdjacencyStore.__header.pack(AdjacencyStore.__magic, node_count, len(out_targets), title_offsets[-1], root_index))
+
+            for section in [page_ids, out_offsets, out_targets, in_offsets, in_sources, title_offsets, title_order]:
+                data = section.tobytes()
+                file.write(data + bytes(-len(data) % 8))
+
+            for encoded_title in encoded_titles:
+                file.write(encoded_title)
+
+        return None
+
+    def get_node_count(self) -> int:
+        """
+        Returns the amount of nodes
+        """
+
+        return len(self.__page_ids)
+
+    def get_edge_count(self) -> int:
+        """
+        Returns the amount of edges
+        """
+
+        return len(self.__out_targets)
+
+    def get_root_index(self) -> int:
+        """
+        Returns the index of the root article
+        """
+
+        return self.__root_index
+
+    def get_page_id(self, index:int) -> int:
+        """
+        Returns the page ID of an index
+
+        Parameters:
+        -----------
+        index : int
+            The index of the node
+        """
+
+        return self.__page_ids[index]
+
+    def get_title(self, index:int) -> str:
+        """
+        Returns the title of an index
+
+        Parameters:
+        -----------
+        index : int
+            The index of the node
+        """
+
+        return bytes(self.__titles[self.__title_offsets[index]:self.__title_offsets[index + 1]]).decode("UTF8")
+
+    def find_index(self, page_id:int) -> int | None:
+        """
+        Returns the index of a page ID with a binary search or None if the page isn't in the graph
+
+        Parameters:
+        -----------
+        page_id : int
+            The page ID
+        """
+
+        low = 0
+        high = len(self.__page_ids)
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if self.__page_ids[middle] < page_id:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < len(self.__page_ids) and self.__page_ids[low] == page_id:
+            return low
+
+        return None
+
+    def find_title(self, title:str) -> int | None:
+        """
+        Returns the index of an exactly matching title with a binary search or None if no node has the title
+
+        Parameters:
+        -----------
+        title : str
+            The title
+        """
+
+        encoded_title = title.encode("UTF8")
+        low = 0
+        high = len(self.__title_order)
+
+        while low < high:
+            middle = (low + high) // 2
+            index = self.__title_order[middle]
+
+            if bytes(self.__titles[self.__title_offsets[index]:self.__title_offsets[index + 1]]) < encoded_title:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < len(self.__title_order) and self.get_title(self.__title_order[low]) == title:
+            return self.__title_order[low]
+
+        return None
+
+    def get_outgoing(self, index:int) -> memoryview:
+        """
+        Returns the target indices of the edges leaving an index
+
+        Parameters:
+        -----------
+        index : int
+            The index of the node
+        """
+
+        return self.__out_targets[self.__out_offsets[index]:self.__out_offsets[index + 1]]
+
+    def get_incoming(self, index:int) -> memoryview:
+        """
+        Returns the source indices of the edges reaching an index
+
+        Parameters:
+        -----------
+        index : int
+            The index of the node
+        """
+
+        return self.__in_sources[self.__in_offsets[index]:self.__in_offsets[index + 1]]
+
+    def get_out_degree(self, index:int) -> int:
+        """
+        Returns the amount of edges leaving an index
+
+        Parameters:
+        -----------
+        index : int
+            The index of the node
+        """
+
+        return self.__out_offsets[index + 1] - self.__out_offsets[index]
+
+    def get_in_degree(self, index:int) -> int:
+        """
+        Returns the amount of edges reaching an index
+
+        Parameters:
+        -----------
+        index : int
+            The index of the node
+        """
+
+        return self.__in_offsets[index + 1] - self.__in_offsets[index]
+
+    def close(self) -> None:
+        """
+        Closes the file
+        """
+
+        for section in [self.__page_ids, self.__out_offsets, self.__out_targets, self.__in_offsets,
+                        self.__in_sources, self.__title_offsets, self.__title_order, self.__titles, self.__view]:
+            section.release()
+
+        self.__map.close()
+        self.__file.close()
+        return None
+
+
+def main() -> int:
+    print("Calling main function in adjacency_store")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -51,6 +51,9 @@ class Graph:
 
     get_node_name(id : int) -> str
         Returns the name of the node with ID id
+
+    replace_outgoing_edges(node_id : int, end_ids : set[int]) -> tuple[int, int]
+        Replaces the outgoing edges of a node in place and returns the amount of added and removed edges
     """
 
 
@@ -212,6 +215,47 @@ class Graph:
             
         return None
 
+    def replace_outgoing_edges(self, node_id:int, end_ids:set[int]) -> tuple[int, int]:
+        """
+        Replaces the outgoing edges of the node which ID is node_id by edges toward the nodes with the IDs end_ids,
+        keeping the edges that stay. End IDs that aren't nodes of the graph are ignored.
+        Returns the amount of added and removed edges
+
+        Parameters:
+        -----------
+        node_id : int
+            The id of the node which outgoing edges are replaced
+
+        end_ids : set[int]
+            The ids of the nodes the node links to now
+        """
+
+        node = self.__nodes.get(node_id)
+        assert node
+
+        kept_end_ids = {end_id for end_id in end_ids if end_id in self.__nodes}
+        old_edges = {edge.get_end_id() : edge for edge in node.get_outgoing()}
+        removed = 0
+
+        for end_id, edge in old_edges.items():
+            if end_id in kept_end_ids:
+                continue
+
+            del self.__edges[(node_id, end_id)]
+            node.remove_outgoing(edge)
+            self.__nodes[end_id].remove_incoming(edge)
+            removed += 1
+
+        added_end_ids = kept_end_ids - old_edges.keys()
+
+        for end_id in added_end_ids:
+            new_edge = Edge(start_id = node_id, end_id = end_id)
+            self.__edges[(node_id, end_id)] = new_edge
+            node.add_outgoing(new_edge)
+            self.__nodes[end_id].add_incoming(new_edge)
+
+        return len(added_end_ids), removed
+
 
 def main() -> int:
     print("Calling main function in graph")
@@ -0,0 +1,246 @@
+from datastructures.graph.graph import Graph
+from datastructures.graph.node import Node
+from datastructures.graph.edge import Edge
+from datastructures.graph.adjacency_store import AdjacencyStore
+from datastructures.graph.title_index import TitleIndex
+
+from collections import OrderedDict
+
+
+class LazyGraph(Graph):
+    """
+    A graph backed by an adjacency file, answering the same calls as Graph without holding its nodes and edges.
+    Nodes are only created when asked for, together with their incoming and outgoing edges,
+    and the most recently used ones are kept. Articles from the link dumps carry no keywords and no depth
+
+    Attributes:
+    -----------
+    __store : AdjacencyStore
+        The opened adjacency file
+
+    __cached_nodes : OrderedDict[int, Node]
+        The recently created nodes by ID, ordered from least to most recently used
+
+    __cache_capacity : int
+        The maximum amount of created nodes that are kept
+
+    __title_index : TitleIndex
+        Brings names into the canonical form the titles of the adjacency file have
+
+    Methods:
+    --------
+    get_store() -> AdjacencyStore
+        Returns the adjacency file the graph reads from
+
+    get_nodes() -> set[Node]
+        Returns all nodes as a set. Creates every node, so only use this on graphs that fit into memory
+
+    get_edges() -> set[Edge]
+        Returns all edges as a set. Creates every edge, so only use this on graphs that fit into memory
+    """
+
+
+    def __init__(self, store:AdjacencyStore, cache_capacity:int = 65536) -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        store : AdjacencyStore
+            The opened adjacency file
+
+        cache_capacity : int
+            The maximum amount of created nodes that are kept
+        """
+
+        self.__store:AdjacencyStore = store
+        self.__cached_nodes:OrderedDict[int, Node] = OrderedDict()
+        self.__cache_capacity:int = cache_capacity
+        self.__title_index:TitleIndex = TitleIndex()
+        super().__init__(store.get_title(store.get_root_index()), set(), set())
+        return None
+
+    def get_store(self) -> AdjacencyStore:
+        """
+        Returns the adjacency file the graph reads from
+        """
+
+        return self.__store
+
+    def get_nodes(self) -> set[Node]:
+        """
+        Returns all nodes as a set. Creates every node, so only use this on graphs that fit into memory
+        """
+
+        return {self.__create_node(index) for index in range(self.__store.get_node_count())}
+
+    def get_edges(self) -> set[Edge]:
+        """
+        Returns all edges as a set. Creates every edge, so only use this on graphs that fit into memory
+        """
+
+        edges = set()
+
+        for index in range(self.__store.get_node_count()):
+            start_id = self.__store.get_page_id(index)
+
+            for target in self.__store.get_outgoing(index):
+                edges.add(Edge(start_id, self.__store.get_page_id(target)))
+
+        return edges
+
+    def get_density(self) -> float:
+        """
+        Calculates the density of the graph
+        """
+
+        node_count = self.__store.get_node_count()
+        return self.__store.get_edge_count() / (node_count * (node_count - 1))
+
+    def get_node_count(self) -> int:
+        """
+        Returns the amount of nodes in the graph
+        """
+
+        return self.__store.get_node_count()
+
+    def get_neighbours(self, node_id:int) -> list[Node | None]:
+        """
+        Returns all nodes that are directly connected to the node which ID is node_id
+
+        Parameters:
+        -----------
+        node_id : int
+            The id of the node wich neighbours are looked for
+        """
+
+        index = self.__store.find_index(node_id)
+
+        if index == None:
+            return []
+
+        neighbour_indices = set(self.__store.get_outgoing(index)) | set(self.__store.get_incoming(index))
+        return [self.__get_node(neighbour_index) for neighbour_index in neighbour_indices]
+
+    def get_node_with_highest_in(self) -> Node:
+        """
+        Returns the node with the highest amount of incoming edges
+        """
+
+        index = max(range(self.__store.get_node_count()), key = self.__store.get_in_degree)
+        return self.__get_node(index)
+
+    def get_node_with_highest_out(self) -> Node:
+        """
+        Returns the node with the highest amount of outgoing edges
+        """
+
+        index = max(range(self.__store.get_node_count()), key = self.__store.get_out_degree)
+        return self.__get_node(index)
+
+    def get_node_from_id(self, id:int) -> Node | None:
+        """
+        Returns the node which ID is id
+
+        Paramters:
+        ----------
+        id : int
+            The id of the node that is being looked for
+        """
+
+        index = self.__store.find_index(id)
+
+        if index == None:
+            return None
+
+        return self.__get_node(index)
+
+    def get_node_name(self, id:int) -> str | None:
+        """
+        Returns the name of the node which ID is id if it exists
+
+        Parameters:
+        -----------
+        id : int
+            The id of the node which name is being looked for
+        """
+
+        index = self.__store.find_index(id)
+
+        if index == None:
+            return None
+
+        return self.__store.get_title(index)
+
+    def get_node_id_from_name(self, name:str) -> int | None:
+        """
+        Returns the id of the node which name matches the provided if it exists.
+        The name may be given as in links (with underscores or percent encoded)
+
+        Parameters:
+        -----------
+        name : str
+            The name of the node which id is being looked for
+        """
+
+        index = self.__store.find_title(self.__title_index.canonicalize(name))
+
+        if index == None:
+            return None
+
+        return self.__store.get_page_id(index)
+
+    def __get_node(self, index:int) -> Node:
+        """
+        Returns the node of an index, from the kept nodes if it was created recently
+
+        Parameters:
+        -----------
+        index : int
+            The index of the node in the adjacency file
+        """
+
+        node_id = self.__store.get_page_id(index)
+        node = self.__cached_nodes.get(node_id)
+
+        if node:
+            self.__cached_nodes.move_to_end(node_id)
+            return node
+
+        node = self.__create_node(index)
+        self.__cached_nodes[node_id] = node
+
+        if len(self.__cached_nodes) > self.__cache_capacity:
+            self.__cached_nodes.popitem(last = False)
+
+        return node
+
+    def __create_node(self, index:int) -> Node:
+        """
+        Creates the node of an index together with its incoming and outgoing edges
+
+        Parameters:
+        -----------
+        index : int
+            The index of the node in the adjacency file
+        """
+
+        node_id = self.__store.get_page_id(index)
+        node = Node(id = node_id, name = self.__store.get_title(index), keywords = [], depth = 0)
+
+        for target in self.__store.get_outgoing(index):
+            node.add_outgoing(Edge(node_id, self.__store.get_page_id(target)))
+
+        for source in self.__store.get_incoming(index):
+            node.add_incoming(Edge(self.__store.get_page_id(source), node_id))
+
+        return node
+
+
+def main() -> int:
+    print("Calling main function in lazy_graph")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
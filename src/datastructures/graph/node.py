@@ -19,6 +19,9 @@ class Node:
     __depth : int
         The linking distance to the starting article
 
+    __revision : int
+        The revision ID of the article the keywords and outgoing edges were read from, 0 if unknown
+
     __in : dict[(int, int), Edge]
         Map from an ID tuple to the corresponsing edge object which lead to this node
 
@@ -39,6 +42,12 @@ class Node:
     get_keywords() -> list[str]
         Returns __keywords
 
+    get_revision() -> int
+        Returns __revision
+
+    update(keywords : list[str], revision : int) -> None
+        Replaces the keywords and the revision after the article changed
+
     get_incoming() -> list[Edge]
         Returns a list of all incoming Edges
 
@@ -50,10 +59,16 @@ class Node:
 
     add_outgoing(outgoing : Edge) -> None
         Adds the outgoing edge to __out
+
+    remove_incoming(incoming : Edge) -> None
+        Removes the incoming edge from __in
+
+    remove_outgoing(outgoing : Edge) -> None
+        Removes the outgoing edge from __out
     """
 
 
-    def __init__(self, id:int, name:str, keywords:list[str], depth:int) -> None:
+    def __init__(self, id:int, name:str, keywords:list[str], depth:int, revision:int = 0) -> None:
         """
         Sets up the node obejct
 
@@ -70,23 +85,27 @@ class Node:
         
         depth : int
             The linking distance to the starting article
+
+        revision : int
+            The revision ID of the article, 0 if unknown
         """
 
         self.__id:int = id
         self.__name:str = name
         self.__keywords:list[str] = keywords
         self.__depth:int = depth
+        self.__revision:int = revision
         self.__in:dict[tuple[int, int], Edge] = {}
         self.__out:dict[tuple[int, int], Edge] = {}
         return None
 
     def __hash__(self) -> int:
         """
-        Returns the hash of the node
+        Returns the hash of the node, which only depends on the ID like the equality,
+        so the node can be updated in place while it is part of a set
         """
 
-        self_content = (self.__id, self.__name, tuple(self.__keywords), self.__depth)
-        return hash(self_content)
+        return hash(self.__id)
     
     def __eq__(self, other) -> bool:
         """
@@ -136,6 +155,30 @@ class Node:
         """
 
         return self.__keywords
+
+    def get_revision(self) -> int:
+        """
+        Returns __revision
+        """
+
+        return self.__revision
+
+    def update(self, keywords:list[str], revision:int) -> None:
+        """
+        Replaces the keywords and the revision after the article changed
+
+        Parameters:
+        -----------
+        keywords : list[str]
+            The list of 10 keywords from the changed article
+
+        revision : int
+            The revision ID of the changed article
+        """
+
+        self.__keywords = keywords
+        self.__revision = revision
+        return None
     
     def get_incoming(self) -> list[Edge]:
         """
@@ -177,6 +220,32 @@ class Node:
         self.__out[(outgoing.get_start_id(), outgoing.get_end_id())] = outgoing
         return None
 
+    def remove_incoming(self, incoming:Edge) -> None:
+        """
+        Removes the edge incoming from __in if it is there
+
+        Parameters:
+        -----------
+        incoming : Edge
+            The edge to be removed from __in
+        """
+
+        self.__in.pop((incoming.get_start_id(), incoming.get_end_id()), None)
+        return None
+
+    def remove_outgoing(self, outgoing:Edge) -> None:
+        """
+        Removes the edge outgoing from __out if it is there
+
+        Parameters:
+        -----------
+        outgoing : Edge
+            The edge to be removed from __out
+        """
+
+        self.__out.pop((outgoing.get_start_id(), outgoing.get_end_id()), None)
+        return None
+
 
 def main() -> int:
     print("Calling main function in node")
@@ -0,0 +1,100 @@
+from urllib.parse import unquote
+
+
+class TitleIndex:
+    """
+    A class bringing article names into one canonical form, so an article is recognized however its name is written.
+    Links are percent encoded with underscores, the api returns display titles and users type names freely,
+    all of them are decoded, underscores and repeated whitespace are folded into single spaces,
+    sections are cut off and the first letter is upper case like wikipedia treats it.
+    Already computed forms are remembered, as the same links are seen in many articles
+
+    Attributes:
+    -----------
+    __canonical_titles : dict[str, str]
+        The canonical title of every name seen recently
+
+    __capacity : int
+        The maximum amount of remembered names before they are forgotten
+
+    __lookups : int
+        The amount of canonicalized names
+
+    __folded : int
+        The amount of distinct names that were not in canonical form
+
+    Methods:
+    --------
+    canonicalize(name : str) -> str
+        Returns the canonical title of a name
+
+    get_stats() -> dict[str, int]
+        Returns the amount of lookups, remembered names and names that were not in canonical form
+    """
+
+
+    def __init__(self, capacity:int = 1 << 18) -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        capacity : int
+            The maximum amount of remembered names before they are forgotten
+        """
+
+        self.__canonical_titles:dict[str, str] = {}
+        self.__capacity:int = capacity
+        self.__lookups:int = 0
+        self.__folded:int = 0
+        return None
+
+    def canonicalize(self, name:str) -> str:
+        """
+        Returns the canonical title of a name: percent decoded, without section, underscores as spaces,
+        no repeated whitespace and the first letter upper case
+
+        Parameters:
+        -----------
+        name : str
+            The name of the article as found in a link, returned by the api or typed by a user
+        """
+
+        self.__lookups += 1
+        canonical_title = self.__canonical_titles.get(name)
+
+        if canonical_title != None:
+            return canonical_title
+
+        title = unquote(name) if "%" in name else name
+        title = " ".join(title.split("#", 1)[0].replace("_", " ").split())
+        first_letter = title[:1].upper()
+
+        if len(first_letter) == 1:
+            title = first_letter + title[1:]
+
+        if len(self.__canonical_titles) >= self.__capacity:
+            self.__canonical_titles.clear()
+
+        self.__canonical_titles[name] = title
+
+        if title != name:
+            self.__folded += 1
+
+        return title
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the amount of lookups, remembered names and names that were not in canonical form
+        """
+
+        return {"lookups" : self.__lookups, "remembered" : len(self.__canonical_titles), "folded" : self.__folded}
+
+
+def main() -> int:
+    print("Calling main function in title_index")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,254 @@
+from logic.project_folder import get_project_folder
+
+from typing import Any
+
+import json
+import os
+import time
+
+
+class BuildJournal:
+    """
+    A class for the append-only journal of a graph build, so a crashed or interrupted build can be resumed.
+    Every change of the builder state (nodes, edges, other names, queue operations) is recorded as one compact json line.
+    The records are written in bulk at checkpoints, each followed by a checkpoint marker,
+    so a checkpoint only costs the changes since the last one and a torn write at a crash is ignored when loading
+
+    Attributes:
+    -----------
+    __file_name : str
+        The location of the journal file
+
+    __interval : int
+        The amount of added nodes after which a checkpoint is due
+
+    __max_seconds : float
+        The time in seconds after which a checkpoint is due even if fewer nodes were added
+
+    __records : list[str]
+        The encoded records since the last checkpoint
+
+    __nodes_since_checkpoint : int
+        The amount of nodes added since the last checkpoint
+
+    __last_checkpoint : float
+        The time of the last checkpoint
+
+    Methods:
+    --------
+    start(settings : dict[str, Any]) -> None
+        Starts a new journal with the settings of the build, replacing an existing one
+
+    record(*record : Any) -> None
+        Records a change of the builder state
+
+    is_due() -> bool
+        Returns if enough has changed since the last checkpoint to write the next one
+
+    checkpoint() -> None
+        Appends the records since the last checkpoint to the file, followed by a checkpoint marker
+
+    load() -> tuple[dict[str, Any], list[list]] | None
+        Returns the settings and the records up to the last checkpoint of an existing journal
+
+    load_settings() -> dict[str, Any] | None
+        Returns the settings of an existing journal without reading its records
+
+    get_file_name() -> str
+        Returns the location of the journal file
+    """
+
+
+    def __init__(self, file_name:str, interval:int = 100, max_seconds:float = 60.0) -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        file_name : str
+            The name of the journal. Names without folder are placed in the journals folder of the project
+
+        interval : int
+            The amount of added nodes after which a checkpoint is due
+
+        max_seconds : float
+            The time in seconds after which a checkpoint is due even if fewer nodes were added
+        """
+
+        if not os.path.dirname(file_name):
+            file_name = os.path.join(get_project_folder("journals"), file_name)
+
+        self.__file_name:str = file_name
+        self.__interval:int = interval
+        self.__max_seconds:float = max_seconds
+        self.__records:list[str] = []
+        self.__nodes_since_checkpoint:int = 0
+        self.__last_checkpoint:float = time.monotonic()
+        return None
+
+    def start(self, settings:dict[str, Any]) -> None:
+        """
+        Starts a new journal with the settings of the build as first line, replacing an existing journal of the same name
+
+        Parameters:
+        -----------
+        settings : dict[str, Any]
+            The settings needed to continue the build, like root, queue type, size and depth
+        """
+
+        with open(self.__file_name, "w", encoding = "UTF8") as file:
+            file.write(self.__encode(["B", settings]) + "\n")
+
+        self.__records = []
+        self.__nodes_since_checkpoint = 0
+        self.__last_checkpoint = time.monotonic()
+        return None
+
+    def record(self, *record:Any) -> None:
+        """
+        Records a change of the builder state. The first value names the kind of change, the others describe it
+
+        Parameters:
+        -----------
+        record : Any
+            The kind of change and its values, which have to be json serializable
+        """
+
+        self.__records.append(self.__encode(list(record)))
+
+        if record[0] == "N":
+            self.__nodes_since_checkpoint += 1
+
+        return None
+
+    def is_due(self) -> bool:
+        """
+        Returns if interval nodes were added or max_seconds passed since the last checkpoint
+        """
+
+        if not self.__records:
+            return False
+
+        return self.__nodes_since_checkpoint >= self.__interval or time.monotonic() - self.__last_checkpoint >= self.__max_seconds
+
+    def checkpoint(self) -> None:
+        """
+        Appends the records since the last checkpoint to the file with a single write, followed by a checkpoint marker,
+        and makes sure they reached the disk
+        """
+
+        if not self.__records:
+            return None
+
+        self.__records.append(self.__encode(["C"]))
+
+        with open(self.__file_name, "a", encoding = "UTF8") as file:
+            file.write("\n".join(self.__records) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+        self.__records = []
+        self.__nodes_since_checkpoint = 0
+        self.__last_checkpoint = time.monotonic()
+        return None
+
+    def load(self) -> tuple[dict[str, Any], list[list]] | None:
+        """
+        Returns the settings and the records up to the last complete checkpoint of the journal,
+        or None if the journal doesn't exist or doesn't start with settings
+        """
+
+        if not os.path.isfile(self.__file_name):
+            return None
+
+        settings = None
+        records:list[list] = []
+        pending_records:list[list] = []
+        torn = False
+
+        with open(self.__file_name, "r", encoding = "UTF8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    torn = True
+                    break
+
+                if settings == None:
+                    if record[0] != "B":
+                        return None
+
+                    settings = record[1]
+                elif record[0] == "C":
+                    records.extend(pending_records)
+                    pending_records = []
+                else:
+                    pending_records.append(record)
+
+        if settings == None:
+            return None
+
+        if pending_records or torn:
+            self.__truncate_to_checkpoint()
+
+        return settings, records
+
+    def load_settings(self) -> dict[str, Any] | None:
+        """
+        Returns the settings of the journal, or None if the journal doesn't exist or doesn't start with settings
+        """
+
+        if not os.path.isfile(self.__file_name):
+            return None
+
+        with open(self.__file_name, "r", encoding = "UTF8") as file:
+            try:
+                record = json.loads(file.readline())
+            except json.JSONDecodeError:
+                return None
+
+        if record[0] != "B":
+            return None
+
+        return record[1]
+
+    def get_file_name(self) -> str:
+        """
+        Returns the location of the journal file
+        """
+
+        return self.__file_name
+
+    def __truncate_to_checkpoint(self) -> None:
+        """
+        Cuts the records after the last checkpoint marker off the file, so the records appended after a resume follow a checkpoint
+        """
+
+        with open(self.__file_name, "rb+") as file:
+            content = file.read()
+            marker = self.__encode(["C"]).encode("UTF8") + b"\n"
+            checkpoint_end = content.rfind(marker)
+            file.truncate(checkpoint_end + len(marker) if checkpoint_end != -1 else content.find(b"\n") + 1)
+
+        return None
+
+    def __encode(self, record:list) -> str:
+        """
+        Encodes a record as compact json line
+
+        Parameters:
+        -----------
+        record : list
+            The record
+        """
+
+        return json.dumps(record, ensure_ascii = False, separators = (",", ":"))
+
+
+def main() -> int:
+    print("Calling main function in build_journal")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
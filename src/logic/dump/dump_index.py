@@ -0,0 +1,476 @@
+from datastructures.graph.title_index import TitleIndex
+
+from logic.fetch.article_extractor import ArticleExtractor
+from logic.project_folder import get_project_folder
+
+from typing import Any, Iterator
+from xml.etree.ElementTree import Element, iterparse
+
+import bz2
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class DumpIndex:
+    """
+    A class that reads a local Wikipedia XML dump (pages-articles.xml or pages-articles.xml.bz2) once as a stream
+    and keeps the sorted articles ({name, id, revision, keywords, links}) in a sqlite file next to the other caches,
+    so graphs can be built from it without any network access.
+    Only one page is held in memory at a time, the index is only rebuilt if the dump file changed
+
+    Attributes:
+    -----------
+    __dump_file : str
+        The location of the dump file
+
+    __connection : sqlite3.Connection
+        The connection to the index file
+
+    __lock : threading.Lock
+        Guards the connection, as the index is shared between threads
+
+    __namespaces : set[str]
+        The lower case names of all namespaces except the article namespace, read from the siteinfo of the dump
+
+    __link_pattern : re.Pattern
+        Matches the target of a wikilink
+
+    __markup_patterns : list[tuple[re.Pattern, str]]
+        The patterns and replacements that turn wikitext into plain text for the keyword search
+
+    __stats : dict[str, int]
+        Counters for found, missing and redirected lookups
+
+    __title_index : TitleIndex
+        Brings titles into the canonical form the index is keyed by
+
+    Methods:
+    --------
+    is_ingested() -> bool
+        Returns if the index was completely built from the current dump file
+
+    ingest(verbose : bool) -> bool
+        Streams the dump file into the index, returns if it succeeded
+
+    lookup(name : str) -> dict[str, Any] | None
+        Returns the sorted article for a name, following a redirect, or None if it isn't in the dump
+
+    get_stats() -> dict[str, int]
+        Returns the lookup statistics and the amount of indexed articles
+
+    close() -> None
+        Closes the index file
+    """
+
+
+    def __init__(self, dump_file:str, index_file:str | None = None) -> None:
+        """
+        Sets up the object and creates the index file if it doesn't exist
+
+        Parameters:
+        -----------
+        dump_file : str
+            The location of the pages-articles.xml(.bz2) dump file
+
+        index_file : str | None
+            The location of the index file. Defaults to a file named after the dump in the cache folder of the project
+        """
+
+        if not index_file:
+            dump_name = os.path.basename(dump_file).split(".xml")[0]
+            index_file = os.path.join(get_project_folder("cache"), f"{dump_name}.sqlite")
+
+        self.__dump_file:str = dump_file
+        self.__lock:threading.Lock = threading.Lock()
+        self.__connection:sqlite3.Connection = sqlite3.connect(index_file, check_same_thread = False)
+        self.__setup_tables()
+        self.__namespaces:set[str] = set()
+        self.__link_pattern:re.Pattern = re.compile(r'\[\[([^\[\]|\n]+)')
+        self.__markup_patterns:list[tuple[re.Pattern, str]] = [
+            (re.compile(r'<!--.*?-->|<ref[^>/]*/>|<ref[^>]*>.*?</ref>', re.DOTALL), " "),
+            (re.compile(r'\{\|.*?\|\}', re.DOTALL), " "),
+            (re.compile(r'\[\[(?:[^\[\]|]*\|)?([^\[\]]*)\]\]'), r"\1"),
+            (re.compile(r'<[^>]*>|&\w+;|\'{2,}|={2,}'), " ")
+        ]
+        self.__stats:dict[str, int] = {"found" : 0, "missing" : 0, "redirected" : 0}
+        self.__title_index:TitleIndex = TitleIndex(capacity = 4096)
+        return None
+
+    def is_ingested(self) -> bool:
+        """
+        Returns if the index was completely built from the dump file in its current state
+        """
+
+        if not os.path.isfile(self.__dump_file):
+            return False
+
+        with self.__lock:
+            row = self.__connection.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+
+        return bool(row) and row[0] == self.__describe_source()
+
+    def ingest(self, verbose:bool) -> bool:
+        """
+        Streams the dump file page by page into the index, replacing whatever was indexed before.
+        Returns False if the dump file can't be read
+
+        Parameters:
+        -----------
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        if not os.path.isfile(self.__dump_file):
+            failure_statement = '' \
+            f'Dump file \"{self.__dump_file}\" does not exist.\n' \
+            'Can\'t build the index'
+
+            print(failure_statement)
+            return False
+
+        start = time.perf_counter()
+        article_count = 0
+        redirect_count = 0
+        article_rows = []
+        redirect_rows = []
+
+        with self.__lock:
+            self.__connection.execute("DELETE FROM meta")
+            self.__connection.execute("DELETE FROM articles")
+            self.__connection.execute("DELETE FROM redirects")
+
+            try:
+                for title, page_id, revision, redirect, text in self.__read_pages():
+                    if redirect:
+                        redirect_rows.append((self.__title_index.canonicalize(title), self.__title_index.canonicalize(redirect)))
+                        redirect_count += 1
+                    else:
+                        record = self.__sort_page(title, page_id, revision, text)
+                        article_rows.append((self.__title_index.canonicalize(title), page_id, revision, self.__serialize(record)))
+                        article_count += 1
+
+                    if len(article_rows) + len(redirect_rows) >= 1000:
+                        self.__write_rows(article_rows, redirect_rows)
+
+                        if verbose:
+                            report_statement = '' \
+                            f'Indexed {article_count} articles and {redirect_count} redirects'
+
+                            print(report_statement)
+
+            except (OSError, EOFError, SyntaxError) as error:
+                failure_statement = '' \
+                f'Could not read dump file \"{self.__dump_file}\": {error}\n' \
+                'Can\'t build the index'
+
+                print(failure_statement)
+                return False
+
+            self.__write_rows(article_rows, redirect_rows)
+            self.__connection.execute("INSERT INTO meta (key, value) VALUES ('source', ?)", (self.__describe_source(),))
+            self.__connection.commit()
+
+        report_statement = '' \
+        f'Indexed {article_count} articles and {redirect_count} redirects from the dump in {time.perf_counter() - start:.1f}s'
+
+        print(report_statement)
+        return True
+
+    def lookup(self, name:str) -> dict[str, Any] | None:
+        """
+        Returns the sorted article for a name, following a redirect, or None if the dump doesn't contain it
+
+        Parameters:
+        -----------
+        name : str
+            The name of the article, in any form (e.g. as found in links)
+        """
+
+        title = self.__title_index.canonicalize(name)
+
+        with self.__lock:
+            row = self.__connection.execute("SELECT record FROM articles WHERE title = ?", (title,)).fetchone()
+
+            if not row:
+                target = self.__connection.execute("SELECT target FROM redirects WHERE title = ?", (title,)).fetchone()
+
+                if target:
+                    row = self.__connection.execute("SELECT record FROM articles WHERE title = ?", target).fetchone()
+                    self.__stats["redirected"] += 1 if row else 0
+
+            if not row:
+                self.__stats["missing"] += 1
+                return None
+
+            self.__stats["found"] += 1
+
+        return self.__deserialize(row[0])
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the lookup statistics of this session and the amount of indexed articles and redirects
+        """
+
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats["articles"] = self.__connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            stats["redirects"] = self.__connection.execute("SELECT COUNT(*) FROM redirects").fetchone()[0]
+
+        return stats
+
+    def close(self) -> None:
+        """
+        Closes the index file
+        """
+
+        with self.__lock:
+            self.__connection.close()
+
+        return None
+
+    def __read_pages(self) -> Iterator[tuple[str, int, int, str | None, str]]:
+        """
+        Streams the pages of the article namespace out of the dump as title, page ID, revision ID,
+        redirect target (or None) and wikitext. Every page element is cleared after it was read,
+        so the memory use doesn't grow with the size of the dump
+        """
+
+        opener = bz2.open if self.__dump_file.endswith(".bz2") else open
+
+        with opener(self.__dump_file, "rb") as dump:
+            events = iterparse(dump, events = ("start", "end"))
+            _, root = next(events)
+
+            for event, element in events:
+                if event != "end":
+                    continue
+
+                tag = element.tag.rsplit("}", 1)[-1]
+
+                if tag == "namespace" and element.get("key") != "0" and element.text:
+                    self.__namespaces.add(element.text.lower())
+
+                if tag != "page":
+                    continue
+
+                page = self.__read_page(element)
+                root.clear()
+
+                if page:
+                    yield page
+
+        return None
+
+    def __read_page(self, element:Element) -> tuple[str, int, int, str | None, str] | None:
+        """
+        Reads title, page ID, revision ID, redirect target and wikitext out of a page element.
+        Returns None for pages outside the article namespace
+
+        Parameters:
+        -----------
+        element : Element
+            The page element
+        """
+
+        fields:dict[str, Any] = {"redirect" : None}
+
+        for child in element.iter():
+            tag = child.tag.rsplit("}", 1)[-1]
+
+            match tag:
+                case "title" | "ns" | "text":
+                    fields[tag] = child.text or ""
+                case "id":
+                    fields.setdefault("id", int(child.text or 0))
+                case "revision":
+                    revision_id = child.find("{*}id")
+                    fields["revision"] = int(revision_id.text or 0) if revision_id is not None else 0
+                case "redirect":
+                    fields["redirect"] = child.get("title")
+
+        if fields.get("ns") != "0" or not fields.get("title"):
+            return None
+
+        return fields["title"], fields.get("id", 0), fields.get("revision", 0), fields["redirect"], fields.get("text", "")
+
+    def __sort_page(self, title:str, page_id:int, revision:int, text:str) -> dict[str, Any]:
+        """
+        Sorts the wikitext of a page into the same format as the sorter of the api
+
+        Parameters:
+        -----------
+        title : str
+            The title of the page
+
+        page_id : int
+            The ID of the page
+
+        revision : int
+            The revision ID of the page
+
+        text : str
+            The wikitext of the page
+        """
+
+        links = []
+
+        for target in self.__link_pattern.findall(text):
+            link = self.__to_link_name(target)
+
+            if link:
+                links.append(link)
+
+        plain_text = self.__strip_templates(text)
+
+        for pattern, replacement in self.__markup_patterns:
+            plain_text = pattern.sub(replacement, plain_text)
+
+        extractor = ArticleExtractor()
+        extractor.add_text(plain_text)
+
+        return {
+            "name" : title,
+            "id" : page_id,
+            "revision" : revision,
+            "keywords" : extractor.get_keywords(10),
+            "links" : list(dict.fromkeys(links))
+        }
+
+    def __strip_templates(self, text:str) -> str:
+        """
+        Removes templates ({{...}}) including nested ones from a wikitext
+
+        Parameters:
+        -----------
+        text : str
+            The wikitext
+        """
+
+        parts = []
+        depth = 0
+        position = 0
+
+        for brace in re.finditer(r'\{\{|\}\}', text):
+            if brace.group() == "{{":
+                if depth == 0:
+                    parts.append(text[position:brace.start()])
+                depth += 1
+            elif depth > 0:
+                depth -= 1
+                if depth == 0:
+                    position = brace.end()
+
+        if depth == 0:
+            parts.append(text[position:])
+
+        return " ".join(parts)
+
+    def __to_link_name(self, target:str) -> str | None:
+        """
+        Converts the target of a wikilink into its canonical title,
+        or returns None if it doesn't point to an article (other namespace, other language or only a section)
+
+        Parameters:
+        -----------
+        target : str
+            The target of the wikilink
+        """
+
+        target = target.split("#", 1)[0].lstrip(":").strip()
+        title = self.__title_index.canonicalize(target)
+
+        if not title:
+            return None
+
+        if ":" in target:
+            prefix = target.split(":", 1)[0].strip()
+
+            if prefix.lower() in self.__namespaces or re.fullmatch(r'[a-z]{2,3}(-[a-z]+)*', prefix):
+                return None
+
+        return title
+
+    def __write_rows(self, article_rows:list[tuple], redirect_rows:list[tuple]) -> None:
+        """
+        Writes the collected rows into the index and empties the lists. Expects the lock to be held.
+        The index only counts as ingested once the source is written into meta at the very end
+
+        Parameters:
+        -----------
+        article_rows : list[tuple]
+            The collected articles as title, page ID, revision and record
+
+        redirect_rows : list[tuple]
+            The collected redirects as title and target
+        """
+
+        self.__connection.executemany(
+            "INSERT OR REPLACE INTO articles (title, page_id, revision, record) VALUES (?, ?, ?, ?)", article_rows
+        )
+        self.__connection.executemany("INSERT OR REPLACE INTO redirects (title, target) VALUES (?, ?)", redirect_rows)
+        self.__connection.commit()
+        article_rows.clear()
+        redirect_rows.clear()
+        return None
+
+    def __describe_source(self) -> str:
+        """
+        Describes the dump file by location, size and modification time, to notice when it was replaced
+        """
+
+        status = os.stat(self.__dump_file)
+        return f"{os.path.realpath(self.__dump_file)}:{status.st_size}:{status.st_mtime_ns}"
+
+    def __serialize(self, record:dict[str, Any]) -> bytes:
+        """
+        Converts a record into its compact stored form
+
+        Parameters:
+        -----------
+        record : dict[str, Any]
+            The record
+        """
+
+        return zlib.compress(json.dumps(record, separators = (",", ":"), ensure_ascii = False).encode("UTF8"))
+
+    def __deserialize(self, data:bytes) -> dict[str, Any]:
+        """
+        Converts the compact stored form back into a record
+
+        Parameters:
+        -----------
+        data : bytes
+            The stored form
+        """
+
+        return json.loads(zlib.decompress(data).decode("UTF8"))
+
+    def __setup_tables(self) -> None:
+        """
+        Creates the tables of the index if they don't exist yet
+        """
+
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.execute("PRAGMA synchronous = NORMAL")
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            "title TEXT PRIMARY KEY, page_id INTEGER NOT NULL, revision INTEGER NOT NULL, record BLOB NOT NULL)"
+        )
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS redirects (title TEXT PRIMARY KEY, target TEXT NOT NULL)")
+        self.__connection.commit()
+        return None
+
+
+def main() -> int:
+    print("Calling main function in dump_index")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
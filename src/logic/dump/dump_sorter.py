@@ -0,0 +1,89 @@
+from logic.dump.dump_index import DumpIndex
+
+from typing import Any
+
+
+class DumpSorter:
+    """
+    A class that answers the same calls as the Sorter, but reads the sorted articles out of a local dump index
+    instead of requesting them, so a graph can be built without any network access
+
+    Attributes:
+    -----------
+    dump_index : DumpIndex
+        The index of the dump the articles are read from
+
+    Methods:
+    --------
+    get_content(name : str, verbose : bool) -> dict[str, Any] | None
+        Returns the sorted article named name or None if the dump doesn't contain it
+
+    get_contents(names : list[str], verbose : bool) -> dict[str, dict[str, Any] | None]
+        Returns the sorted articles for all names, None for those the dump doesn't contain
+    """
+
+
+    def __init__(self, dump_index:DumpIndex) -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        dump_index : DumpIndex
+            The index of the dump to read the articles from. Has to be ingested already
+        """
+
+        self.dump_index:DumpIndex = dump_index
+        return None
+
+    def get_content(self, name:str, verbose:bool) -> dict[str, Any] | None:
+        """
+        Returns the sorted article named name or None if the dump doesn't contain it
+
+        Parameters:
+        -----------
+        name : str
+            The name of the article, as found in links
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        sorted_entries = self.dump_index.lookup(name)
+
+        if verbose and sorted_entries:
+            report_statement = '' \
+            f'Read article {sorted_entries["name"]} from the dump'
+
+            print(report_statement)
+        elif verbose:
+            report_statement = '' \
+            f'Article {name} is not in the dump'
+
+            print(report_statement)
+
+        return sorted_entries
+
+    def get_contents(self, names:list[str], verbose:bool) -> dict[str, dict[str, Any] | None]:
+        """
+        Returns the sorted articles for all names, None for those the dump doesn't contain
+
+        Parameters:
+        -----------
+        names : list[str]
+            The names of the articles, as found in links
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        return {name : self.get_content(name, verbose) for name in names}
+
+
+def main() -> int:
+    print("Calling main function in dump_sorter")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
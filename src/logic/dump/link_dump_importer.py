@@ -0,0 +1,335 @@
+from datastructures.graph.adjacency_store import AdjacencyStore
+from datastructures.graph.title_index import TitleIndex
+
+from logic.dump.sql_dump_reader import SqlDumpReader
+
+from array import array
+
+import time
+
+
+class LinkDumpImporter:
+    """
+    A class that turns the page and pagelinks SQL dumps of a whole wiki into a compact adjacency file,
+    without a database and without fetching any article. The dumps are read as a stream,
+    only the titles, page IDs and the edges as two integer arrays are held in memory.
+
+    Newer pagelinks dumps only reference a link target ID, these need the linktarget dump to resolve titles.
+    If the redirect dump is given, links to redirects are resolved to the article they point to,
+    otherwise they are dropped
+
+    Attributes:
+    -----------
+    __page_file : str
+        The location of the page dump (page.sql.gz)
+
+    __pagelinks_file : str
+        The location of the pagelinks dump (pagelinks.sql.gz)
+
+    __linktarget_file : str | None
+        The location of the linktarget dump (linktarget.sql.gz), needed for pagelinks dumps without pl_title
+
+    __redirect_file : str | None
+        The location of the redirect dump (redirect.sql.gz)
+
+    Methods:
+    --------
+    import_links(adjacency_file : str, root : str | None, verbose : bool) -> bool
+        Reads the dumps and writes the adjacency file, returns if it succeeded
+    """
+
+
+    def __init__(self, page_file:str, pagelinks_file:str, linktarget_file:str | None = None, redirect_file:str | None = None) -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        page_file : str
+            The location of the page dump
+
+        pagelinks_file : str
+            The location of the pagelinks dump
+
+        linktarget_file : str | None
+            The location of the linktarget dump. Needed if the pagelinks dump has no pl_title column
+
+        redirect_file : str | None
+            The location of the redirect dump. Links to redirects are dropped if None is given
+        """
+
+        self.__page_file:str = page_file
+        self.__pagelinks_file:str = pagelinks_file
+        self.__linktarget_file:str | None = linktarget_file
+        self.__redirect_file:str | None = redirect_file
+        return None
+
+    def import_links(self, adjacency_file:str, root:str | None, verbose:bool) -> bool:
+        """
+        Reads all articles and their links to other articles out of the dumps and writes them as adjacency file.
+        Returns False if a dump can't be read
+
+        Parameters:
+        -----------
+        adjacency_file : str
+            The location of the adjacency file to write
+
+        root : str | None
+            The title of the article used as root of the graph. Defaults to the article with the most incoming links
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        start = time.perf_counter()
+
+        try:
+            page_ids, titles, title_indices, redirect_titles = self.__read_pages(verbose)
+
+            if self.__redirect_file:
+                self.__resolve_redirects(title_indices, redirect_titles, verbose)
+
+            sources, targets = self.__read_links(page_ids, title_indices, verbose)
+
+        except (OSError, EOFError, ValueError) as error:
+            failure_statement = '' \
+            f'Could not read the dumps: {error}\n' \
+            'Aborting import'
+
+            print(failure_statement)
+            return False
+
+        out_offsets, out_targets = self.__group_by_source(len(page_ids), sources, targets)
+        del sources, targets
+
+        root_index = title_indices.get(TitleIndex().canonicalize(root).replace(" ", "_")) if root else None
+
+        if root and root_index == None:
+            warning_statement = '' \
+            f'Root article \"{root}\" is not in the dump.\n' \
+            'Using the article with the most incoming links instead'
+
+            print(warning_statement)
+
+        if root_index == None:
+            root_index = self.__find_most_linked(len(page_ids), out_targets)
+
+        AdjacencyStore.write(adjacency_file, page_ids, titles, out_offsets, out_targets, root_index)
+
+        report_statement = '' \
+        f'Imported {len(page_ids)} articles and {len(out_targets)} links in {time.perf_counter() - start:.1f}s'
+
+        print(report_statement)
+        return True
+
+    def __read_pages(self, verbose:bool) -> tuple[array, list[str], dict[str, int], dict[int, str]]:
+        """
+        Reads the pages of the article namespace. Returns the ascending page IDs of all articles that aren't redirects,
+        their titles, the index of every article title and the titles of the redirects by page ID
+
+        Parameters:
+        -----------
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        articles = []
+        redirect_titles:dict[int, str] = {}
+        reader = SqlDumpReader(self.__page_file)
+
+        for page_id, namespace, title, is_redirect in reader.read_rows(["page_id", "page_namespace", "page_title", "page_is_redirect"]):
+            if namespace != 0:
+                continue
+
+            if is_redirect:
+                redirect_titles[page_id] = title
+            else:
+                articles.append((page_id, title))
+
+        articles.sort()
+        page_ids = array("q", [page_id for page_id, _ in articles])
+        titles = [title.replace("_", " ") for _, title in articles]
+        title_indices = {title : index for index, (_, title) in enumerate(articles)}
+
+        if verbose:
+            report_statement = '' \
+            f'Read {len(articles)} articles and {len(redirect_titles)} redirects from the page dump'
+
+            print(report_statement)
+
+        return page_ids, titles, title_indices, redirect_titles
+
+    def __resolve_redirects(self, title_indices:dict[str, int], redirect_titles:dict[int, str], verbose:bool) -> None:
+        """
+        Adds the titles of redirects to the title indices, pointing to the index of the article they redirect to
+
+        Parameters:
+        -----------
+        title_indices : dict[str, int]
+            The index of every article title, extended in place
+
+        redirect_titles : dict[int, str]
+            The titles of the redirects by page ID
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        assert self.__redirect_file
+        reader = SqlDumpReader(self.__redirect_file)
+        resolved = 0
+
+        for page_id, namespace, target in reader.read_rows(["rd_from", "rd_namespace", "rd_title"]):
+            redirect_title = redirect_titles.get(page_id)
+
+            if namespace != 0 or not redirect_title or target not in title_indices:
+                continue
+
+            title_indices[redirect_title] = title_indices[target]
+            resolved += 1
+
+        if verbose:
+            report_statement = '' \
+            f'Resolved {resolved} redirects to articles'
+
+            print(report_statement)
+
+        return None
+
+    def __read_links(self, page_ids:array, title_indices:dict[str, int], verbose:bool) -> tuple[array, array]:
+        """
+        Reads all links between articles as source and target indices
+
+        Parameters:
+        -----------
+        page_ids : array
+            The ascending page IDs of all articles
+
+        title_indices : dict[str, int]
+            The index of every article (and resolved redirect) title
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        page_indices = {page_id : index for index, page_id in enumerate(page_ids)}
+        sources = array("i")
+        targets = array("i")
+        reader = SqlDumpReader(self.__pagelinks_file)
+
+        if self.__linktarget_file:
+            target_indices = self.__read_link_targets(title_indices)
+            rows = ((page_id, target_indices.get(target_id)) for page_id, target_id in reader.read_rows(["pl_from", "pl_target_id"]))
+        else:
+            rows = (
+                (page_id, title_indices.get(title) if namespace == 0 else None)
+                for page_id, namespace, title in reader.read_rows(["pl_from", "pl_namespace", "pl_title"])
+            )
+
+        for row_count, (page_id, target) in enumerate(rows, 1):
+            source = page_indices.get(page_id)
+
+            if source != None and target != None and source != target:
+                sources.append(source)
+                targets.append(target)
+
+            if verbose and row_count % 1000000 == 0:
+                report_statement = '' \
+                f'Read {row_count} rows of the pagelinks dump, {len(sources)} links between articles'
+
+                print(report_statement)
+
+        return sources, targets
+
+    def __read_link_targets(self, title_indices:dict[str, int]) -> dict[int, int]:
+        """
+        Reads the link targets of the article namespace and returns the article index of every link target ID
+
+        Parameters:
+        -----------
+        title_indices : dict[str, int]
+            The index of every article (and resolved redirect) title
+        """
+
+        assert self.__linktarget_file
+        reader = SqlDumpReader(self.__linktarget_file)
+        target_indices:dict[int, int] = {}
+
+        for target_id, namespace, title in reader.read_rows(["lt_id", "lt_namespace", "lt_title"]):
+            index = title_indices.get(title) if namespace == 0 else None
+
+            if index != None:
+                target_indices[target_id] = index
+
+        return target_indices
+
+    def __group_by_source(self, node_count:int, sources:array, targets:array) -> tuple[array, array]:
+        """
+        Sorts the edges by source with a counting sort and removes duplicates
+        (e.g. a link to an article and to one of its redirects). Returns the offsets and the targets
+
+        Parameters:
+        -----------
+        node_count : int
+            The amount of articles
+
+        sources : array
+            The source index of every edge
+
+        targets : array
+            The target index of every edge
+        """
+
+        offsets = array("q", bytes(8 * (node_count + 1)))
+
+        for source in sources:
+            offsets[source + 1] += 1
+
+        for index in range(node_count):
+            offsets[index + 1] += offsets[index]
+
+        grouped = array("i", bytes(4 * len(targets)))
+        fill = array("q", offsets[:node_count])
+
+        for source, target in zip(sources, targets):
+            grouped[fill[source]] = target
+            fill[source] += 1
+
+        del fill
+        out_offsets = array("q", [0])
+        out_targets = array("i")
+
+        for index in range(node_count):
+            out_targets.extend(sorted(set(grouped[offsets[index]:offsets[index + 1]])))
+            out_offsets.append(len(out_targets))
+
+        return out_offsets, out_targets
+
+    def __find_most_linked(self, node_count:int, out_targets:array) -> int:
+        """
+        Returns the index of the article with the most incoming links
+
+        Parameters:
+        -----------
+        node_count : int
+            The amount of articles
+
+        out_targets : array
+            The target indices of all edges
+        """
+
+        in_degrees = array("q", bytes(8 * max(node_count, 1)))
+
+        for target in out_targets:
+            in_degrees[target] += 1
+
+        return max(range(len(in_degrees)), key = in_degrees.__getitem__)
+
+
+def main() -> int:
+    print("Calling main function in link_dump_importer")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
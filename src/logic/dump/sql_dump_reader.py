@@ -0,0 +1,170 @@
+from typing import Iterator
+
+import gzip
+import re
+
+
+class SqlDumpReader:
+    """
+    A class that reads the rows of a MySQL table dump (e.g. page.sql.gz or pagelinks.sql.gz) as a stream,
+    without loading it into a database. The column names are taken from the CREATE TABLE statement,
+    the rows from the INSERT statements, one statement at a time
+
+    Attributes:
+    -----------
+    __file_name : str
+        The location of the dump file, gzip compressed or plain
+
+    __row_pattern : re.Pattern
+        Matches one row tuple of an INSERT statement, including quoted strings that contain parentheses
+
+    __field_pattern : re.Pattern
+        Matches one field of a row that contains quoted strings
+
+    __escape_pattern : re.Pattern
+        Matches a backslash escape inside a quoted string
+
+    Methods:
+    --------
+    read_rows(columns : list[str]) -> Iterator[tuple]
+        Yields the values of the given columns for every row of the dump
+    """
+
+
+    def __init__(self, file_name:str) -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        file_name : str
+            The location of the dump file. Files ending with .gz are decompressed while reading
+        """
+
+        self.__file_name:str = file_name
+        self.__row_pattern:re.Pattern = re.compile(r"\(((?:'(?:[^'\\]|\\.)*'|[^'()])*)\)")
+        self.__field_pattern:re.Pattern = re.compile(r"'((?:[^'\\]|\\.)*)'|([^,]+)")
+        self.__escape_pattern:re.Pattern = re.compile(r"\\(.)")
+        return None
+
+    def read_rows(self, columns:list[str]) -> Iterator[tuple]:
+        """
+        Yields the values of the given columns for every row, in the order of the columns.
+        Numbers are converted to int, NULL to None and quoted strings are unescaped.
+        Raises a ValueError if the dump has no CREATE TABLE statement containing all columns
+
+        Parameters:
+        -----------
+        columns : list[str]
+            The names of the columns to read
+        """
+
+        opener = gzip.open if self.__file_name.endswith(".gz") else open
+        positions:list[int] | None = None
+        table_columns:list[str] = []
+
+        with opener(self.__file_name, "rt", encoding = "UTF8", errors = "replace") as dump:
+            for line in dump:
+                if positions == None:
+                    if line.startswith("  `"):
+                        table_columns.append(line.split("`", 2)[1])
+                    elif line.startswith(")") and table_columns:
+                        positions = self.__find_positions(table_columns, columns)
+                    continue
+
+                if not line.startswith("INSERT INTO"):
+                    continue
+
+                values = line[line.index(" VALUES ") + 8:]
+
+                for row in self.__row_pattern.findall(values):
+                    fields = self.__split_fields(row)
+                    yield tuple(fields[position] for position in positions)
+
+        if positions == None:
+            raise ValueError(f"{self.__file_name} contains no CREATE TABLE statement")
+
+        return None
+
+    def __find_positions(self, table_columns:list[str], columns:list[str]) -> list[int]:
+        """
+        Returns the positions of the wanted columns within the columns of the table
+
+        Parameters:
+        -----------
+        table_columns : list[str]
+            The columns of the table in the order of the CREATE TABLE statement
+
+        columns : list[str]
+            The columns to read
+        """
+
+        missing = [column for column in columns if column not in table_columns]
+
+        if missing:
+            raise ValueError(f"{self.__file_name} has no column {', '.join(missing)}")
+
+        return [table_columns.index(column) for column in columns]
+
+    def __split_fields(self, row:str) -> list[int | str | None]:
+        """
+        Splits a row tuple into its converted values
+
+        Parameters:
+        -----------
+        row : str
+            The content of a row tuple without the parentheses
+        """
+
+        if "'" not in row:
+            return [self.__convert(field) for field in row.split(",")]
+
+        fields:list[int | str | None] = []
+
+        for quoted, plain in self.__field_pattern.findall(row):
+            if plain:
+                fields.append(self.__convert(plain))
+            else:
+                fields.append(self.__escape_pattern.sub(self.__unescape, quoted))
+
+        return fields
+
+    def __convert(self, field:str) -> int | str | None:
+        """
+        Converts an unquoted field into an int, None for NULL or keeps it as string (e.g. for decimals)
+
+        Parameters:
+        -----------
+        field : str
+            The unquoted field
+        """
+
+        if field == "NULL":
+            return None
+
+        try:
+            return int(field)
+        except ValueError:
+            return field
+
+    def __unescape(self, escape:re.Match) -> str:
+        """
+        Returns the character a backslash escape stands for
+
+        Parameters:
+        -----------
+        escape : re.Match
+            The match of the escape
+        """
+
+        character = escape.group(1)
+        return {"n" : "\n", "r" : "\r", "t" : "\t", "0" : "\0", "Z" : "\x1a"}.get(character, character)
+
+
+def main() -> int:
+    print("Calling main function in sql_dump_reader")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,363 @@
+from collections import Counter
+
+import re
+
+
+class ArticleExtractor:
+    """
+    A class that walks the html of an article once, chunk by chunk, and collects the links to other articles
+    and the candidate keywords while tokenizing. Chunks can end anywhere, even inside a tag or a word,
+    so it can consume the text as it arrives (e.g. from iter_content)
+
+    Attributes:
+    -----------
+    __link_pattern : re.Pattern
+        Matches the target of a link to another article
+
+    __markup_pattern : re.Pattern
+        Matches a tag or an entity, which separate the words of the text
+
+    __skip_pattern : re.Pattern
+        Matches the start of a comment, script or style element whose content is skipped
+
+    __wikitext_patterns : list[tuple[re.Pattern, str]]
+        The markup of wikitext and its replacement, applied in order to reduce wikitext to its words
+
+    __blacklist : set[str]
+        Common filler words that are never keywords
+
+    __buffer : str
+        The received text that wasn't tokenized yet, because a token might continue in the next chunk
+
+    __skip_until : str | None
+        The end marker of a comment, script or style element the tokenizer is currently inside of
+
+    __links : list[str]
+        The found links to other articles, in order of appearance
+
+    __nominals : Counter[str]
+        The found keyword candidates and how often they appeared
+
+    __nominal_count : int
+        The amount of found nominals including filler words
+
+    Methods:
+    --------
+    feed(chunk : str) -> None
+        Tokenizes the next part of the html
+
+    add_text(text : str) -> None
+        Counts the keyword candidates of a plain text without any markup
+
+    add_wikitext(wikitext : str) -> None
+        Counts the keyword candidates of the wikitext of an article
+
+    close() -> None
+        Tokenizes the rest of the html after the last chunk
+
+    get_links() -> list[str]
+        Returns the found links to other articles
+
+    get_keywords(amount : int) -> list[str]
+        Returns the most frequent keywords
+
+    get_stats() -> tuple[int, int]
+        Returns the amount of found nominals and of those that are filler words
+    """
+
+
+    def __init__(self) -> None:
+        """
+        Sets up the object
+        """
+
+        self.__link_pattern:re.Pattern = re.compile(r'<a\s[^>]*?href="/wiki/([^"]*)"')
+        self.__markup_pattern:re.Pattern = re.compile(r'<[^>]*>|&#?\w+;')
+        self.__skip_pattern:re.Pattern = re.compile(r'<(?:!--|script\b|style\b)')
+        self.__wikitext_patterns:list[tuple[re.Pattern, str]] = [
+            (re.compile(r'<!--.*?-->|<ref[^>/]*/>|<ref[^>]*>.*?</ref>', re.DOTALL), " "),
+            (re.compile(r'\[\[(?:Datei|Bild|File|Image|Kategorie|Category):[^\[\]]*(?:\[\[[^\]]*\]\][^\[\]]*)*\]\]'), " "),
+            (re.compile(r'\[\[(?:[^\]|]*\|)?([^\]]*)\]\]'), r" \1 "),
+            (re.compile(r'\[https?://\S+\s*([^\]]*)\]'), r" \1 "),
+            (re.compile(r"(?=[<&'={|])(?:<[^>]*>|&#?\w+;|'{2,}|={2,}|\{\||\|\}|\|-)"), " "),
+            (re.compile(r'^[*#:;|!]+', re.MULTILINE), " ")
+        ]
+        self.__blacklist:set[str] = {
+            "Abschnitts", "Der", "Die", "Das", "Den", "Dem", "Des", "Ein", "Eine", "Einen", "Einem", "Eines", "Im", "In",
+            "Dies", "Diese", "Dieser", "Dieses", "Er", "Sie", "Es", "Man", "Bei"
+        }
+        self.__buffer:str = ""
+        self.__skip_until:str | None = None
+        self.__links:list[str] = []
+        self.__nominals:Counter[str] = Counter()
+        self.__nominal_count:int = 0
+        return None
+
+    def feed(self, chunk:str) -> None:
+        """
+        Tokenizes the next part of the html. A token cut off at the end of the chunk is kept until the next chunk
+
+        Parameters:
+        -----------
+        chunk : str
+            The next part of the html
+        """
+
+        self.__buffer += chunk
+        self.__consume(False)
+        return None
+
+    def add_text(self, text:str) -> None:
+        """
+        Counts the keyword candidates of a plain text that contains no markup
+
+        Parameters:
+        -----------
+        text : str
+            The plain text
+        """
+
+        self.__count_words(text.split())
+        return None
+
+    def add_wikitext(self, wikitext:str) -> None:
+        """
+        Counts the keyword candidates of the wikitext of an article. Templates, references, comments, files and categories
+        are left out like their rendered html is mostly left out of keywords, links count with their shown text
+
+        Parameters:
+        -----------
+        wikitext : str
+            The wikitext of the article
+        """
+
+        text = self.__remove_templates(wikitext)
+
+        for pattern, replacement in self.__wikitext_patterns:
+            text = pattern.sub(replacement, text)
+
+        self.__count_words(text.split())
+        return None
+
+    def close(self) -> None:
+        """
+        Tokenizes the rest of the html after the last chunk was fed
+        """
+
+        self.__consume(True)
+        return None
+
+    def get_links(self) -> list[str]:
+        """
+        Returns the found links to other articles, without section and without files or special pages
+        """
+
+        return self.__links
+
+    def get_keywords(self, amount:int) -> list[str]:
+        """
+        Returns the most frequent keywords
+
+        Parameters:
+        -----------
+        amount : int
+            The maximum amount of keywords to return
+        """
+
+        return [entry[0] for entry in self.__nominals.most_common(amount)]
+
+    def get_stats(self) -> tuple[int, int]:
+        """
+        Returns the amount of found nominals and how many of them were filler words
+        """
+
+        return self.__nominal_count, self.__nominal_count - self.__nominals.total()
+
+    def __consume(self, final:bool) -> None:
+        """
+        Tokenizes the buffer up to the last position where no token can be cut off
+        (or completely if final) and keeps the rest in the buffer
+
+        Parameters:
+        -----------
+        final : bool
+            If no further chunk will follow
+        """
+
+        buffer = self.__buffer
+        position = 0
+
+        if self.__skip_until:
+            position = self.__skip_element(buffer, position)
+
+            if self.__skip_until:
+                return None
+
+        limit = len(buffer) if final else self.__find_safe_limit(buffer)
+
+        while position < limit:
+            skipped = self.__skip_pattern.search(buffer, position, limit)
+            segment_end = skipped.start() if skipped else limit
+
+            self.__tokenize(buffer, position, segment_end)
+
+            if not skipped:
+                position = limit
+                break
+
+            position = self.__skip_element(buffer, skipped.start())
+
+            if self.__skip_until:
+                return None
+
+        self.__buffer = buffer[position:]
+        return None
+
+    def __tokenize(self, buffer:str, start:int, end:int) -> None:
+        """
+        Tokenizes a part of the buffer that contains no comment, script or style element
+        and collects its links and keyword candidates
+
+        Parameters:
+        -----------
+        buffer : str
+            The buffered html
+
+        start : int
+            The start of the part
+
+        end : int
+            The end of the part
+        """
+
+        for link in self.__link_pattern.findall(buffer, start, end):
+            self.__add_link(link)
+
+        self.__count_words(self.__markup_pattern.sub(" ", buffer[start:end]).split())
+        return None
+
+    def __skip_element(self, buffer:str, position:int) -> int:
+        """
+        Skips a comment, script or style element starting at or continuing from position.
+        If its end isn't in the buffer yet, the end marker is remembered and the buffer is emptied
+        except for a possible partial end marker. Returns the position after the element
+
+        Parameters:
+        -----------
+        buffer : str
+            The buffered html
+
+        position : int
+            The start of the element or the position to continue searching for its end from
+        """
+
+        if not self.__skip_until:
+            opening = buffer[position + 1:position + 7]
+            self.__skip_until = "-->" if opening.startswith("!--") else f"</{opening.rstrip(' >/').lower()}>"
+
+        end = buffer.find(self.__skip_until, position)
+
+        if end < 0:
+            self.__buffer = buffer[max(position, len(buffer) - len(self.__skip_until)):]
+            return len(buffer)
+
+        end += len(self.__skip_until)
+        self.__skip_until = None
+        return end
+
+    def __find_safe_limit(self, buffer:str) -> int:
+        """
+        Returns the position up to which the buffer can be tokenized without cutting off a tag or a word
+
+        Parameters:
+        -----------
+        buffer : str
+            The buffered html
+        """
+
+        last_open = buffer.rfind("<")
+        last_close = buffer.rfind(">")
+
+        if last_open > last_close:
+            return last_open
+
+        last_space = max(buffer.rfind(" "), buffer.rfind("\n"))
+        return max(last_close, last_space) + 1
+
+    def __add_link(self, target:str) -> None:
+        """
+        Adds a link target without its section, unless it points to a file or a special page
+
+        Parameters:
+        -----------
+        target : str
+            The link target after /wiki/
+        """
+
+        if "Datei:" in target or "Spezial:" in target:
+            return None
+
+        article = target.split("#", 1)[0]
+
+        if article:
+            self.__links.append(article)
+
+        return None
+
+    def __remove_templates(self, wikitext:str) -> str:
+        """
+        Returns the wikitext without templates and parser functions ({{...}}), including nested ones
+
+        Parameters:
+        -----------
+        wikitext : str
+            The wikitext
+        """
+
+        parts = []
+        depth = 0
+        position = 0
+
+        for bracket in re.finditer(r'\{\{|\}\}', wikitext):
+            if bracket.group() == "{{":
+                if depth == 0:
+                    parts.append(wikitext[position:bracket.start()])
+
+                depth += 1
+            elif depth > 0:
+                depth -= 1
+
+                if depth == 0:
+                    position = bracket.end()
+
+        if depth == 0:
+            parts.append(wikitext[position:])
+
+        return " ".join(parts)
+
+    def __count_words(self, words:list[str]) -> None:
+        """
+        Counts the words that are nominals (capitalized, alphabetic, longer than 2 after trimming punctuation)
+        and keeps those that aren't filler words as keyword candidates
+
+        Parameters:
+        -----------
+        words : list[str]
+            The words
+        """
+
+        cleaned_words = [word.rstrip(",.;") for word in words]
+        nominals = [word for word in cleaned_words if len(word) > 2 and word.isalpha() and word[0].isupper()]
+
+        self.__nominal_count += len(nominals)
+        self.__nominals.update([nominal for nominal in nominals if nominal not in self.__blacklist])
+        return None
+
+
+def main() -> int:
+    print("Calling main function in article_extractor")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,334 @@
+from datastructures.graph.title_index import TitleIndex
+from logic.project_folder import get_project_folder
+
+from collections import OrderedDict
+from typing import Any
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class ArticleStore:
+    """
+    A class for a persistent store of sorted articles ({name, id, revision, keywords, links}),
+    keyed by page ID and revision, with an in-memory least recently used tier in front of the sqlite file.
+    A title index remembers which revision was last seen for an article name, so fresh articles
+    can be returned without any request
+
+    Attributes:
+    -----------
+    __ttl : float
+        The time in seconds for which the title index is trusted without requesting the article again
+
+    __capacity : int
+        The maximum amount of records kept in memory
+
+    __records : OrderedDict[tuple[str, int, int], dict[str, Any]]
+        The in-memory tier of records by (kind, page ID, revision), ordered from least to most recently used
+
+    __titles : OrderedDict[str, tuple[int, int, float]]
+        The in-memory tier of the title index, mapping the key of a title to page ID, revision and the time it was seen
+
+    __connection : sqlite3.Connection
+        The connection to the store file
+
+    __lock : threading.Lock
+        Guards both tiers, as the store is shared between threads
+
+    __stats : dict[str, int]
+        Counters for memory hits, disk hits and misses
+
+    __title_index : TitleIndex
+        Brings the titles into the canonical form the title index is keyed by
+
+    Methods:
+    --------
+    lookup_title(kind : str, title : str) -> dict[str, Any] | None
+        Returns the record last seen for the title if it was seen within the ttl
+
+    lookup(kind : str, page_id : int, revision : int) -> dict[str, Any] | None
+        Returns the record of the given revision of a page if it was stored
+
+    store(kind : str, title : str, record : dict[str, Any]) -> None
+        Stores a record and remembers its revision for the title
+
+    get_stats() -> dict[str, int]
+        Returns the hit/miss statistics
+
+    close() -> None
+        Closes the store file
+    """
+
+
+    def __init__(self, file_name:str | None = None, ttl:float = 7 * 24 * 60 * 60, capacity:int = 4096) -> None:
+        """
+        Sets up the object and creates the store file if it doesn't exist
+
+        Parameters:
+        -----------
+        file_name : str | None
+            The location of the store file. Defaults to articles.sqlite in the cache folder of the project
+
+        ttl : float
+            The time in seconds for which the title index is trusted without requesting the article again
+
+        capacity : int
+            The maximum amount of records kept in memory
+        """
+
+        if not file_name:
+            file_name = os.path.join(get_project_folder("cache"), "articles.sqlite")
+
+        self.__ttl:float = ttl
+        self.__capacity:int = capacity
+        self.__records:OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+        self.__titles:OrderedDict[str, tuple[int, int, float]] = OrderedDict()
+        self.__lock:threading.Lock = threading.Lock()
+        self.__connection:sqlite3.Connection = sqlite3.connect(file_name, check_same_thread = False)
+        self.__setup_tables()
+        self.__stats:dict[str, int] = {"memory_hits" : 0, "disk_hits" : 0, "misses" : 0}
+        self.__title_index:TitleIndex = TitleIndex()
+        return None
+
+    def lookup_title(self, kind:str, title:str) -> dict[str, Any] | None:
+        """
+        Returns the record last stored for the title if that happened within the ttl, otherwise None
+
+        Parameters:
+        -----------
+        kind : str
+            The kind of request the record was sorted from (e.g. parse)
+
+        title : str
+            The title of the article, in any form
+        """
+
+        title_key = self.__make_title_key(kind, title)
+
+        with self.__lock:
+            seen = self.__titles.get(title_key)
+
+            if seen:
+                self.__titles.move_to_end(title_key)
+            else:
+                row = self.__connection.execute(
+                    "SELECT page_id, revision, seen_at FROM titles WHERE title = ?", (title_key,)
+                ).fetchone()
+                seen = tuple(row) if row else None
+
+                if seen:
+                    self.__remember_title(title_key, seen)
+
+        if not seen or time.time() - seen[2] >= self.__ttl:
+            return None
+
+        return self.lookup(kind, seen[0], seen[1])
+
+    def lookup(self, kind:str, page_id:int, revision:int) -> dict[str, Any] | None:
+        """
+        Returns the record of the given revision of a page or None if it wasn't stored
+
+        Parameters:
+        -----------
+        kind : str
+            The kind of request the record was sorted from (e.g. parse)
+
+        page_id : int
+            The ID of the page
+
+        revision : int
+            The revision ID of the page
+        """
+
+        key = (kind, page_id, revision)
+
+        with self.__lock:
+            record = self.__records.get(key)
+
+            if record:
+                self.__records.move_to_end(key)
+                self.__stats["memory_hits"] += 1
+                return dict(record)
+
+            row = self.__connection.execute(
+                "SELECT record FROM articles WHERE kind = ? AND page_id = ? AND revision = ?", key
+            ).fetchone()
+
+            if not row:
+                self.__stats["misses"] += 1
+                return None
+
+            record = self.__deserialize(row[0])
+            self.__remember_record(key, record)
+            self.__stats["disk_hits"] += 1
+
+        return dict(record)
+
+    def store(self, kind:str, title:str, record:dict[str, Any]) -> None:
+        """
+        Stores the record under its page ID and revision and remembers the revision for the title
+
+        Parameters:
+        -----------
+        kind : str
+            The kind of request the record was sorted from (e.g. parse)
+
+        title : str
+            The title the article was requested with, in any form
+
+        record : dict[str, Any]
+            The sorted article
+        """
+
+        key = (kind, record["id"], record["revision"])
+        title_key = self.__make_title_key(kind, title)
+        seen = (record["id"], record["revision"], time.time())
+
+        with self.__lock:
+            self.__remember_record(key, dict(record))
+            self.__remember_title(title_key, seen)
+
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO articles (kind, page_id, revision, record) VALUES (?, ?, ?, ?)",
+                key + (self.__serialize(record),)
+            )
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO titles (title, page_id, revision, seen_at) VALUES (?, ?, ?, ?)",
+                (title_key,) + seen
+            )
+            self.__connection.commit()
+
+        return None
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the hit/miss statistics of this session
+        """
+
+        with self.__lock:
+            return dict(self.__stats)
+
+    def close(self) -> None:
+        """
+        Closes the store file
+        """
+
+        with self.__lock:
+            self.__connection.close()
+
+        return None
+
+    def __remember_record(self, key:tuple[str, int, int], record:dict[str, Any]) -> None:
+        """
+        Puts a record into the in-memory tier and drops the least recently used one if the capacity is exceeded.
+        Expects the lock to be held
+
+        Parameters:
+        -----------
+        key : tuple[str, int, int]
+            The kind, page ID and revision of the record
+
+        record : dict[str, Any]
+            The record
+        """
+
+        self.__records[key] = record
+        self.__records.move_to_end(key)
+
+        if len(self.__records) > self.__capacity:
+            self.__records.popitem(last = False)
+
+        return None
+
+    def __remember_title(self, title_key:str, seen:tuple[int, int, float]) -> None:
+        """
+        Puts a title into the in-memory title index and drops the least recently used one if the capacity is exceeded.
+        Expects the lock to be held
+
+        Parameters:
+        -----------
+        title_key : str
+            The key of the title
+
+        seen : tuple[int, int, float]
+            The page ID, revision and the time the title was seen
+        """
+
+        self.__titles[title_key] = seen
+        self.__titles.move_to_end(title_key)
+
+        if len(self.__titles) > self.__capacity:
+            self.__titles.popitem(last = False)
+
+        return None
+
+    def __serialize(self, record:dict[str, Any]) -> bytes:
+        """
+        Converts a record into its compact stored form
+
+        Parameters:
+        -----------
+        record : dict[str, Any]
+            The record
+        """
+
+        return zlib.compress(json.dumps(record, separators = (",", ":"), ensure_ascii = False).encode("UTF8"))
+
+    def __deserialize(self, data:bytes) -> dict[str, Any]:
+        """
+        Converts the compact stored form back into a record
+
+        Parameters:
+        -----------
+        data : bytes
+            The stored form
+        """
+
+        return json.loads(zlib.decompress(data).decode("UTF8"))
+
+    def __make_title_key(self, kind:str, title:str) -> str:
+        """
+        Builds the key of the title index from the kind of request and the normalized title
+
+        Parameters:
+        -----------
+        kind : str
+            The kind of request
+
+        title : str
+            The title of the article, in any form
+        """
+
+        return f"{kind}:{self.__title_index.canonicalize(title)}"
+
+    def __setup_tables(self) -> None:
+        """
+        Creates the tables of the store if they don't exist yet
+        """
+
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.execute("PRAGMA synchronous = NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            "kind TEXT NOT NULL, page_id INTEGER NOT NULL, revision INTEGER NOT NULL, record BLOB NOT NULL, "
+            "PRIMARY KEY (kind, page_id, revision))"
+        )
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS titles ("
+            "title TEXT PRIMARY KEY, page_id INTEGER NOT NULL, revision INTEGER NOT NULL, seen_at REAL NOT NULL)"
+        )
+        self.__connection.commit()
+        return None
+
+
+def main() -> int:
+    print("Calling main function in article_store")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
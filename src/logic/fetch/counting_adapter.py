@@ -0,0 +1,99 @@
+from requests.adapters import HTTPAdapter
+from requests import PreparedRequest, Response
+from urllib3.connection import HTTPConnection
+
+from collections.abc import Mapping
+from weakref import WeakKeyDictionary
+
+import threading
+
+
+class CountingAdapter(HTTPAdapter):
+    """
+    A pooled transport adapter that counts how often each underlying connection is used,
+    so keep-alive reuse of the connections can be checked
+
+    Attributes:
+    -----------
+    __uses : list[int]
+        The amount of requests sent over each pooled connection, in the order the connections were first used
+
+    __positions : WeakKeyDictionary[HTTPConnection, int]
+        The position of the count of every open connection in __uses. Holds the connections weakly,
+        so a connection opened after another one was dropped gets a count of its own
+
+    __lock : threading.Lock
+        Guards __uses, as the adapter is shared between threads
+
+    Methods:
+    --------
+    send(request : PreparedRequest, stream : bool, timeout : float | tuple | None, verify : bool | str, cert : str | tuple | None, proxies : Mapping[str, str] | None) -> Response
+        Sends the request over a pooled connection and counts the use of that connection
+
+    get_connection_uses() -> list[int]
+        Returns the amount of requests per connection in the order the connections were opened
+    """
+
+
+    def __init__(self, pool_size:int) -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        pool_size : int
+            The amount of connections kept alive per host
+        """
+
+        HTTPAdapter.__init__(self, pool_connections = pool_size, pool_maxsize = pool_size)
+        self.__uses:list[int] = []
+        self.__positions:WeakKeyDictionary[HTTPConnection, int] = WeakKeyDictionary()
+        self.__lock:threading.Lock = threading.Lock()
+        return None
+
+    def send(self, request:PreparedRequest, stream:bool = False, timeout:None | float | tuple[float, float] | tuple[float, None] = None, verify:bool | str = True, cert:None | bytes | str | tuple[bytes | str, bytes | str] = None, proxies:Mapping[str, str] | None = None) -> Response:
+        """
+        Sends the request over a pooled connection and counts the use of that connection
+
+        Parameters:
+        -----------
+        request : PreparedRequest
+            The request to send
+
+        stream, timeout, verify, cert, proxies
+            Passed on to HTTPAdapter.send unchanged
+        """
+
+        response = HTTPAdapter.send(self, request, stream = stream, timeout = timeout, verify = verify, cert = cert, proxies = proxies)
+
+        connection = getattr(response.raw, "connection", None)
+        if connection is None:
+            return response
+
+        with self.__lock:
+            position = self.__positions.get(connection)
+
+            if position is None:
+                self.__positions[connection] = len(self.__uses)
+                self.__uses.append(1)
+            else:
+                self.__uses[position] += 1
+
+        return response
+
+    def get_connection_uses(self) -> list[int]:
+        """
+        Returns the amount of requests per connection in the order the connections were opened
+        """
+
+        with self.__lock:
+            return list(self.__uses)
+
+
+def main() -> int:
+    print("Calling main function in counting_adapter")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,132 @@
+from logic.fetch.article_extractor import ArticleExtractor
+
+from concurrent.futures import ProcessPoolExecutor
+
+import multiprocessing
+import threading
+
+
+def extract_article(article_text:str, keyword_count:int, chunk_size:int = 16384) -> tuple[list[str], list[str], tuple[int, int]]:
+    """
+    Walks the article html once, chunk by chunk, and returns its keywords, its links and the amount of found nominals
+    and filtered filler words. Kept at module level, so worker processes can run it
+
+    Parameters:
+    -----------
+    article_text : str
+        The article html
+
+    keyword_count : int
+        The amount of keywords to return
+
+    chunk_size : int
+        The amount of characters fed to the extractor at once
+    """
+
+    extractor = ArticleExtractor()
+
+    for chunk_start in range(0, len(article_text), chunk_size):
+        extractor.feed(article_text[chunk_start:chunk_start + chunk_size])
+
+    extractor.close()
+    return extractor.get_keywords(keyword_count), extractor.get_links(), extractor.get_stats()
+
+
+class ParsePool:
+    """
+    A class spreading the extraction of links and keywords from article html over several worker processes,
+    so sorting isn't limited to the one core the interpreter can use. Requests stay in the threads of the builder,
+    which share the connection pool, rate controller and caches, and wait for their article to be extracted in a worker.
+    Only the html is sent to a worker and only links, keywords and counts are sent back
+
+    Attributes:
+    -----------
+    __processes : int
+        The amount of worker processes
+
+    __executor : ProcessPoolExecutor
+        The worker processes the articles are extracted in
+
+    __lock : threading.Lock
+        Guards the statistics, as the pool is shared between the threads of the builder
+
+    __stats : dict[str, int]
+        Counters for extracted articles and the characters of html sent to the workers
+
+    Methods:
+    --------
+    extract(article_text : str, keyword_count : int) -> tuple[list[str], list[str], tuple[int, int]]
+        Returns keywords, links and counts of an article html, extracted in a worker process
+
+    get_stats() -> dict[str, int]
+        Returns the extraction statistics
+
+    close() -> None
+        Stops the worker processes
+    """
+
+
+    def __init__(self, processes:int) -> None:
+        """
+        Sets up the object and starts the worker processes.
+        Workers are spawned instead of forked, as forking a process with running threads can leave locks held in the child
+
+        Parameters:
+        -----------
+        processes : int
+            The amount of worker processes
+        """
+
+        self.__processes:int = processes
+        self.__executor:ProcessPoolExecutor = ProcessPoolExecutor(max_workers = processes, mp_context = multiprocessing.get_context("spawn"))
+        self.__lock:threading.Lock = threading.Lock()
+        self.__stats:dict[str, int] = {"processes" : processes, "extracted" : 0, "characters" : 0}
+        return None
+
+    def extract(self, article_text:str, keyword_count:int) -> tuple[list[str], list[str], tuple[int, int]]:
+        """
+        Returns the keywords, the links and the amount of found nominals and filtered filler words of an article html,
+        extracted in the next free worker process. Blocks the calling thread until the worker is done
+
+        Parameters:
+        -----------
+        article_text : str
+            The article html
+
+        keyword_count : int
+            The amount of keywords to return
+        """
+
+        future = self.__executor.submit(extract_article, article_text, keyword_count)
+        extracted = future.result()
+
+        with self.__lock:
+            self.__stats["extracted"] += 1
+            self.__stats["characters"] += len(article_text)
+
+        return extracted
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the amount of worker processes, extracted articles and characters of html sent to the workers
+        """
+
+        with self.__lock:
+            return dict(self.__stats)
+
+    def close(self) -> None:
+        """
+        Waits for the running extractions and stops the worker processes
+        """
+
+        self.__executor.shutdown(wait = True)
+        return None
+
+
+def main() -> int:
+    print("Calling main function in parse_pool")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
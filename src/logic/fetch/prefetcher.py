@@ -0,0 +1,174 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class Prefetcher:
+    """
+    A class fetching the articles that are likely to be taken from the queue next while the current one is integrated,
+    so the network isn't idle in between. The fetched results are kept in a bounded buffer: candidates that
+    fell back in the ranking stay there to be reused later, until the oldest of them are discarded to make room.
+    A discarded candidate whose fetch already started can't be stopped anymore, its request is counted as wasted.
+    The prefetch threads fetch silently, so their output doesn't interleave with the output of the build
+
+    Attributes:
+    -----------
+    __fetch : Callable[[str, bool], dict[str, Any] | None]
+        Fetches and sorts a single article by name, verbosely or not
+
+    __window : int
+        The maximum amount of candidates fetched ahead at the same time
+
+    __capacity : int
+        The maximum amount of fetched or fetching candidates kept in the buffer
+
+    __buffer : OrderedDict[str, Future]
+        The candidates fetched ahead by name, the oldest first
+
+    __executor : ThreadPoolExecutor
+        The threads the candidates are fetched in
+
+    __stats : dict[str, int]
+        Counters for prefetched candidates, taken articles that were or weren't prefetched, discarded candidates
+        and discarded candidates that were already fetched or being fetched
+
+    Methods:
+    --------
+    prefetch(names : list[str]) -> None
+        Starts fetching the given candidates that are not buffered yet
+
+    take(name : str, verbose : bool) -> dict[str, Any] | None
+        Returns the article from the buffer if it was prefetched, otherwise fetches it
+
+    get_stats() -> dict[str, int]
+        Returns the prefetch statistics
+
+    close() -> None
+        Cancels the outstanding prefetches and stops the threads
+    """
+
+
+    def __init__(self, fetch:Callable[[str, bool], dict[str, Any] | None], window:int, capacity:int | None = None) -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        fetch : Callable[[str, bool], dict[str, Any] | None]
+            Fetches and sorts a single article by name, verbosely or not. Called from the prefetch threads without verbose
+
+        window : int
+            The maximum amount of candidates fetched ahead at the same time
+
+        capacity : int | None
+            The maximum amount of candidates kept in the buffer. Defaults to twice the window
+        """
+
+        self.__fetch:Callable[[str, bool], dict[str, Any] | None] = fetch
+        self.__window:int = window
+        self.__capacity:int = capacity if capacity else 2 * window
+        self.__buffer:OrderedDict[str, Future] = OrderedDict()
+        self.__executor:ThreadPoolExecutor = ThreadPoolExecutor(max_workers = window)
+        self.__stats:dict[str, int] = {"prefetched" : 0, "hits" : 0, "misses" : 0, "discarded" : 0, "wasted" : 0}
+        return None
+
+    def prefetch(self, names:list[str]) -> None:
+        """
+        Starts fetching the first window candidates that are not buffered yet.
+        Buffered candidates that are still wanted are moved to the back, so they are discarded last
+
+        Parameters:
+        -----------
+        names : list[str]
+            The names of the candidates, the most likely next first
+        """
+
+        for name in names[:self.__window]:
+            if name in self.__buffer:
+                self.__buffer.move_to_end(name)
+                continue
+
+            self.__buffer[name] = self.__executor.submit(self.__fetch, name, False)
+            self.__stats["prefetched"] += 1
+
+        while len(self.__buffer) > self.__capacity:
+            _, future = self.__buffer.popitem(last = False)
+            self.__discard(future)
+
+        return None
+
+    def take(self, name:str, verbose:bool) -> dict[str, Any] | None:
+        """
+        Returns the article named name, waiting for its prefetch if it was started, otherwise fetching it right away
+
+        Parameters:
+        -----------
+        name : str
+            The name of the article
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        future = self.__buffer.pop(name, None)
+
+        if future and not future.cancelled():
+            self.__stats["hits"] += 1
+
+            if verbose:
+                report_statement = '' \
+                f'Took prefetched article {name}'
+
+                print(report_statement)
+
+            return future.result()
+
+        self.__stats["misses"] += 1
+        return self.__fetch(name, verbose)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the amount of prefetched candidates, taken articles that were (hits) or weren't (misses) prefetched,
+        prefetched candidates that were discarded before being taken and the discarded ones whose fetch had already started (wasted)
+        """
+
+        return dict(self.__stats)
+
+    def close(self) -> None:
+        """
+        Cancels the prefetches that didn't start yet, waits for the running ones and stops the threads
+        """
+
+        for future in self.__buffer.values():
+            self.__discard(future)
+
+        self.__buffer.clear()
+        self.__executor.shutdown(wait = True, cancel_futures = True)
+        return None
+
+    def __discard(self, future:Future) -> None:
+        """
+        Cancels the prefetch of a discarded candidate and counts it as wasted if its fetch already started,
+        as a running fetch can't be cancelled and sends its request anyway
+
+        Parameters:
+        -----------
+        future : Future
+            The prefetch of the discarded candidate
+        """
+
+        self.__stats["discarded"] += 1
+
+        if not future.cancel():
+            self.__stats["wasted"] += 1
+
+        return None
+
+
+def main() -> int:
+    print("Calling main function in prefetcher")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
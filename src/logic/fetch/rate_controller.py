@@ -0,0 +1,276 @@
+from collections import deque
+
+import threading
+import time
+
+
+class RateController:
+    """
+    A class adapting the amount of requests in flight and the request rate to the server
+    with additive increase and multiplicative decrease (AIMD).
+    Every successful request raises the limits a little, every throttled request halves them
+    and no request is started before a given Retry-After has passed
+
+    Attributes:
+    -----------
+    __limit : float
+        The current amount of requests allowed in flight
+
+    __max_limit : int
+        The upper bound of __limit
+
+    __rate : float
+        The current maximum of started requests per second
+
+    __min_rate : float
+        The lower bound of __rate
+
+    __max_rate : float
+        The upper bound of __rate
+
+    __rate_step : float
+        The amount of requests per second the rate grows per second of successful requests
+
+    __in_flight : int
+        The amount of requests currently in flight
+
+    __next_start : float
+        The earliest time the next request may start to keep the rate
+
+    __blocked_until : float
+        The earliest time any request may start after a Retry-After
+
+    __completions : deque[float]
+        The completion times of the successful requests within the throughput window
+
+    __throughput_window : float
+        The length in seconds of the window the throughput is measured over
+
+    __throttled : int
+        The amount of throttled requests
+
+    __condition : threading.Condition
+        Lets requests wait for a free slot
+
+    Methods:
+    --------
+    acquire() -> None
+        Blocks until a request may be started and takes a slot
+
+    release(throttled : bool, retry_after : float | None) -> None
+        Frees the slot of a finished request and adapts the limits to its outcome
+
+    get_throughput() -> float
+        Returns the successful requests per second over the recent window
+
+    get_stats() -> dict[str, float]
+        Returns the current limits, throughput and amount of throttled requests
+    """
+
+
+    def __init__(self, max_limit:int = 10, initial_limit:int | None = None, min_rate:float = 0.5, max_rate:float = 200.0, rate_step:float = 1.0) -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        max_limit : int
+            The maximum amount of requests in flight
+
+        initial_limit : int | None
+            The amount of requests in flight allowed at the start. Defaults to max_limit
+
+        min_rate : float
+            The lowest request rate per second the controller backs off to
+
+        max_rate : float
+            The highest request rate per second, also used at the start
+
+        rate_step : float
+            The amount of requests per second the rate grows per second of successful requests
+        """
+
+        self.__max_limit:int = max_limit
+        self.__limit:float = float(initial_limit if initial_limit else max_limit)
+        self.__rate:float = max_rate
+        self.__min_rate:float = min_rate
+        self.__max_rate:float = max_rate
+        self.__rate_step:float = rate_step
+        self.__in_flight:int = 0
+        self.__next_start:float = 0.0
+        self.__blocked_until:float = 0.0
+        self.__completions:deque[float] = deque()
+        self.__throughput_window:float = 10.0
+        self.__throttled:int = 0
+        self.__condition:threading.Condition = threading.Condition()
+        return None
+
+    def acquire(self) -> None:
+        """
+        Blocks until the amount of requests in flight, the request rate and any Retry-After allow
+        another request and takes a slot for it
+        """
+
+        with self.__condition:
+            while True:
+                now = time.monotonic()
+                wait_until = max(self.__blocked_until, self.__next_start)
+
+                if self.__in_flight < int(self.__limit) and now >= wait_until:
+                    break
+
+                timeout = wait_until - now if now < wait_until else None
+                self.__condition.wait(timeout)
+
+            self.__in_flight += 1
+            self.__next_start = now + 1 / self.__rate
+
+        return None
+
+    def release(self, throttled:bool, retry_after:float | None) -> None:
+        """
+        Frees the slot of a finished request. A successful request increases the limits additively,
+        a throttled one halves them and blocks new requests for retry_after seconds
+
+        Parameters:
+        -----------
+        throttled : bool
+            If the server answered that it is overloaded or rate limited, or the request timed out or lost its connection
+
+        retry_after : float | None
+            The seconds the server asked to wait before the next request
+        """
+
+        with self.__condition:
+            self.__in_flight -= 1
+            now = time.monotonic()
+
+            if throttled:
+                self.__decrease(now, retry_after)
+            else:
+                self.__increase(now)
+
+            self.__condition.notify_all()
+
+        return None
+
+    def get_throughput(self) -> float:
+        """
+        Returns the successful requests per second over the recent window
+        """
+
+        with self.__condition:
+            return self.__measure_throughput(time.monotonic())
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Returns the allowed requests in flight, the request rate,
+        the throughput and the amount of throttled requests
+        """
+
+        with self.__condition:
+            return {
+                "limit" : int(self.__limit),
+                "rate" : self.__rate,
+                "throughput" : self.__measure_throughput(time.monotonic()),
+                "throttled" : self.__throttled
+            }
+
+    def __increase(self, now:float) -> None:
+        """
+        Additive increase after a successful request: roughly one more request in flight per round of requests
+        and rate_step more requests per second per second. Expects the lock to be held
+
+        Parameters:
+        -----------
+        now : float
+            The current time
+        """
+
+        self.__completions.append(now)
+        self.__drop_old_completions(now)
+        self.__limit = min(self.__max_limit, self.__limit + 1 / self.__limit)
+
+        self.__rate = min(self.__max_rate, self.__rate + self.__rate_step / self.__rate)
+
+        return None
+
+    def __decrease(self, now:float, retry_after:float | None) -> None:
+        """
+        Multiplicative decrease after a throttled request: halves the requests in flight and the rate
+        and blocks new requests until the Retry-After has passed. Requests throttled while already waiting
+        belong to the same overload and don't decrease the limits again. Expects the lock to be held
+
+        Parameters:
+        -----------
+        now : float
+            The current time
+
+        retry_after : float | None
+            The seconds the server asked to wait
+        """
+
+        self.__throttled += 1
+
+        if now < self.__blocked_until:
+            self.__blocked_until = max(self.__blocked_until, now + retry_after) if retry_after else self.__blocked_until
+            return None
+
+        self.__limit = max(1.0, self.__limit / 2)
+
+        self.__rate = max(self.__min_rate, self.__rate / 2)
+
+        if retry_after:
+            self.__blocked_until = max(self.__blocked_until, now + retry_after)
+
+        warning_statement = '' \
+        f'Server is throttling or overloaded. Lowering to {int(self.__limit)} requests in flight and {self.__rate:.1f} requests per second'
+
+        if retry_after:
+            warning_statement += f', waiting {retry_after:.1f}s'
+
+        print(warning_statement)
+        return None
+
+    def __measure_throughput(self, now:float) -> float:
+        """
+        Drops completions older than the window and returns the successful requests per second. Expects the lock to be held
+
+        Parameters:
+        -----------
+        now : float
+            The current time
+        """
+
+        self.__drop_old_completions(now)
+
+        if not self.__completions:
+            return 0.0
+
+        elapsed = max(now - self.__completions[0], 1.0)
+        return len(self.__completions) / elapsed
+
+    def __drop_old_completions(self, now:float) -> None:
+        """
+        Drops completions older than the window, so the completions stay bounded by the requests of one window
+        even if the throughput is never read. Expects the lock to be held
+
+        Parameters:
+        -----------
+        now : float
+            The current time
+        """
+
+        while self.__completions and now - self.__completions[0] > self.__throughput_window:
+            self.__completions.popleft()
+
+        return None
+
+
+def main() -> int:
+    print("Calling main function in rate_controller")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
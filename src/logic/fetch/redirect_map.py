@@ -0,0 +1,228 @@
+from datastructures.graph.title_index import TitleIndex
+from logic.project_folder import get_project_folder
+
+from collections import OrderedDict
+
+import os
+import sqlite3
+import threading
+import time
+
+
+class RedirectMap:
+    """
+    A class for a persistent map of redirect titles to the title and page ID of the article they point to,
+    with an in-memory least recently used tier in front of the sqlite file.
+    It is filled in bulk from the redirects the api reports for batched queries and followed parse requests,
+    so links to redirects can be resolved before they are queued instead of spending a request on each
+
+    Attributes:
+    -----------
+    __ttl : float
+        The time in seconds for which a redirect is trusted
+
+    __capacity : int
+        The maximum amount of redirects kept in memory
+
+    __redirects : OrderedDict[str, tuple[str, int | None, float]]
+        The in-memory tier, mapping a canonical redirect title to its target title, page ID and the time it was seen
+
+    __non_redirects : set[str]
+        The canonical titles recently looked up without being a redirect, so they don't hit the file again
+
+    __connection : sqlite3.Connection
+        The connection to the map file
+
+    __lock : threading.Lock
+        Guards both tiers, as the map is shared between threads
+
+    __title_index : TitleIndex
+        Brings the titles into the canonical form the map is keyed by
+
+    __stats : dict[str, int]
+        Counters for resolved and unresolved lookups and stored redirects
+
+    Methods:
+    --------
+    resolve(title : str) -> tuple[str, int | None] | None
+        Returns the target title and page ID of a redirect or None if the title isn't a known redirect
+
+    store(redirects : list[tuple[str, str, int | None]]) -> None
+        Stores redirects with the title and page ID they point to
+
+    get_stats() -> dict[str, int]
+        Returns the lookup statistics
+
+    close() -> None
+        Closes the map file
+    """
+
+
+    def __init__(self, file_name:str | None = None, ttl:float = 30 * 24 * 60 * 60, capacity:int = 65536) -> None:
+        """
+        Sets up the object and creates the map file if it doesn't exist
+
+        Parameters:
+        -----------
+        file_name : str | None
+            The location of the map file. Defaults to redirects.sqlite in the cache folder of the project
+
+        ttl : float
+            The time in seconds for which a redirect is trusted, as redirects are rarely changed
+
+        capacity : int
+            The maximum amount of redirects kept in memory
+        """
+
+        if not file_name:
+            file_name = os.path.join(get_project_folder("cache"), "redirects.sqlite")
+
+        self.__ttl:float = ttl
+        self.__capacity:int = capacity
+        self.__redirects:OrderedDict[str, tuple[str, int | None, float]] = OrderedDict()
+        self.__non_redirects:set[str] = set()
+        self.__lock:threading.Lock = threading.Lock()
+        self.__connection:sqlite3.Connection = sqlite3.connect(file_name, check_same_thread = False)
+        self.__setup_tables()
+        self.__title_index:TitleIndex = TitleIndex()
+        self.__stats:dict[str, int] = {"resolved" : 0, "unresolved" : 0, "stored" : 0}
+        return None
+
+    def resolve(self, title:str) -> tuple[str, int | None] | None:
+        """
+        Returns the canonical title and page ID of the article a redirect points to,
+        or None if the title isn't a redirect seen within the ttl
+
+        Parameters:
+        -----------
+        title : str
+            The title of the redirect, in any form
+        """
+
+        key = self.__title_index.canonicalize(title)
+
+        with self.__lock:
+            if key in self.__non_redirects:
+                self.__stats["unresolved"] += 1
+                return None
+
+            redirect = self.__redirects.get(key)
+
+            if redirect:
+                self.__redirects.move_to_end(key)
+            else:
+                row = self.__connection.execute(
+                    "SELECT target, page_id, seen_at FROM redirects WHERE title = ?", (key,)
+                ).fetchone()
+                redirect = tuple(row) if row else None
+
+                if redirect:
+                    self.__remember(key, redirect)
+
+            if not redirect or time.time() - redirect[2] >= self.__ttl:
+                if len(self.__non_redirects) >= self.__capacity:
+                    self.__non_redirects.clear()
+
+                self.__non_redirects.add(key)
+                self.__stats["unresolved"] += 1
+                return None
+
+            self.__stats["resolved"] += 1
+
+        return redirect[0], redirect[1]
+
+    def store(self, redirects:list[tuple[str, str, int | None]]) -> None:
+        """
+        Stores redirects with the title and page ID they point to in a single transaction
+
+        Parameters:
+        -----------
+        redirects : list[tuple[str, str, int | None]]
+            The redirect title, the target title and the page ID of the target (None if unknown) of every redirect
+        """
+
+        seen_at = time.time()
+        rows = [
+            (self.__title_index.canonicalize(title), self.__title_index.canonicalize(target), page_id, seen_at)
+            for title, target, page_id in redirects
+        ]
+        rows = [row for row in rows if row[0] != row[1]]
+
+        if not rows:
+            return None
+
+        with self.__lock:
+            for row in rows:
+                self.__remember(row[0], row[1:])
+                self.__non_redirects.discard(row[0])
+
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO redirects (title, target, page_id, seen_at) VALUES (?, ?, ?, ?)", rows
+            )
+            self.__connection.commit()
+            self.__stats["stored"] += len(rows)
+
+        return None
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the amount of resolved and unresolved lookups and stored redirects of this session
+        """
+
+        with self.__lock:
+            return dict(self.__stats)
+
+    def close(self) -> None:
+        """
+        Closes the map file
+        """
+
+        with self.__lock:
+            self.__connection.close()
+
+        return None
+
+    def __remember(self, key:str, redirect:tuple) -> None:
+        """
+        Puts a redirect into the in-memory tier and drops the least recently used one if the capacity is exceeded.
+        Expects the lock to be held
+
+        Parameters:
+        -----------
+        key : str
+            The canonical title of the redirect
+
+        redirect : tuple
+            The target title, page ID and the time the redirect was seen
+        """
+
+        self.__redirects[key] = redirect
+        self.__redirects.move_to_end(key)
+
+        if len(self.__redirects) > self.__capacity:
+            self.__redirects.popitem(last = False)
+
+        return None
+
+    def __setup_tables(self) -> None:
+        """
+        Creates the table of the map if it doesn't exist yet
+        """
+
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.execute("PRAGMA synchronous = NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS redirects ("
+            "title TEXT PRIMARY KEY, target TEXT NOT NULL, page_id INTEGER, seen_at REAL NOT NULL)"
+        )
+        self.__connection.commit()
+        return None
+
+
+def main() -> int:
+    print("Calling main function in redirect_map")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
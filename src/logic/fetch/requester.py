@@ -1,60 +1,442 @@
+from logic.fetch.counting_adapter import CountingAdapter
+from logic.fetch.response_cache import ResponseCache
+from logic.fetch.rate_controller import RateController
+
+import json
 import requests
+import time
+from email.utils import parsedate_to_datetime
 
 
 class Requester:
     """
     A class to encapsulates methods to request content from the wikipedia api
 
+    Attributes:
+    -----------
+    __api_url : str
+        The address of the api endpoint
+
+    __timeout : tuple[float, float]
+        The connect and read timeout in seconds used for every request
+
+    __adapter : CountingAdapter
+        The pooled transport shared by all requests, counting connection reuse
+
+    __session : requests.Session
+        The keep-alive session all requests are sent through
+
+    __cache : ResponseCache | None
+        The persistent cache consulted before sending a request, if caching is used
+
+    __rate_controller : RateController
+        Adapts the requests in flight and the request rate to throttling by the server
+
+    __max_retries : int
+        The amount of times a throttled request is retried
+
+    __max_lag : int
+        The replication lag in seconds above which the api should refuse requests (maxlag)
+
     Methods:
     --------
-    request_content(articlename : str) -> dict
-        Fetches the wiki article which name is given by articlename if it exists and returns it's json content
+    request_content(articlename : str, revalidate : bool, profile : str) -> dict
+        Fetches the wiki article which name is given by articlename if it exists and returns it's json content,
+        either with the rendered html (full profile) or only with its links and wikitext (light profile)
+
+    request_batch_content(titles : list[str]) -> dict | None
+        Fetches links, page info and intro text of up to 50 articles in one query, following continuations
+
+    request_titles(titles : list[str]) -> dict | None
+        Resolves up to 50 titles to their pages in one query without content, following redirects
+
+    request_revisions(titles : list[str]) -> dict | None
+        Fetches the page ID and current revision ID of up to 50 articles in one query without content, following redirects
+
+    get_connection_stats() -> dict[str, int]
+        Returns counters about how often pooled connections were reused
+
+    get_connection_uses() -> list[int]
+        Returns the amount of requests sent over each opened connection
+
+    get_cache_stats() -> dict[str, int] | None
+        Returns the hit/miss statistics of the response cache if caching is used
+
+    get_rate_stats() -> dict[str, float]
+        Returns the current request limits, throughput and amount of throttled requests
+
+    close() -> None
+        Closes all pooled connections
     """
 
 
-    def __init__(self) -> None:
+    def __init__(self, pool_size:int = 10, timeout:tuple[float, float] = (3.05, 30.0), api_url:str = "https://de.wikipedia.org/w/api.php", cache:ResponseCache | None = None, rate_controller:RateController | None = None, max_retries:int = 8, max_lag:int = 5) -> None:
         """
         Setup of the object
+
+        Parameters:
+        -----------
+        pool_size : int
+            The amount of connections kept alive to the api host
+
+        timeout : tuple[float, float]
+            The connect and read timeout in seconds for each request
+
+        api_url : str
+            The address of the api endpoint
+
+        cache : ResponseCache | None
+            The persistent response cache to consult before sending requests. No caching if None is given
+
+        rate_controller : RateController | None
+            The controller adapting requests to throttling. A new one allowing pool_size requests in flight is created if None is given
+
+        max_retries : int
+            The amount of times a throttled request is retried
+
+        max_lag : int
+            The replication lag in seconds above which the api should refuse requests
         """
 
+        user_agent = "WikiGraphUniProject/0.1 (fae.koerper@uni-jena.de) bot"
+
+        self.__api_url:str = api_url
+        self.__timeout:tuple[float, float] = timeout
+        self.__adapter:CountingAdapter = CountingAdapter(pool_size)
+        self.__session:requests.Session = requests.Session()
+        self.__session.headers.update({
+            'User-Agent' : user_agent,
+            'Accept-Encoding' : 'gzip, deflate',
+            'Connection' : 'keep-alive'
+        })
+        self.__session.mount("https://", self.__adapter)
+        self.__session.mount("http://", self.__adapter)
+        self.__cache:ResponseCache | None = cache
+        self.__rate_controller:RateController = rate_controller if rate_controller else RateController(max_limit = pool_size)
+        self.__max_retries:int = max_retries
+        self.__max_lag:int = max_lag
         return None
     
-    def request_content(self, article_name:str) -> dict | None:
+    def request_content(self, article_name:str, revalidate:bool = False, profile:str = "full") -> dict | None:
         """
-        Fetches the article named articlename if it exisits and returns it's json content
+        Fetches the article named articlename if it exisits and returns it's json content.
+        The full profile asks for the rendered html, the light profile only for the links, display title, wikitext
+        and revision (formatversion 2), which is several times smaller and isn't rendered by the api
 
         Parameters:
         -----------
         article_name : str
             The name of the article to fetch
+
+        revalidate : bool
+            Should a cached response be revalidated with the api even if it is still fresh
+
+        profile : str
+            The fetch profile, full or light. The responses of both profiles are cached separately
         """
 
-        raw_response = self.__get_wikiapi_response(article_name)
+        assert profile in ["full", "light"]
+        kind = "parse" if profile == "full" else "parse-light"
+
+        if not self.__cache:
+            raw_response = self.__get_wikiapi_response(article_name, {}, profile)
+
+            if not raw_response:
+                return None
+            
+            return self.__get_content_from_response(raw_response)
+
+        cached = self.__cache.lookup(kind, article_name)
+
+        if cached and cached["fresh"] and not revalidate:
+            return json.loads(cached["body"])
+
+        validators = {}
+        if cached and cached["etag"]:
+            validators["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            validators["If-Modified-Since"] = cached["last_modified"]
+
+        raw_response = self.__get_wikiapi_response(article_name, validators, profile)
 
         if not raw_response:
             return None
-        
-        return self.__get_content_from_response(raw_response)
 
-    def __get_wikiapi_response(self, article_name:str) -> requests.Response | None:
+        if cached:
+            self.__cache.count_revalidation(raw_response.status_code == 304)
+
+        if cached and raw_response.status_code == 304:
+            self.__cache.refresh(kind, article_name)
+            return json.loads(cached["body"])
+
+        content = self.__get_content_from_response(raw_response)
+
+        if "error" not in content:
+            etag = raw_response.headers.get("ETag")
+            last_modified = raw_response.headers.get("Last-Modified")
+            self.__cache.store(kind, article_name, raw_response.content, etag, last_modified)
+
+        return content
+
+    def request_batch_content(self, titles:list[str], revalidate:bool = False) -> dict | None:
+        """
+        Fetches the links, page info and plain intro text of up to 50 articles with a single query.
+        Continuations (plcontinue, excontinue) are followed until every page is complete and redirects are followed.
+        Pages that are fresh in the response cache are not requested again.
+        Returns the merged pages by title, the title normalizations the api applied and the followed redirects
+
+        Parameters:
+        -----------
+        titles : list[str]
+            The decoded titles of the articles to fetch
+
+        revalidate : bool
+            Should the articles be requested even if their cached responses are still fresh
+        """
+
+        assert len(titles) <= 50
+
+        pages:dict[str, dict] = {}
+        normalized:dict[str, str] = {}
+        redirects:dict[str, str] = {}
+        uncached_titles = []
+
+        for title in titles:
+            cached = self.__cache.lookup("query", title) if self.__cache and not revalidate else None
+
+            if not (cached and cached["fresh"]):
+                uncached_titles.append(title)
+                continue
+
+            page = json.loads(cached["body"])
+            pages[page["title"]] = page
+            if page["title"] != title:
+                redirects[title] = page["title"]
+
+        if not uncached_titles:
+            return {"pages" : pages, "normalized" : normalized, "redirects" : redirects}
+
+        query_parameters = {
+            "action" : "query",
+            "format" : "json",
+            "formatversion" : "2",
+            "prop" : "links|info|extracts",
+            "titles" : "|".join(uncached_titles),
+            "pllimit" : "max",
+            "plnamespace" : "0",
+            "exintro" : "1",
+            "explaintext" : "1",
+            "exlimit" : "max",
+            "redirects" : "1",
+            "maxlag" : str(self.__max_lag)
+        }
+
+        fetched = self.__query_batch(query_parameters)
+
+        if not fetched:
+            return None
+
+        for page in fetched["pages"].values():
+            if self.__cache and not (page.get("missing") or page.get("invalid")):
+                self.__cache.store("query", page["title"], json.dumps(page).encode(), None, None)
+
+        for redirect_title, target_title in fetched["redirects"].items():
+            page = fetched["pages"].get(target_title)
+
+            if self.__cache and page and not (page.get("missing") or page.get("invalid")):
+                self.__cache.store("query", redirect_title, json.dumps(page).encode(), None, None)
+
+        pages.update(fetched["pages"])
+        normalized.update(fetched["normalized"])
+        redirects.update(fetched["redirects"])
+
+        return {"pages" : pages, "normalized" : normalized, "redirects" : redirects}
+
+    def request_titles(self, titles:list[str]) -> dict | None:
+        """
+        Resolves up to 50 titles with a single query that asks for no page content, following redirects.
+        The pages tell whether a title exists, which namespace it belongs to and its page ID.
+        Returns the pages by title, the title normalizations the api applied and the followed redirects
+
+        Parameters:
+        -----------
+        titles : list[str]
+            The decoded titles to resolve
+        """
+
+        assert len(titles) <= 50
+
+        query_parameters = {
+            "action" : "query",
+            "format" : "json",
+            "formatversion" : "2",
+            "titles" : "|".join(titles),
+            "redirects" : "1",
+            "maxlag" : str(self.__max_lag)
+        }
+
+        return self.__query_batch(query_parameters)
+
+    def request_revisions(self, titles:list[str]) -> dict | None:
+        """
+        Fetches the page info of up to 50 articles with a single query that asks for no page content, following redirects.
+        The pages tell the page ID and the ID of the current revision (lastrevid), so changed articles can be found
+        without requesting their content. The response cache isn't used, as the current revisions are asked for.
+        Returns the pages by title, the title normalizations the api applied and the followed redirects
+
+        Parameters:
+        -----------
+        titles : list[str]
+            The decoded titles of the articles
+        """
+
+        assert len(titles) <= 50
+
+        query_parameters = {
+            "action" : "query",
+            "format" : "json",
+            "formatversion" : "2",
+            "prop" : "info",
+            "titles" : "|".join(titles),
+            "redirects" : "1",
+            "maxlag" : str(self.__max_lag)
+        }
+
+        return self.__query_batch(query_parameters)
+
+    def __query_batch(self, query_parameters:dict[str, str]) -> dict | None:
+        """
+        Sends a batched query and follows its continuations
+
+        Parameters:
+        -----------
+        query_parameters : dict[str, str]
+            The parameters of the query, including the titles
+        """
+
+        pages:dict[str, dict] = {}
+        normalized:dict[str, str] = {}
+        redirects:dict[str, str] = {}
+        continuation:dict[str, str] = {}
+
+        while True:
+            raw_response = self.__get_query_response(query_parameters | continuation)
+
+            if not raw_response:
+                return None
+
+            response_json = self.__get_content_from_response(raw_response)
+            query = response_json.get("query", {})
+
+            for normalization in query.get("normalized", []):
+                normalized[normalization["from"]] = normalization["to"]
+
+            for redirect in query.get("redirects", []):
+                redirects[redirect["from"]] = redirect["to"]
+
+            for page in query.get("pages", []):
+                self.__merge_page(pages, page)
+
+            next_continuation:dict[str, str] | None = response_json.get("continue")
+            if not next_continuation:
+                break
+
+            continuation = next_continuation
+
+        return {"pages" : pages, "normalized" : normalized, "redirects" : redirects}
+
+    def __merge_page(self, pages:dict[str, dict], page:dict) -> None:
         """
-        Requests the json content of a wikipage and asserts that it exists
+        Merges a partial page of a continued query into the already received pages
+
+        Parameters:
+        -----------
+        pages : dict[str, dict]
+            The received pages by title
+
+        page : dict
+            The partial page to merge
+        """
+
+        title = page.get("title")
+        assert title
+
+        known_page = pages.get(title)
+        if not known_page:
+            pages[title] = page
+            return None
+
+        known_links = known_page.get("links", [])
+        known_links.extend(page.get("links", []))
+
+        known_page.update(page)
+        known_page["links"] = known_links
+
+        return None
+
+    def __get_query_response(self, query_parameters:dict[str, str]) -> requests.Response | None:
+        """
+        Sends a query to the api and asserts that it succeeded
+
+        Parameters:
+        -----------
+        query_parameters : dict[str, str]
+            The parameters of the query
+        """
+
+        response = self.__send(self.__api_url, query_parameters, {})
+
+        if response is None:
+            return None
+
+        response_code = response.status_code
+        if response_code != 200:
+            request_failure_statement = '' \
+            f'Status code is {response_code} not 200'
+
+            print(request_failure_statement)
+            return None
+
+        return response
+
+    def __get_wikiapi_response(self, article_name:str, validators:dict[str, str], profile:str) -> requests.Response | None:
+        """
+        Requests the json content of a wikipage and asserts that it exists.
+        If validators are given the request is conditional and may also be answered with 304 (not modified)
 
         Parameters:
         -----------
         article_name : str
             The name of the article
+
+        validators : dict[str, str]
+            The If-None-Match / If-Modified-Since headers of a cached response
+
+        profile : str
+            The fetch profile, full for the rendered html or light for links and wikitext only
         """
 
-        user_agent = "WikiGraphUniProject/0.1 (fae.koerper@uni-jena.de) bot"
-        headers = {'User-Agent' : user_agent}
+        parse_parameters = {
+            "action" : "parse",
+            "format" : "json",
+            "maxlag" : str(self.__max_lag),
+            "redirects" : "1",
+            "page" : article_name
+        }
+
+        if profile == "light":
+            parse_parameters["prop"] = "links|displaytitle|wikitext|revid"
+            parse_parameters["formatversion"] = "2"
 
-        wiki_api_domain = "https://de.wikipedia.org/w/api.php?action=parse&format=json&page="
-        full_link = wiki_api_domain + article_name
+        response = self.__send(self.__api_url, parse_parameters, validators)
 
-        response = requests.get(url = full_link, headers = headers)
+        if response is None:
+            return None
 
         response_code = response.status_code
+        if response_code == 304 and validators:
+            return response
+
         if response_code != 200:
             request_failure_statement = '' \
             f'Status code is {response_code} not 200'
@@ -64,6 +446,90 @@ class Requester:
 
         return response
 
+    def __send(self, url:str, parameters:dict[str, str], headers:dict[str, str]) -> requests.Response | None:
+        """
+        Sends a request through the rate controller. Throttled requests (429, 503 or a maxlag error)
+        are retried after the Retry-After the server asked for, up to __max_retries times.
+        Timeouts and reset or refused connections are a sign of an overloaded server as well, so they lower the limits
+        of the rate controller like a throttled request and are retried after a backoff that doubles with every attempt.
+        Returns None if the request failed or stayed throttled after all retries
+
+        Parameters:
+        -----------
+        url : str
+            The address to request
+
+        parameters : dict[str, str]
+            The query parameters to add to the address
+
+        headers : dict[str, str]
+            Additional headers of the request
+        """
+
+        request_failure_statement = '' \
+        f'Request stayed throttled after {self.__max_retries} retries'
+
+        for attempt in range(self.__max_retries + 1):
+            self.__rate_controller.acquire()
+
+            try:
+                response = self.__session.get(url = url, params = parameters, headers = headers, timeout = self.__timeout)
+
+            except (requests.Timeout, requests.ConnectionError) as e:
+                self.__rate_controller.release(True, min(2.0 ** attempt, 30.0))
+
+                request_failure_statement = '' \
+                f'Request failed after {self.__max_retries} retries: {e}'
+
+                continue
+
+            except requests.RequestException as e:
+                self.__rate_controller.release(False, None)
+
+                request_failure_statement = '' \
+                f'Request failed: {e}'
+
+                print(request_failure_statement)
+                return None
+
+            throttled = response.status_code in [429, 503] or response.headers.get("MediaWiki-API-Error") == "maxlag"
+            self.__rate_controller.release(throttled, self.__get_retry_after(response) if throttled else None)
+
+            if not throttled:
+                return response
+
+            request_failure_statement = '' \
+            f'Request stayed throttled after {self.__max_retries} retries'
+
+        print(request_failure_statement)
+        return None
+
+    def __get_retry_after(self, response:requests.Response) -> float:
+        """
+        Reads the seconds to wait from the Retry-After header of a throttled response, given as seconds or as a date.
+        Defaults to one second
+
+        Parameters:
+        -----------
+        response : requests.Response
+            The throttled response
+        """
+
+        retry_after = response.headers.get("Retry-After")
+
+        if not retry_after:
+            return 1.0
+
+        if retry_after.strip().isdigit():
+            return float(retry_after)
+
+        try:
+            retry_date = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return 1.0
+
+        return max(0.0, retry_date.timestamp() - time.time())
+
     def __get_content_from_response(self, response:requests.Response) -> dict:
         """
         Extracts the json content in form of a dict from the response object
@@ -76,6 +542,53 @@ class Requester:
         
         return response.json()
 
+    def get_connection_stats(self) -> dict[str, int]:
+        """
+        Returns the amount of requests, opened connections and requests that reused an already open connection
+        """
+
+        uses = self.__adapter.get_connection_uses()
+        request_count = sum(uses)
+        connection_count = len(uses)
+
+        return {
+            "requests" : request_count,
+            "connections" : connection_count,
+            "reused" : request_count - connection_count
+        }
+
+    def get_connection_uses(self) -> list[int]:
+        """
+        Returns the amount of requests sent over each opened connection, in the order the connections were opened
+        """
+
+        return self.__adapter.get_connection_uses()
+
+    def get_cache_stats(self) -> dict[str, int] | None:
+        """
+        Returns the hit/miss statistics of the response cache or None if no cache is used
+        """
+
+        if not self.__cache:
+            return None
+
+        return self.__cache.get_stats()
+
+    def get_rate_stats(self) -> dict[str, float]:
+        """
+        Returns the allowed requests in flight, the request rate, the throughput and the amount of throttled requests
+        """
+
+        return self.__rate_controller.get_stats()
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections of the session
+        """
+
+        self.__session.close()
+        return None
+
 
 def main() -> int:
     print("Calling main function in requester")
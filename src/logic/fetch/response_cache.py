@@ -0,0 +1,330 @@
+from datastructures.graph.title_index import TitleIndex
+from logic.project_folder import get_project_folder
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class ResponseCache:
+    """
+    A class for a persistent cache of api responses in a sqlite file, keyed by the normalized article title.
+    Entries expire after a time to live and can then be revalidated with their ETag / Last-Modified validators.
+    The total size is capped by evicting the least recently used entries. Access times of lookups are kept in memory
+    and written together with the next store, refresh or close, so a cache hit doesn't cost a write
+
+    Attributes:
+    -----------
+    __ttl : float
+        The time in seconds after which an entry has to be revalidated
+
+    __max_bytes : int
+        The maximum summed size of all stored response bodies
+
+    __connection : sqlite3.Connection
+        The connection to the cache file
+
+    __lock : threading.Lock
+        Guards the connection, as the cache is shared between threads
+
+    __total_bytes : int
+        The summed size of all stored response bodies
+
+    __accesses : dict[str, float]
+        The last access time of every entry read since the access times were last written, by key
+
+    __stats : dict[str, int]
+        Counters for hits, misses, revalidations and evictions
+
+    __title_index : TitleIndex
+        Brings the titles into the canonical form the entries are keyed by
+
+    Methods:
+    --------
+    lookup(kind : str, title : str) -> dict | None
+        Returns the cached response body and validators for the title or None if it isn't cached
+
+    store(kind : str, title : str, body : bytes, etag : str | None, last_modified : str | None) -> None
+        Stores a response body and evicts old entries if the size cap is exceeded
+
+    refresh(kind : str, title : str) -> None
+        Marks an entry as fresh again after the server confirmed it is unchanged
+
+    count_revalidation(unchanged : bool) -> None
+        Counts the outcome of a conditional request for a stale entry
+
+    get_stats() -> dict[str, int]
+        Returns the hit/miss statistics and the size of the cache
+
+    close() -> None
+        Writes the pending access times and closes the cache file
+    """
+
+
+    def __init__(self, file_name:str | None = None, ttl:float = 7 * 24 * 60 * 60, max_bytes:int = 512 * 1024 * 1024) -> None:
+        """
+        Sets up the object and creates the cache file if it doesn't exist
+
+        Parameters:
+        -----------
+        file_name : str | None
+            The location of the cache file. Defaults to responses.sqlite in the cache folder of the project
+
+        ttl : float
+            The time in seconds after which an entry has to be revalidated
+
+        max_bytes : int
+            The maximum summed size of all stored response bodies
+        """
+
+        if not file_name:
+            file_name = os.path.join(get_project_folder("cache"), "responses.sqlite")
+
+        self.__ttl:float = ttl
+        self.__max_bytes:int = max_bytes
+        self.__lock:threading.Lock = threading.Lock()
+        self.__connection:sqlite3.Connection = sqlite3.connect(file_name, check_same_thread = False)
+        self.__setup_tables()
+
+        total = self.__connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.__total_bytes:int = total
+        self.__accesses:dict[str, float] = {}
+        self.__stats:dict[str, int] = {"hits" : 0, "misses" : 0, "stale" : 0, "revalidated" : 0, "changed" : 0, "evictions" : 0}
+        self.__title_index:TitleIndex = TitleIndex()
+        return None
+
+    def lookup(self, kind:str, title:str) -> dict | None:
+        """
+        Returns the cached body, the validators and if the entry is still fresh
+        or None if nothing is cached for the title
+
+        Parameters:
+        -----------
+        kind : str
+            The kind of request the response belongs to (e.g. parse)
+
+        title : str
+            The title of the article, in any form
+        """
+
+        key = self.__make_key(kind, title)
+
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if not row:
+                self.__stats["misses"] += 1
+                return None
+
+            body, etag, last_modified, stored_at = row
+            fresh = time.time() - stored_at < self.__ttl
+
+            if fresh:
+                self.__stats["hits"] += 1
+            else:
+                self.__stats["stale"] += 1
+
+            self.__accesses[key] = time.time()
+
+            if len(self.__accesses) >= 1000:
+                self.__write_accesses()
+                self.__connection.commit()
+
+        return {
+            "body" : zlib.decompress(body),
+            "etag" : etag,
+            "last_modified" : last_modified,
+            "fresh" : fresh
+        }
+
+    def store(self, kind:str, title:str, body:bytes, etag:str | None, last_modified:str | None) -> None:
+        """
+        Stores the response body with its validators and evicts the least recently used entries
+        if the size cap is exceeded
+
+        Parameters:
+        -----------
+        kind : str
+            The kind of request the response belongs to (e.g. parse)
+
+        title : str
+            The title of the article, in any form
+
+        body : bytes
+            The response body
+
+        etag : str | None
+            The ETag header of the response
+
+        last_modified : str | None
+            The Last-Modified header of the response
+        """
+
+        key = self.__make_key(kind, title)
+        compressed = zlib.compress(body)
+        now = time.time()
+
+        with self.__lock:
+            old_row = self.__connection.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if old_row:
+                self.__total_bytes -= old_row[0]
+
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, etag, last_modified, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, compressed, len(compressed), etag, last_modified, now, now)
+            )
+            self.__total_bytes += len(compressed)
+            self.__accesses.pop(key, None)
+
+            self.__write_accesses()
+            self.__evict()
+            self.__connection.commit()
+
+        return None
+
+    def refresh(self, kind:str, title:str) -> None:
+        """
+        Resets the age of an entry after the server confirmed that it is unchanged
+
+        Parameters:
+        -----------
+        kind : str
+            The kind of request the response belongs to (e.g. parse)
+
+        title : str
+            The title of the article, in any form
+        """
+
+        key = self.__make_key(kind, title)
+
+        with self.__lock:
+            self.__connection.execute("UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key))
+            self.__write_accesses()
+            self.__connection.commit()
+
+        return None
+
+    def count_revalidation(self, unchanged:bool) -> None:
+        """
+        Counts the outcome of a conditional request for a stale entry
+
+        Parameters:
+        -----------
+        unchanged : bool
+            If the server answered that the entry is unchanged
+        """
+
+        with self.__lock:
+            if unchanged:
+                self.__stats["revalidated"] += 1
+            else:
+                self.__stats["changed"] += 1
+
+        return None
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the hit/miss statistics of this session and the amount of entries and bytes stored
+        """
+
+        with self.__lock:
+            entries = self.__connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            stats = dict(self.__stats)
+
+        stats["entries"] = entries
+        stats["bytes"] = self.__total_bytes
+        return stats
+
+    def close(self) -> None:
+        """
+        Writes the pending access times and closes the cache file
+        """
+
+        with self.__lock:
+            self.__write_accesses()
+            self.__connection.commit()
+            self.__connection.close()
+
+        return None
+
+    def __write_accesses(self) -> None:
+        """
+        Writes the access times of the entries read since the last write in one statement, without committing.
+        Expects the lock to be held
+        """
+
+        if self.__accesses:
+            self.__connection.executemany(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", [(accessed_at, key) for key, accessed_at in self.__accesses.items()]
+            )
+            self.__accesses = {}
+
+        return None
+
+    def __evict(self) -> None:
+        """
+        Deletes the least recently used entries until the size cap is met again. Expects the lock to be held
+        """
+
+        while self.__total_bytes > self.__max_bytes:
+            rows = self.__connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+
+            if not rows:
+                break
+
+            for key, size in rows:
+                if self.__total_bytes <= self.__max_bytes:
+                    break
+
+                self.__connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.__total_bytes -= size
+                self.__stats["evictions"] += 1
+
+        return None
+
+    def __make_key(self, kind:str, title:str) -> str:
+        """
+        Builds the cache key from the kind of request and the normalized title,
+        so that "Linux_Kernel", "Linux%20Kernel" and "linux Kernel" share an entry
+
+        Parameters:
+        -----------
+        kind : str
+            The kind of request
+
+        title : str
+            The title of the article, in any form
+        """
+
+        return f"{kind}:{self.__title_index.canonicalize(title)}"
+
+    def __setup_tables(self) -> None:
+        """
+        Creates the table and index of the cache if they don't exist yet
+        """
+
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.execute("PRAGMA synchronous = NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL, "
+            "etag TEXT, last_modified TEXT, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self.__connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self.__connection.commit()
+        return None
+
+
+def main() -> int:
+    print("Calling main function in response_cache")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
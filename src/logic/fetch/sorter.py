@@ -1,7 +1,11 @@
+from datastructures.graph.title_index import TitleIndex
+
 from logic.fetch.requester import Requester
+from logic.fetch.article_store import ArticleStore
+from logic.fetch.article_extractor import ArticleExtractor
+from logic.fetch.redirect_map import RedirectMap
+from logic.fetch.parse_pool import ParsePool, extract_article
 
-import re
-from collections import Counter
 from typing import Any
 
 
@@ -9,24 +13,87 @@ class Sorter:
     """
     A class to encapsulate functions to convert the json response of the wiki api into a more useful format for further use
 
+    Attributes:
+    -----------
+    requester : Requester
+        The object used to request articles. Can be shared between sorters to share its connection pool
+
+    article_store : ArticleStore | None
+        The store of already sorted articles, so unchanged articles are not sorted again
+
+    redirect_map : RedirectMap | None
+        The map every redirect the api follows is recorded in, so links to it can be resolved without a request
+
+    parse_pool : ParsePool | None
+        The worker processes article html is extracted in. Can be shared between sorters like the requester
+
+    profile : str
+        The fetch profile of single article requests: full reads the rendered html, light only the links and wikitext
+
+    __format_version : int
+        The version of the sorted article format, part of every kind articles are stored under. Raised whenever sorting
+        changes what an article contains, so articles sorted by an older version aren't taken from the article store
+
+    __parse_kind : str
+        The kind single articles of the profile are stored under, so articles of both profiles aren't mixed
+
+    __query_kind : str
+        The kind articles of batched queries are stored under
+
+    __titles : TitleIndex
+        Brings the names of requested articles into the canonical form batched queries are sent with
+
     Methods:
     --------
-    get_content(name : str) -> dict[str, Any]
+    get_content(name : str, verbose : bool, revalidate : bool) -> dict[str, Any]
         Requests the article named name and sorts the json content into a more useful format    
+
+    get_contents(names : list[str], verbose : bool, revalidate : bool) -> dict[str, dict[str, Any] | None]
+        Requests up to 50 articles in one batched query and sorts each of them into the same format as get_content
+
+    get_store_kind(batched : bool) -> str
+        Returns the kind sorted articles are stored under in the article store
     """
 
 
-    def __init__(self) -> None:
+    def __init__(self, requester:Requester | None = None, article_store:ArticleStore | None = None, redirect_map:RedirectMap | None = None, parse_pool:ParsePool | None = None, profile:str = "full") -> None:
         """
         Sets up the object
+
+        Parameters:
+        -----------
+        requester : Requester | None
+            The requester to fetch articles with. A new one is created if None is given
+
+        article_store : ArticleStore | None
+            The store of already sorted articles. Every article is sorted again if None is given
+
+        redirect_map : RedirectMap | None
+            The map to record followed redirects in. Redirects are not recorded if None is given
+
+        parse_pool : ParsePool | None
+            The worker processes to extract article html in. The html is extracted in the calling thread if None is given
+
+        profile : str
+            The fetch profile of single article requests, full or light. Keywords of the light profile are read from the wikitext
+            instead of the html and links come from the link list of the api, so both profiles give slightly different articles
         """
 
-        self.requester = Requester()
+        self.requester:Requester = requester if requester else Requester()
+        self.article_store:ArticleStore | None = article_store
+        self.redirect_map:RedirectMap | None = redirect_map
+        self.parse_pool:ParsePool | None = parse_pool
+        self.profile:str = profile
+        self.__format_version:int = 2
+        self.__parse_kind:str = f'{"parse" if profile == "full" else "parse-light"}-v{self.__format_version}'
+        self.__query_kind:str = f'query-v{self.__format_version}'
+        self.__titles:TitleIndex = TitleIndex()
         return None
 
-    def get_content(self, name:str, verbose:bool) -> dict[str, Any] | None:
+    def get_content(self, name:str, verbose:bool, revalidate:bool = False) -> dict[str, Any] | None:
         """
-        Requests the article named name and sorts the json content into a more useful format
+        Requests the article named name and sorts the json content into a more useful format.
+        Sorted articles are stored under the requested name and under their title, if they differ
 
         Parameters:
         -----------
@@ -35,9 +102,24 @@ class Sorter:
 
         verbose : bool
             Should the action be logged verbosely
+
+        revalidate : bool
+            Should the current revision be asked for, even if the article was stored or cached recently
         """
 
-        response = self.requester.request_content(name)
+        if self.article_store and not revalidate:
+            stored_article = self.article_store.lookup_title(self.__parse_kind, name)
+
+            if stored_article:
+                if verbose:
+                    report_statement = '' \
+                    f'Found already sorted article {stored_article["name"]} in the article store'
+
+                    print(report_statement)
+
+                return stored_article
+
+        response = self.requester.request_content(name, revalidate, self.profile)
 
         if not response:
             return None
@@ -48,7 +130,146 @@ class Sorter:
 
             print(report_statement)
 
-        return self.__sort_wiki_json(response, verbose)
+        sorted_entries = self.__sort_wiki_json(response, verbose)
+
+        if sorted_entries and self.redirect_map:
+            redirects = response["parse"].get("redirects", [])
+            self.redirect_map.store([(redirect["from"], redirect["to"], sorted_entries["id"]) for redirect in redirects])
+
+        if sorted_entries and self.article_store:
+            self.article_store.store(self.__parse_kind, name, sorted_entries)
+
+            if self.__titles.canonicalize(name) != self.__titles.canonicalize(sorted_entries["name"]):
+                self.article_store.store(self.__parse_kind, sorted_entries["name"], sorted_entries)
+
+        return sorted_entries
+
+    def get_contents(self, names:list[str], verbose:bool, revalidate:bool = False) -> dict[str, dict[str, Any] | None]:
+        """
+        Requests up to 50 articles in one batched query and sorts each of them into the same format as get_content.
+        Keywords are taken from the plain intro text of the articles, redirects are followed and recorded.
+        Articles that don't exist map to None
+
+        Parameters:
+        -----------
+        names : list[str]
+            The names of the articles to fetch, as found in links
+
+        verbose : bool
+            Should the action be logged verbosely
+
+        revalidate : bool
+            Should the current revisions be asked for, even if the articles were stored or cached recently
+        """
+
+        contents:dict[str, dict[str, Any] | None] = {}
+
+        if self.article_store and not revalidate:
+            for name in names:
+                stored_article = self.article_store.lookup_title(self.__query_kind, name)
+
+                if stored_article:
+                    contents[name] = stored_article
+
+        titles = {name : self.__titles.canonicalize(name) for name in names if name not in contents}
+
+        if not titles:
+            return contents
+
+        response = self.requester.request_batch_content(list(dict.fromkeys(titles.values())), revalidate)
+
+        if not response:
+            return contents | {name : None for name in titles}
+
+        if verbose:
+            report_statement = '' \
+            f'Got batched response for {len(names)} articles from wikipedia, beginning sorting of response'
+
+            print(report_statement)
+
+        pages = response["pages"]
+        normalized = response["normalized"]
+        redirects = response["redirects"]
+
+        if self.redirect_map:
+            self.redirect_map.store([(source, target, pages.get(target, {}).get("pageid")) for source, target in redirects.items()])
+
+        for name, title in titles.items():
+            normalized_title = normalized.get(title, title)
+            page = pages.get(redirects.get(normalized_title, normalized_title))
+            sorted_entries = self.__sort_query_page(page, verbose) if page else None
+
+            if sorted_entries and self.article_store:
+                self.article_store.store(self.__query_kind, name, sorted_entries)
+
+                if title != self.__titles.canonicalize(sorted_entries["name"]):
+                    self.article_store.store(self.__query_kind, sorted_entries["name"], sorted_entries)
+
+            contents[name] = sorted_entries
+
+        return contents
+
+    def get_store_kind(self, batched:bool) -> str:
+        """
+        Returns the kind sorted articles are stored under in the article store, which includes the format version
+
+        Parameters:
+        -----------
+        batched : bool
+            Should the kind of articles of batched queries be returned instead of single articles of the profile
+        """
+
+        return self.__query_kind if batched else self.__parse_kind
+
+    def __sort_query_page(self, page:dict, verbose:bool) -> dict[str, Any] | None:
+        """
+        Read content from a page of a batched query into dict format
+
+        Parameters:
+        -----------
+        page : dict
+            The page of the query response
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        if page.get("missing") or page.get("invalid"):
+            return None
+
+        sorted_entries:dict[str, Any] = {}
+
+        title = page.get("title")
+        assert title
+        assert isinstance(title, str)
+        sorted_entries["name"] = title
+
+        page_id = page.get("pageid")
+        assert page_id
+        assert isinstance(page_id, int)
+        sorted_entries["id"] = page_id
+
+        revision = page.get("lastrevid", 0)
+        sorted_entries["revision"] = revision
+
+        if self.article_store:
+            stored_article = self.article_store.lookup(self.__query_kind, page_id, revision)
+
+            if stored_article:
+                return stored_article
+
+        sorted_entries["keywords"] = self.__find_keywords(page.get("extract", ""), verbose)
+
+        links = [link["title"] for link in page.get("links", [])]
+        sorted_entries["links"] = links
+
+        if verbose:
+            report_statement = '' \
+            f'Found {len(links)} links to other articles in {title}'
+
+            print(report_statement)
+
+        return sorted_entries
 
     def __sort_wiki_json(self, response_json:dict, verbose:bool) -> dict[str, Any] | None:
         """
@@ -86,15 +307,34 @@ class Sorter:
         assert isinstance(page_id, int)
         sorted_entries["id"] = page_id
 
-        wrapped_text = raw.get("text")
-        assert wrapped_text
-        assert isinstance(wrapped_text, dict)
-        text = wrapped_text.get("*")
-        assert text
-        assert isinstance(text, str)
-        sorted_entries["keywords"] = self.__find_keywords(text, verbose)
+        revision = raw.get("revid", 0)
+        sorted_entries["revision"] = revision
+
+        if self.article_store:
+            stored_article = self.article_store.lookup(self.__parse_kind, page_id, revision)
+
+            if stored_article:
+                if verbose:
+                    report_statement = '' \
+                    f'Revision {revision} of {title} was already sorted, skipping sorting'
+
+                    print(report_statement)
 
-        sorted_entries["links"] = self.__unwrap_links(text, verbose)
+                return stored_article
+
+        if self.profile == "light":
+            keywords, links = self.__extract_light_article(raw, verbose)
+        else:
+            wrapped_text = raw.get("text")
+            assert wrapped_text
+            assert isinstance(wrapped_text, dict)
+            text = wrapped_text.get("*")
+            assert text
+            assert isinstance(text, str)
+            keywords, links = self.__extract_article(text, verbose)
+
+        sorted_entries["keywords"] = keywords
+        sorted_entries["links"] = links
         
         if verbose:
             report_statement = '' \
@@ -104,64 +344,92 @@ class Sorter:
         
         return sorted_entries
     
-    def __unwrap_links(self, article_text:str, verbose:bool) -> list[str]:
+    def __extract_article(self, article_text:str, verbose:bool) -> tuple[list[str], list[str]]:
         """
-        Read links out of given article text
+        Walks the article html once, chunk by chunk, and returns its 10 keywords and its links.
+        The html is extracted in a worker process if a parse pool is used
 
         Paramters:
         ----------
         article_text : str
-            The article text
+            The article html
 
         verbose : bool
             Should the action be logged verbosely
         """
 
-        link_pattern = r'<a href="/wiki/(.+?)".+?>.+?<\/a>'
-        link_matches = re.findall(link_pattern, article_text)
+        if self.parse_pool:
+            keywords, links, (nominal_count, filler_count) = self.parse_pool.extract(article_text, 10)
+        else:
+            keywords, links, (nominal_count, filler_count) = extract_article(article_text, 10)
+
+        if verbose:
+            report_statement = '' \
+            f'Found {len(links)} links to other articles\n' \
+            f'Found {nominal_count} nominals, filtered out {filler_count} common filler words.\n' \
+            'Returning the 10 most used as keywords'
 
-        filtered_matches = [match for match in link_matches if "Datei:" not in match and "Spezial:" not in match]
-        section_trim_pattern = r'([^#]+?)(#.+)'
-        trimmed_matches = [re.match(section_trim_pattern, match) for match in filtered_matches]
+            print(report_statement)
 
-        filtered_trimmed_matches = [match.group(1) for match in trimmed_matches if match]
+        return keywords, links
+    
+    def __extract_light_article(self, raw:dict, verbose:bool) -> tuple[list[str], list[str]]:
+        """
+        Returns the 10 keywords read from the wikitext of a light response and the links to existing articles
+        of the main namespace from its link list
+
+        Parameters:
+        -----------
+        raw : dict
+            The parse content of a light response (formatversion 2)
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        wikitext = raw.get("wikitext")
+        assert isinstance(wikitext, str)
+
+        extractor = ArticleExtractor()
+        extractor.add_wikitext(wikitext)
+        keywords = extractor.get_keywords(10)
+        links = [link["title"] for link in raw.get("links", []) if link.get("ns") == 0 and link.get("exists")]
 
         if verbose:
+            nominal_count, filler_count = extractor.get_stats()
+
             report_statement = '' \
-            f'Found {len(filtered_trimmed_matches)} links to other articles'
+            f'Found {len(links)} links to other articles\n' \
+            f'Found {nominal_count} nominals in the wikitext, filtered out {filler_count} common filler words.\n' \
+            f'Returning the {len(keywords)} most used as keywords'
 
             print(report_statement)
 
-        return filtered_trimmed_matches
-    
+        return keywords, links
+
     def __find_keywords(self, text:str, verbose:bool) -> list[str]:
         """
-        Reading the kexwords out of the article text
+        Reading the kexwords out of a plain article text
 
         Parameters:
         -----------
         text : str
-            The article text
+            The plain article text
 
         verbose : bool
             Should the action be logged verbosely
         """
 
-        words = text.split(" ")
-        cleaned_words = [word .rstrip(",.;") for word in words]
-        nominals = [word for word in cleaned_words if word.isalpha() and word[0].isupper() and len(word) > 2]
-
-        blacklist = ["Abschnitts", "Der", "Die", "Das", "Den", "Dem", "Des", "Ein", "Eine", "Einen", "Einem", "Eines", "Im", "In", "Dies", "Diese", "Dieser", "Dieses", "Er", "Sie", "Es", "Man", "Bei"]
-        filtered_nominals = [nominal for nominal in nominals if nominal not in blacklist]
-
-        frequencies = Counter(filtered_nominals).most_common()
-        keywords = [entry[0] for entry in frequencies[:10]]
+        extractor = ArticleExtractor()
+        extractor.add_text(text)
+        keywords = extractor.get_keywords(10)
 
         if verbose:
+            nominal_count, filler_count = extractor.get_stats()
+
             report_statement = '' \
-            f'Found {len(words)} words, {len(nominals)} of that being nominals.\n' \
-            f'Filtered out {len(nominals) - len(filtered_nominals)} common filler words.\n' \
-            f'Sorting {len(filtered_nominals)} keywords and returning the 10 most used'
+            f'Found {nominal_count} nominals, filtered out {filler_count} common filler words.\n' \
+            f'Returning the {len(keywords)} most used as keywords'
 
             print(report_statement)
 
@@ -0,0 +1,336 @@
+from datastructures.graph.title_index import TitleIndex
+
+from logic.fetch.requester import Requester
+from logic.fetch.redirect_map import RedirectMap
+from logic.project_folder import get_project_folder
+
+import os
+import sqlite3
+import threading
+import time
+
+
+class TitleResolver:
+    """
+    A class resolving newly discovered link titles in batches of 50 before they are queued,
+    so red links, pages of other namespaces and redirects don't cost a full article request each.
+    Every resolved title is remembered in a persistent file, titles that are not articles act as a negative cache,
+    and the redirects the api follows are handed to the redirect map
+
+    Attributes:
+    -----------
+    __ttl : float
+        The time in seconds for which a title is trusted to be an article
+
+    __missing_ttl : float
+        The time in seconds for which a title is trusted not to be an article, shorter as missing articles get written
+
+    __capacity : int
+        The maximum amount of resolved titles kept in memory
+
+    __resolved_titles : dict[str, str]
+        The in-memory tier, mapping a canonical title to the title of its article or an empty string if it is no article
+
+    __redirect_map : RedirectMap | None
+        The map the followed redirects are recorded in and known redirects are taken from
+
+    __connection : sqlite3.Connection
+        The connection to the resolution file
+
+    __lock : threading.Lock
+        Guards both tiers, as the resolver may be shared between threads
+
+    __title_index : TitleIndex
+        Brings the titles into the canonical form the resolutions are keyed by
+
+    __stats : dict[str, int]
+        Counters for titles answered without request, requested titles, sent requests and the found kinds of pages
+
+    Methods:
+    --------
+    lookup(titles : list[str]) -> dict[str, str | None]
+        Returns the resolution of the titles that are already known, without sending a request
+
+    resolve(requester : Requester, titles : list[str], verbose : bool) -> dict[str, str | None]
+        Returns the title of the article every title leads to or None if it leads to no article
+
+    get_stats() -> dict[str, int]
+        Returns the resolution statistics
+
+    close() -> None
+        Closes the resolution file
+    """
+
+
+    def __init__(self, file_name:str | None = None, redirect_map:RedirectMap | None = None, ttl:float = 30 * 24 * 60 * 60, missing_ttl:float = 24 * 60 * 60, capacity:int = 1 << 18) -> None:
+        """
+        Sets up the object and creates the resolution file if it doesn't exist
+
+        Parameters:
+        -----------
+        file_name : str | None
+            The location of the resolution file. Defaults to titles.sqlite in the cache folder of the project
+
+        redirect_map : RedirectMap | None
+            The map to record followed redirects in. Redirects are only remembered by the resolver if None is given
+
+        ttl : float
+            The time in seconds for which a title is trusted to be an article
+
+        missing_ttl : float
+            The time in seconds for which a title is trusted not to be an article
+
+        capacity : int
+            The maximum amount of resolved titles kept in memory
+        """
+
+        if not file_name:
+            file_name = os.path.join(get_project_folder("cache"), "titles.sqlite")
+
+        self.__ttl:float = ttl
+        self.__missing_ttl:float = missing_ttl
+        self.__capacity:int = capacity
+        self.__resolved_titles:dict[str, str] = {}
+        self.__redirect_map:RedirectMap | None = redirect_map
+        self.__lock:threading.Lock = threading.Lock()
+        self.__connection:sqlite3.Connection = sqlite3.connect(file_name, check_same_thread = False)
+        self.__setup_tables()
+        self.__title_index:TitleIndex = TitleIndex()
+        self.__stats:dict[str, int] = {"known" : 0, "requested" : 0, "requests" : 0, "articles" : 0, "redirects" : 0, "no_articles" : 0}
+        return None
+
+    def lookup(self, titles:list[str]) -> dict[str, str | None]:
+        """
+        Returns the canonical title of the article every already known title leads to, or None if it leads to no article.
+        Titles that are not known are left out, no request is sent
+
+        Parameters:
+        -----------
+        titles : list[str]
+            The titles to look up, in any form
+        """
+
+        known:dict[str, str | None] = {}
+
+        for title in titles:
+            target = self.__lookup(self.__title_index.canonicalize(title))
+
+            if target != None:
+                known[title] = target if target else None
+
+        return known
+
+    def resolve(self, requester:Requester, titles:list[str], verbose:bool) -> dict[str, str | None]:
+        """
+        Returns the canonical title of the main namespace article every title leads to, following redirects,
+        or None if the title is missing, invalid or belongs to another namespace.
+        Titles that are not known yet are resolved with one request per 50 titles.
+        Titles whose request failed are returned unchanged, so they are fetched like before
+
+        Parameters:
+        -----------
+        requester : Requester
+            The requester to send the resolving queries with
+
+        titles : list[str]
+            The titles to resolve, in any form
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        resolved:dict[str, str | None] = {}
+        unknown_titles:dict[str, str] = {}
+
+        for title in titles:
+            key = self.__title_index.canonicalize(title)
+            target = self.__lookup(key)
+
+            if target == None:
+                unknown_titles[title] = key
+            else:
+                resolved[title] = target if target else None
+
+        keys = list(dict.fromkeys(unknown_titles.values()))
+        requested_targets:dict[str, str] = {}
+
+        for batch_start in range(0, len(keys), 50):
+            requested_targets.update(self.__request_batch(requester, keys[batch_start:batch_start + 50]))
+
+        for title, key in unknown_titles.items():
+            target = requested_targets.get(key)
+            resolved[title] = key if target == None else target if target else None
+
+        if verbose and keys:
+            report_statement = '' \
+            f'Resolved {len(keys)} new titles with {(len(keys) + 49) // 50} requests, ' \
+            f'{sum(1 for target in resolved.values() if target == None)} of {len(titles)} links lead to no article'
+
+            print(report_statement)
+
+        return resolved
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the amount of titles answered without request, requested titles and sent requests of this session,
+        and how many of the requested titles were articles, redirects or no articles
+        """
+
+        with self.__lock:
+            return dict(self.__stats)
+
+    def close(self) -> None:
+        """
+        Closes the resolution file
+        """
+
+        with self.__lock:
+            self.__connection.close()
+
+        return None
+
+    def __lookup(self, key:str) -> str | None:
+        """
+        Returns the known resolution of a title: the title of its article, an empty string if it is no article,
+        or None if it has to be requested
+
+        Parameters:
+        -----------
+        key : str
+            The canonical title
+        """
+
+        with self.__lock:
+            target = self.__resolved_titles.get(key)
+
+            if target != None:
+                self.__stats["known"] += 1
+                return target
+
+        redirect = self.__redirect_map.resolve(key) if self.__redirect_map else None
+
+        with self.__lock:
+            if redirect:
+                target = redirect[0]
+            else:
+                row = self.__connection.execute(
+                    "SELECT target, seen_at FROM titles WHERE title = ?", (key,)
+                ).fetchone()
+
+                if not row or time.time() - row[1] >= (self.__ttl if row[0] else self.__missing_ttl):
+                    return None
+
+                target = row[0] if row[0] else ""
+
+            self.__remember(key, target)
+            self.__stats["known"] += 1
+
+        return target
+
+    def __request_batch(self, requester:Requester, keys:list[str]) -> dict[str, str]:
+        """
+        Resolves up to 50 titles with one request, records the resolutions and followed redirects
+        and returns the title of the article of every key or an empty string if it is no article.
+        The resolutions are returned directly, as the in-memory tier may forget them before they are read.
+        Nothing is recorded and nothing returned if the request fails
+
+        Parameters:
+        -----------
+        requester : Requester
+            The requester to send the query with
+
+        keys : list[str]
+            The canonical titles to resolve
+        """
+
+        response = requester.request_titles(keys)
+
+        if not response:
+            return {}
+
+        pages = response["pages"]
+        normalized = response["normalized"]
+        redirects = response["redirects"]
+        seen_at = time.time()
+        rows = []
+        followed_redirects = []
+
+        for key in keys:
+            normalized_title = normalized.get(key, key)
+            target_title = redirects.get(normalized_title, normalized_title)
+            page = pages.get(target_title)
+            is_article = page and page.get("ns") == 0 and not (page.get("missing") or page.get("invalid"))
+
+            if not is_article:
+                rows.append((key, None, None, seen_at))
+                continue
+
+            target = self.__title_index.canonicalize(page["title"])
+            rows.append((key, target, page.get("pageid"), seen_at))
+
+            if target != key:
+                rows.append((target, target, page.get("pageid"), seen_at))
+                followed_redirects.append((key, target, page.get("pageid")))
+
+        with self.__lock:
+            for row in rows:
+                self.__remember(row[0], row[1] if row[1] else "")
+
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO titles (title, target, page_id, seen_at) VALUES (?, ?, ?, ?)", rows
+            )
+            self.__connection.commit()
+
+            self.__stats["requests"] += 1
+            self.__stats["requested"] += len(keys)
+            self.__stats["redirects"] += len(followed_redirects)
+            self.__stats["no_articles"] += sum(1 for row in rows if row[1] == None)
+            self.__stats["articles"] += len(keys) - len(followed_redirects) - sum(1 for row in rows if row[1] == None)
+
+        if self.__redirect_map:
+            self.__redirect_map.store(followed_redirects)
+
+        return {row[0] : row[1] if row[1] else "" for row in rows}
+
+    def __remember(self, key:str, target:str) -> None:
+        """
+        Puts a resolution into the in-memory tier and forgets all of them if the capacity is exceeded.
+        Expects the lock to be held
+
+        Parameters:
+        -----------
+        key : str
+            The canonical title
+
+        target : str
+            The title of its article or an empty string if it is no article
+        """
+
+        if len(self.__resolved_titles) >= self.__capacity:
+            self.__resolved_titles.clear()
+
+        self.__resolved_titles[key] = target
+        return None
+
+    def __setup_tables(self) -> None:
+        """
+        Creates the table of the resolutions if it doesn't exist yet
+        """
+
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.execute("PRAGMA synchronous = NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS titles ("
+            "title TEXT PRIMARY KEY, target TEXT, page_id INTEGER, seen_at REAL NOT NULL)"
+        )
+        self.__connection.commit()
+        return None
+
+
+def main() -> int:
+    print("Calling main function in title_resolver")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
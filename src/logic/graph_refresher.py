@@ -0,0 +1,338 @@
+from datastructures.graph.graph import Graph
+from datastructures.graph.node import Node
+from datastructures.graph.title_index import TitleIndex
+
+from logic.fetch.requester import Requester
+from logic.fetch.response_cache import ResponseCache
+from logic.fetch.article_store import ArticleStore
+from logic.fetch.redirect_map import RedirectMap
+from logic.fetch.title_resolver import TitleResolver
+from logic.fetch.sorter import Sorter
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+
+class GraphRefresher:
+    """
+    A class to bring an existing graph up to date without building it again. The current revisions of all nodes are
+    asked for 50 at a time without content, and only the articles whose revision changed are fetched and sorted again,
+    so the cost of a refresh depends on how many articles changed rather than on the size of the graph.
+    The keywords and outgoing edges of the changed nodes are replaced in place, the graph doesn't gain or lose nodes
+
+    Attributes:
+    -----------
+    __requester : Requester
+        The pooled requester the revisions and changed articles are requested with
+
+    __article_store : ArticleStore | None
+        The store of already sorted articles, so a changed revision that was sorted before isn't requested
+
+    __redirect_map : RedirectMap | None
+        The persistent map of known redirects, used to find the nodes behind links to redirects
+
+    __title_resolver : TitleResolver | None
+        Resolves the link titles of changed articles that are neither nodes nor known redirects
+
+    __workers : int
+        The maximum amount of requests kept in flight at the same time
+
+    __batch_size : int
+        The maximum amount of changed articles fetched with a single batched request. 1 uses single article requests
+
+    __fetch_profile : str
+        The fetch profile of single article requests, full for the rendered html or light for links and wikitext only
+
+    __titles : TitleIndex
+        Brings node names and links into canonical form before they are compared
+
+    Methods:
+    --------
+    refresh_graph(graph : Graph, verbose : bool) -> dict[str, int]
+        Updates the changed nodes of the graph in place and returns what was checked and changed
+    """
+
+
+    def __init__(self, requester:Requester | None = None, workers:int = 1, batch_size:int = 1, cache:ResponseCache | None = None, article_store:ArticleStore | None = None, redirect_map:RedirectMap | None = None, title_resolver:TitleResolver | None = None, fetch_profile:str = "full") -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        requester : Requester | None
+            The requester to fetch revisions and articles with. A new pooled requester is created if None is given
+
+        workers : int
+            The maximum amount of requests kept in flight at the same time
+
+        batch_size : int
+            The maximum amount of changed articles fetched with one batched request (at most 50). 1 uses single article requests.
+            Should match the batch size the graph was built with, as batched requests read keywords from the intro text only
+
+        cache : ResponseCache | None
+            The persistent response cache used by the created requester. Ignored if a requester is given
+
+        article_store : ArticleStore | None
+            The store of already sorted articles. Every changed article is requested if None is given
+
+        redirect_map : RedirectMap | None
+            The persistent map of known redirects. Links to redirects only lead to nodes through the title resolver if None is given
+
+        title_resolver : TitleResolver | None
+            Resolves unknown link titles of changed articles. Links that are neither nodes nor known redirects are dropped if None is given
+
+        fetch_profile : str
+            The fetch profile of single article requests, full or light. Should match the profile the graph was built with
+        """
+
+        self.__requester:Requester = requester if requester else Requester(pool_size = max(10, workers), cache = cache)
+        self.__article_store:ArticleStore | None = article_store
+        self.__redirect_map:RedirectMap | None = redirect_map
+        self.__title_resolver:TitleResolver | None = title_resolver
+        self.__workers:int = workers
+        self.__batch_size:int = batch_size
+        self.__fetch_profile:str = fetch_profile
+        self.__titles:TitleIndex = TitleIndex()
+        return None
+
+    def refresh_graph(self, graph:Graph, verbose:bool) -> dict[str, int]:
+        """
+        Asks for the current revisions of all nodes of the graph, fetches the articles whose revision changed
+        and replaces keywords, revision and outgoing edges of their nodes in place.
+        Nodes whose article can't be found under their name anymore are left as they are.
+        Returns the amount of nodes, unchanged, changed and vanished nodes, nodes that couldn't be checked or fetched,
+        changed articles taken from the article store, added and removed edges and sent requests
+
+        Parameters:
+        -----------
+        graph : Graph
+            The graph to refresh, either built in this session or read from a file
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        requests_before = self.__requester.get_connection_stats()["requests"]
+        nodes = sorted(graph.get_nodes(), key = lambda node : node.get_id())
+        stats = {"nodes" : len(nodes), "unchanged" : 0, "changed" : 0, "vanished" : 0, "failed" : 0, "stored" : 0, "added_edges" : 0, "removed_edges" : 0, "requests" : 0}
+
+        changed_nodes = self.__find_changed_nodes(nodes, stats, verbose)
+        contents = self.__fetch_changed_articles(changed_nodes, stats, verbose)
+        node_ids = {self.__titles.canonicalize(node.get_name()) : node.get_id() for node in nodes}
+        link_targets = self.__resolve_links([link for new_info in contents.values() for link in new_info["links"]], node_ids, verbose)
+
+        for node_id, new_info in contents.items():
+            node = graph.get_node_from_id(node_id)
+            assert node
+
+            end_ids:set[int] = set()
+
+            for link in new_info["links"]:
+                target_title = link_targets.get(link)
+
+                if target_title is not None and target_title in node_ids:
+                    end_ids.add(node_ids[target_title])
+
+            added, removed = graph.replace_outgoing_edges(node_id, end_ids)
+            node.update(new_info["keywords"], new_info["revision"])
+            stats["added_edges"] += added
+            stats["removed_edges"] += removed
+
+            if verbose:
+                report_statement = '' \
+                f'Updated {node.get_name()} to revision {new_info["revision"]}, {added} edges added and {removed} removed'
+
+                print(report_statement)
+
+        stats["requests"] = self.__requester.get_connection_stats()["requests"] - requests_before
+
+        report_statement = '' \
+        f'Checked {stats["nodes"]} nodes of the graph of {graph.get_root()}: {stats["unchanged"]} unchanged, {stats["changed"]} changed, ' \
+        f'{stats["vanished"]} no longer found under their name\n' \
+        f'Updated {len(contents)} nodes ({stats["stored"]} from the article store), added {stats["added_edges"]} and removed {stats["removed_edges"]} edges ' \
+        f'with {stats["requests"]} requests'
+
+        if stats["failed"]:
+            report_statement += f', {stats["failed"]} nodes could not be checked or fetched and were left as they are'
+
+        print(report_statement)
+
+        return stats
+
+    def __find_changed_nodes(self, nodes:list[Node], stats:dict[str, int], verbose:bool) -> dict[int, tuple[str, int]]:
+        """
+        Asks for the current revisions of the nodes with one request per 50 nodes and returns the nodes whose revision changed,
+        by ID with the current title and revision of their article. Nodes without a known revision count as changed
+
+        Parameters:
+        -----------
+        nodes : list[Node]
+            The nodes to check
+
+        stats : dict[str, int]
+            The statistics of the refresh, counted up
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        titles = [self.__titles.canonicalize(node.get_name()) for node in nodes]
+        batches = [titles[batch_start:batch_start + 50] for batch_start in range(0, len(titles), 50)]
+        responses:dict[str, dict | None] = {}
+
+        with ThreadPoolExecutor(max_workers = self.__workers) as executor:
+            for batch, response in zip(batches, executor.map(self.__requester.request_revisions, batches)):
+                responses.update({title : response for title in batch})
+
+        changed_nodes:dict[int, tuple[str, int]] = {}
+
+        for node, title in zip(nodes, titles):
+            response = responses[title]
+
+            if not response:
+                stats["failed"] += 1
+                continue
+
+            normalized_title = response["normalized"].get(title, title)
+            page = response["pages"].get(response["redirects"].get(normalized_title, normalized_title))
+
+            if not page or page.get("missing") or page.get("invalid") or page.get("pageid") != node.get_id():
+                stats["vanished"] += 1
+
+                if verbose:
+                    report_statement = '' \
+                    f'The article of {node.get_name()} is no longer found under its name, leaving the node as it is'
+
+                    print(report_statement)
+
+                continue
+
+            revision = page.get("lastrevid", 0)
+
+            if revision and revision == node.get_revision():
+                stats["unchanged"] += 1
+                continue
+
+            stats["changed"] += 1
+            changed_nodes[node.get_id()] = (page["title"], revision)
+
+        if verbose:
+            report_statement = '' \
+            f'Checked the revisions of {len(nodes)} nodes with {len(batches)} requests, {len(changed_nodes)} changed'
+
+            print(report_statement)
+
+        return changed_nodes
+
+    def __fetch_changed_articles(self, changed_nodes:dict[int, tuple[str, int]], stats:dict[str, int], verbose:bool) -> dict[int, dict[str, Any]]:
+        """
+        Returns the sorted current articles of the changed nodes by node ID. Revisions that were already sorted are taken
+        from the article store, the others are requested, batched and concurrently like the build loop fetches them.
+        Articles that couldn't be fetched or turned out to be another page are left out
+
+        Parameters:
+        -----------
+        changed_nodes : dict[int, tuple[str, int]]
+            The current title and revision of the article of every changed node by node ID
+
+        stats : dict[str, int]
+            The statistics of the refresh, counted up
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        sorter = Sorter(self.__requester, self.__article_store, self.__redirect_map, profile = self.__fetch_profile)
+        kind = sorter.get_store_kind(self.__batch_size > 1)
+        contents:dict[int, dict[str, Any]] = {}
+        names:dict[str, int] = {}
+
+        for node_id, (title, revision) in changed_nodes.items():
+            stored_article = self.__article_store.lookup(kind, node_id, revision) if self.__article_store and revision else None
+
+            if stored_article:
+                contents[node_id] = stored_article
+                stats["stored"] += 1
+            else:
+                names[title] = node_id
+
+        name_list = list(names.keys())
+        fetched:dict[str, dict[str, Any] | None] = {}
+
+        with ThreadPoolExecutor(max_workers = self.__workers) as executor:
+            if self.__batch_size > 1:
+                chunks = [name_list[chunk_start:chunk_start + self.__batch_size] for chunk_start in range(0, len(name_list), self.__batch_size)]
+
+                for chunk_contents in executor.map(lambda chunk : sorter.get_contents(chunk, verbose, True), chunks):
+                    fetched.update(chunk_contents)
+            else:
+                fetched.update(zip(name_list, executor.map(lambda name : sorter.get_content(name, verbose, True), name_list)))
+
+        for name, new_info in fetched.items():
+            if not new_info or new_info.get("id") != names[name]:
+                stats["failed"] += 1
+
+                if verbose:
+                    warning_statement = '' \
+                    f'Failed to get the current article {name}, leaving its node as it is'
+
+                    print(warning_statement)
+
+                continue
+
+            contents[names[name]] = new_info
+
+        return contents
+
+    def __resolve_links(self, links:list[str], node_ids:dict[str, int], verbose:bool) -> dict[str, str | None]:
+        """
+        Returns the canonical title of the article every link leads to, or None if it leads to no article.
+        Links to known redirects are resolved through the redirect map, the other links that aren't nodes by the title resolver
+
+        Parameters:
+        -----------
+        links : list[str]
+            The links of the changed articles
+
+        node_ids : dict[str, int]
+            The node IDs by canonical node title
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        targets:dict[str, str | None] = {}
+        unknown_links:dict[str, str] = {}
+
+        for link in dict.fromkeys(links):
+            title = self.__titles.canonicalize(link)
+
+            if title in node_ids:
+                targets[link] = title
+                continue
+
+            redirect = self.__redirect_map.resolve(title) if self.__redirect_map else None
+
+            if redirect:
+                targets[link] = redirect[0]
+            else:
+                unknown_links[link] = title
+
+        if not self.__title_resolver:
+            return targets | {link : title for link, title in unknown_links.items()}
+
+        resolved = self.__title_resolver.resolve(self.__requester, list(dict.fromkeys(unknown_links.values())), verbose)
+
+        for link, title in unknown_links.items():
+            targets[link] = resolved.get(title, title)
+
+        return targets
+
+
+def main() -> int:
+    print("Calling main function in graph_refresher")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,12 +1,28 @@
 from datastructures.custom_queue.priorityqueue import PriorityQueue
 from datastructures.custom_queue.normalqueue import NormalQueue
+from datastructures.custom_queue.bucketqueue import BucketQueue
+from datastructures.custom_queue.spillqueue import SpillQueue
 from datastructures.custom_queue.queue import WikiGraphQueue
+from datastructures.custom_queue.queueentry import QueueEntry
 from datastructures.graph.graph import Graph
 from datastructures.graph.node import Node
 from datastructures.graph.edge import Edge
-
+from datastructures.graph.title_index import TitleIndex
+
+from logic.fetch.requester import Requester
+from logic.fetch.response_cache import ResponseCache
+from logic.fetch.article_store import ArticleStore
+from logic.fetch.redirect_map import RedirectMap
+from logic.fetch.title_resolver import TitleResolver
+from logic.fetch.prefetcher import Prefetcher
+from logic.fetch.parse_pool import ParsePool
+from logic.build_journal import BuildJournal
 from logic.fetch.sorter import Sorter
+from logic.dump.dump_index import DumpIndex
+from logic.dump.dump_sorter import DumpSorter
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 
@@ -26,18 +42,78 @@ class GraphBuilder:
         The collection of created edges
 
     __nodes : dict[str, Node]
-        The collection of created nodes accessable by article name
+        The collection of created nodes accessable by canonical article title
+
+    __titles : TitleIndex
+        Brings the names from links, the api and the user into canonical form before they are compared
+
+    __node_titles : dict[int, str]
+        The canonical title of every created node by page ID, so an article reached through a redirect isn't added twice
+
+    __aliases : dict[str, str]
+        The canonical titles of the names that turned out to be redirects or other names of a node, mapped to the title of the node
 
     __queue : WikiGraphQueue
         The queue that holds the seen but not accessed articles
 
+    __requester : Requester
+        The pooled requester shared by every sorter the builder creates
+
+    __article_store : ArticleStore | None
+        The store of already sorted articles shared by every sorter the builder creates
+
+    __workers : int
+        The maximum amount of article requests kept in flight at the same time
+
+    __batch_size : int
+        The maximum amount of articles fetched with a single batched request
+
+    __in_flight : dict[str, QueueEntry]
+        The queue entries that are currently being requested, accessable by canonical article title
+
+    __returned_entries : deque[QueueEntry]
+        The entries an interrupted build had taken but not integrated, taken again before the queue in their original order
+
+    __dump_index : DumpIndex | None
+        The index of a local dump to read articles from instead of requesting them
+
+    __redirect_map : RedirectMap | None
+        The persistent map of known redirects, consulted before links are queued
+
+    __title_resolver : TitleResolver | None
+        Resolves newly discovered titles in batches before they are queued, so only existing articles are queued
+
+    __unresolved_links : dict[str, list[tuple[int, int]]]
+        The newly discovered titles waiting to be resolved, each with the page IDs and depths of the articles linking to it
+
+    __prefetch_window : int
+        The amount of queue entries fetched ahead while the serial builder integrates an article
+
+    __prefetch_stats : dict[str, int] | None
+        The statistics of the last prefetcher, if articles were fetched ahead
+
+    __journal : BuildJournal | None
+        The journal every change of the builder state is recorded in, so the build can be resumed
+
+    __parse_pool : ParsePool | None
+        The worker processes the html of fetched articles is extracted in, while the builder merges their nodes and edges
+
+    __fetch_profile : str
+        The fetch profile of single article requests, full for the rendered html or light for links and wikitext only
+
     Methods:
     --------
     build_graph_from_article(start_name : str, queue_type : str, verbose : bool) -> Graph | None
         Returns the created graph or None if creation failed
+
+    resume_graph(verbose : bool) -> Graph | None
+        Restores the state of an interrupted build from the journal, continues it and returns the created graph
+
+    grow_graph(graph : Graph, queue_type : str, verbose : bool) -> Graph | None
+        Seeds the builder with an existing graph and adds new nodes to it until the maximum size is reached
     """
 
-    def __init__(self, max_graph_size:int, max_depth:int) -> None:
+    def __init__(self, max_graph_size:int, max_depth:int, requester:Requester | None = None, workers:int = 1, batch_size:int = 1, cache:ResponseCache | None = None, article_store:ArticleStore | None = None, dump_index:DumpIndex | None = None, redirect_map:RedirectMap | None = None, title_resolver:TitleResolver | None = None, prefetch_window:int = 0, journal:BuildJournal | None = None, parse_pool:ParsePool | None = None, fetch_profile:str = "full") -> None:
         """
         Sets up the object
 
@@ -48,13 +124,71 @@ class GraphBuilder:
 
         max_depth : int
             The maximum distance to the root article to consider during graph building
+
+        requester : Requester | None
+            The requester to fetch articles with. A new pooled requester is created if None is given
+
+        workers : int
+            The maximum amount of article requests kept in flight at the same time. 1 builds serially
+
+        batch_size : int
+            The maximum amount of queue entries fetched with one batched request (at most 50). 1 uses single article requests
+
+        cache : ResponseCache | None
+            The persistent response cache used by the created requester. Ignored if a requester is given
+
+        article_store : ArticleStore | None
+            The store of already sorted articles, so unchanged articles are not sorted again
+
+        dump_index : DumpIndex | None
+            The ingested index of a local dump. If given, articles are read from it and no request is sent
+
+        redirect_map : RedirectMap | None
+            The persistent map of known redirects. Links to redirects are only resolved within the session if None is given
+
+        title_resolver : TitleResolver | None
+            Resolves new titles before they are queued. Every link is queued and found missing by its request if None is given.
+            Ignored if a dump index is given
+
+        prefetch_window : int
+            The amount of next queue entries fetched ahead while an article is integrated. 0 fetches nothing ahead.
+            Only used when building serially, as the concurrent builder already keeps requests in flight
+
+        journal : BuildJournal | None
+            The journal to record the build in, or to resume it from. The build isn't recorded if None is given
+
+        parse_pool : ParsePool | None
+            The worker processes to extract the html of fetched articles in. Only used for single article requests,
+            which are extracted in parallel if workers requests are kept in flight. Ignored if a dump index is given
+
+        fetch_profile : str
+            The fetch profile of single article requests: full requests the rendered html, light only the links and the wikitext
+            the keywords are read from, which is several times smaller. Batched requests and dumps don't use profiles
         """
 
         self.__max_graph_size:int = max_graph_size
         self.__max_depth:int = max_depth
         self.__edges:set[Edge] = set()
         self.__nodes:dict[str, Node] = {}
+        self.__titles:TitleIndex = TitleIndex()
+        self.__node_titles:dict[int, str] = {}
+        self.__aliases:dict[str, str] = {}
         self.__queue:WikiGraphQueue
+        self.__requester:Requester = requester if requester else Requester(pool_size = max(10, workers), cache = cache)
+        self.__article_store:ArticleStore | None = article_store
+        self.__workers:int = workers
+        self.__batch_size:int = batch_size
+        self.__in_flight:dict[str, QueueEntry] = {}
+        self.__returned_entries:deque[QueueEntry] = deque()
+        self.__dump_index:DumpIndex | None = dump_index
+        self.__redirect_map:RedirectMap | None = redirect_map
+        self.__title_resolver:TitleResolver | None = title_resolver if not dump_index else None
+        self.__unresolved_links:dict[str, list[tuple[int, int]]] = {}
+        self.__prefetch_window:int = prefetch_window
+        self.__prefetch_stats:dict[str, int] | None = None
+        self.__journal:BuildJournal | None = journal
+        self.__parse_pool:ParsePool | None = parse_pool if not dump_index else None
+        self.__fetch_profile:str = fetch_profile
         return None
     
     def build_graph_from_article(self, start_name:str, queue_type:str, verbose:bool) -> Graph | None:
@@ -68,21 +202,15 @@ class GraphBuilder:
             The name of the root article
 
         queue_type : str
-            The type of queue to use (normal or priority)
+            The type of queue to use (normal, priority, bucket or spilling)
 
         verbose : bool
             If the action should be logged verbosely
         """
 
-        sorter = Sorter()
-
-        assert queue_type in ["n", "p"]
-        match queue_type:
-            case "n":
-                self.__queue = NormalQueue(start_name)
-            case "p":
-                self.__queue = PriorityQueue(start_name)
-
+        sorter = self.__create_sorter()
+        start_title = self.__titles.canonicalize(start_name)
+        self.__queue = self.__create_queue(queue_type, start_title)
 
         if verbose:
             request_statement = '' \
@@ -90,7 +218,7 @@ class GraphBuilder:
 
             print(request_statement)
 
-        starting_info = sorter.get_content(start_name, verbose)
+        starting_info = sorter.get_content(start_title, verbose)
 
         if not starting_info:
             failure_statement = '' \
@@ -126,8 +254,11 @@ class GraphBuilder:
 
             print(warning_statement)
             return None
+
+        if self.__journal:
+            self.__journal.start({"root" : start_name, "queue" : queue_type, "size" : self.__max_graph_size, "depth" : self.__max_depth})
  
-        self.__add_node(starting_id, starting_name, starting_keywords, 0)
+        self.__add_node(starting_id, starting_name, starting_keywords, 0, starting_info.get("revision", 0))
 
         starting_links = starting_info.get("links")
         if not (starting_links and isinstance(starting_links, list)):
@@ -145,13 +276,340 @@ class GraphBuilder:
             
         print(report_statement)
         
-        self.__queue.add_new_entries(starting_links, starting_id, 0, verbose)
+        starting_title = self.__titles.canonicalize(starting_name)
+        self.__add_to_blacklist(starting_title)
+
+        if starting_title != start_title:
+            self.__add_alias(start_title, starting_title)
+
+        self.__sort_links(0, starting_id, *self.__canonicalize_links(starting_links), verbose)
+        self.__resolve_pending_links(verbose)
+
+        return self.__continue_build(sorter, start_name, verbose)
+
+    def grow_graph(self, graph:Graph, queue_type:str, verbose:bool) -> Graph | None:
+        """
+        Seeds nodes and edges from an existing graph, rebuilds its frontier from the stored links of its nodes
+        and continues building until the maximum size is reached. The links of the nodes are read from the article store
+        and the response cache, only nodes whose article isn't stored there are requested again
+
+        Parameters:
+        -----------
+        graph : Graph
+            The graph to grow, either built in this session or read from a file
+
+        queue_type : str
+            The type of queue to use (normal, priority, bucket or spilling)
+
+        verbose : bool
+            If the action should be logged verbosely
+        """
+
+        if graph.get_node_count() >= self.__max_graph_size:
+            failure_statement = '' \
+            f'The graph already has {graph.get_node_count()} nodes, which is not less than the requested size {self.__max_graph_size}.\n' \
+            'Aborting graph building'
+
+            print(failure_statement)
+            return None
+
+        sorter = self.__create_sorter()
+        start_name = graph.get_root()
+        start_title = self.__titles.canonicalize(start_name)
+        self.__queue = self.__create_queue(queue_type, start_title)
+
+        if self.__journal:
+            self.__journal.start({"root" : start_name, "queue" : queue_type, "size" : self.__max_graph_size, "depth" : self.__max_depth})
+
+        nodes = sorted(graph.get_nodes(), key = lambda node : (node.get_depth(), node.get_id()))
+
+        for node in nodes:
+            self.__add_node(node.get_id(), node.get_name(), node.get_keywords(), node.get_depth(), node.get_revision())
+            self.__add_to_blacklist(self.__titles.canonicalize(node.get_name()))
+
+        seeded_edges = [Edge(edge.get_start_id(), edge.get_end_id()) for edge in graph.get_edges()]
+        self.__edges.update(seeded_edges)
+
+        if self.__journal and seeded_edges:
+            self.__journal.record("E", [[edge.get_start_id(), edge.get_end_id()] for edge in seeded_edges])
+
+        requests_before = self.__requester.get_connection_stats()["requests"]
+        contents = self.__fetch_stored_links(sorter, [node.get_name() for node in nodes], verbose)
+        missing = 0
+
+        for node in nodes:
+            new_info = contents.get(node.get_name())
+
+            if not new_info:
+                missing += 1
+                continue
+
+            node_title = self.__titles.canonicalize(node.get_name())
+            article_title = self.__titles.canonicalize(new_info.get("name", node_title))
+
+            if article_title != node_title and article_title not in self.__nodes:
+                self.__add_alias(article_title, node_title)
+
+            self.__sort_links(node.get_depth(), node.get_id(), *self.__canonicalize_links(new_info.get("links", [])), verbose)
+
+        self.__resolve_pending_links(verbose)
+        requests_sent = self.__requester.get_connection_stats()["requests"] - requests_before
+
+        report_statement = '' \
+        f'Seeded {len(self.__nodes)} nodes and {len(self.__edges)} edges from the graph of {start_name}, ' \
+        f'rebuilt a frontier of {self.__queue.get_entry_count()} articles with {requests_sent} requests'
+
+        if missing:
+            report_statement += f', the links of {missing} nodes could not be read'
+
+        print(report_statement)
+
+        return self.__continue_build(sorter, start_name, verbose)
+
+    def __fetch_stored_links(self, sorter:Sorter | DumpSorter, names:list[str], verbose:bool) -> dict[str, dict[str, Any] | None]:
+        """
+        Reads the sorted articles of the given names, batched and concurrently like the build loop fetches them,
+        so articles in the article store or response cache aren't requested
+
+        Parameters:
+        -----------
+        sorter : Sorter | DumpSorter
+            The object to read articles with
+
+        names : list[str]
+            The names of the articles
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        chunks = [names[chunk_start:chunk_start + self.__batch_size] for chunk_start in range(0, len(names), self.__batch_size)]
+        contents:dict[str, dict[str, Any] | None] = {}
+
+        with ThreadPoolExecutor(max_workers = self.__workers) as executor:
+            for chunk_contents in executor.map(lambda chunk : self.__fetch_articles(sorter, chunk, verbose), chunks):
+                contents.update(chunk_contents)
+
+        return contents
+
+    def resume_graph(self, verbose:bool) -> Graph | None:
+        """
+        Restores nodes, edges, other names and the queue of an interrupted build by replaying its journal up to the last checkpoint,
+        takes the entries that were being fetched again first, in the order they were taken, and continues building.
+        Putting them back into the queue would let entries that gained degree since outrank them, so the resumed build
+        would take entries in another order than the interrupted one.
+        The build starts over if it was interrupted before its first checkpoint.
+        The builder has to be set up with the size and depth stored in the journal
+
+        Parameters:
+        -----------
+        verbose : bool
+            If the action should be logged verbosely
+        """
+
+        if not self.__journal:
+            return None
+
+        loaded = self.__journal.load()
+
+        if not loaded:
+            failure_statement = '' \
+            f'Could not read a build journal at {self.__journal.get_file_name()}.\n' \
+            'Aborting graph building'
+
+            print(failure_statement)
+            return None
+
+        settings, records = loaded
+        start_name = settings["root"]
+
+        if not records:
+            return self.build_graph_from_article(start_name, settings["queue"], verbose)
+
+        sorter = self.__create_sorter()
+        start_title = self.__titles.canonicalize(start_name)
+        self.__queue = self.__create_queue(settings["queue"], start_title)
+
+        journal = self.__journal
+        self.__journal = None
+        taken_entries = self.__replay(records)
+        self.__journal = journal
+
+        if taken_entries:
+            self.__returned_entries = deque(taken_entries)
+            self.__journal.record("R", [entry.get_name() for entry in taken_entries])
+
+        report_statement = '' \
+        f'Resumed build of {start_name} from {len(records)} journal records: ' \
+        f'{len(self.__nodes)} nodes, {len(self.__edges)} edges, {len(taken_entries)} articles to fetch again'
+
+        print(report_statement)
+
+        return self.__continue_build(sorter, start_name, verbose)
+
+    def __create_sorter(self) -> Sorter | DumpSorter:
+        """
+        Returns the object articles are requested with: a sorter reading the local dump if one is used,
+        otherwise a sorter requesting wikipedia with the stores, parse pool and fetch profile of the builder
+        """
+
+        if self.__dump_index:
+            return DumpSorter(self.__dump_index)
+
+        return Sorter(self.__requester, self.__article_store, self.__redirect_map, self.__parse_pool, self.__fetch_profile)
+
+    def __create_queue(self, queue_type:str, start_title:str) -> WikiGraphQueue:
+        """
+        Returns a new empty queue of the given type
+
+        Parameters:
+        -----------
+        queue_type : str
+            The type of queue to use, (n) normal, (p) priority, (b) bucket or (s) spilling
+
+        start_title : str
+            The canonical title of the root article, which the queue blacklists
+        """
+
+        assert queue_type in ["n", "p", "b", "s"]
+        match queue_type:
+            case "n":
+                return NormalQueue(start_title)
+            case "p":
+                return PriorityQueue(start_title)
+            case "b":
+                return BucketQueue(start_title)
+            case _:
+                return SpillQueue(start_title)
+
+    def __replay(self, records:list[list]) -> list[QueueEntry]:
+        """
+        Applies the recorded changes of a journal to the empty builder state in their original order.
+        Returns the entries that were taken but not integrated before the last checkpoint, in the order they were taken,
+        followed by the returned entries of an earlier resume that weren't taken again yet
+
+        Parameters:
+        -----------
+        records : list[list]
+            The records of the journal, each starting with the kind of change
+        """
+
+        taken_entries:dict[str, QueueEntry] = {}
+
+        for record in records:
+            match record[0]:
+                case "N":
+                    self.__add_node(record[1], record[2], record[3], record[4], record[5] if len(record) > 5 else 0)
+                case "E":
+                    self.__edges.update(Edge(start_id, end_id) for start_id, end_id in record[1])
+                case "A":
+                    self.__add_alias(record[1], record[2])
+                case "X":
+                    self.__add_to_blacklist(record[1])
+                case "Q":
+                    self.__queue.add_new_entries(record[1], record[2], record[3], False)
+                case "U":
+                    self.__queue.only_update_entries(record[1], record[2], record[3], False)
+                case "T":
+                    taken_entry = self.__returned_entries.popleft() if self.__returned_entries else self.__queue.get_next_entry()
+                    assert taken_entry and taken_entry.get_name() == record[1]
+                    taken_entries[record[1]] = taken_entry
+                case "O":
+                    taken_entries[record[1]].add_origin(record[2], record[3])
+                case "D":
+                    del taken_entries[record[1]]
+                case "R":
+                    self.__returned_entries.extend(taken_entries.pop(name) for name in record[1])
+
+        returned_entries = list(taken_entries.values()) + list(self.__returned_entries)
+        self.__returned_entries.clear()
+
+        return returned_entries
+
+    def __continue_build(self, sorter:Sorter | DumpSorter, start_name:str, verbose:bool) -> Graph:
+        """
+        Runs the build loop from the current state until the graph is complete, writes the last checkpoint and returns the graph
+
+        Parameters:
+        -----------
+        sorter : Sorter | DumpSorter
+            The object to request articles with
+
+        start_name : str
+            The name of the root article
+
+        verbose : bool
+            If the action should be logged verbosely
+        """
 
         self.__run_build_loop(sorter, verbose)
+        self.__resolve_pending_links(verbose)
+
+        if self.__journal:
+            self.__journal.checkpoint()
+
+        if verbose and self.__dump_index:
+            dump_stats = self.__dump_index.get_stats()
 
-        if verbose:
             report_statement = '' \
-            'Graph creation finished.'
+            'Graph creation finished.\n' \
+            f'Read {dump_stats["found"]} articles from the dump ({dump_stats["redirected"]} through redirects), ' \
+            f'{dump_stats["missing"]} were not in the dump'
+
+            print(report_statement)
+        elif verbose:
+            connection_stats = self.__requester.get_connection_stats()
+
+            report_statement = '' \
+            'Graph creation finished.\n' \
+            f'Sent {connection_stats["requests"]} requests over {connection_stats["connections"]} connections ' \
+            f'({connection_stats["reused"]} reused a kept-alive connection)'
+
+            title_stats = self.__titles.get_stats()
+            report_statement += '\n' \
+            f'Title index: {title_stats["lookups"]} lookups, {title_stats["folded"]} names folded into their canonical title, ' \
+            f'{len(self.__aliases)} other names collapsed onto their node'
+
+            if self.__redirect_map:
+                redirect_stats = self.__redirect_map.get_stats()
+                report_statement += '\n' \
+                f'Redirect map: {redirect_stats["resolved"]} links resolved before queueing, {redirect_stats["stored"]} redirects recorded'
+
+            if self.__title_resolver:
+                resolver_stats = self.__title_resolver.get_stats()
+                report_statement += '\n' \
+                f'Title resolver: {resolver_stats["requested"]} new titles resolved with {resolver_stats["requests"]} requests, ' \
+                f'{resolver_stats["no_articles"]} were no articles, {resolver_stats["redirects"]} redirects, {resolver_stats["known"]} already known'
+
+            if self.__prefetch_stats:
+                taken = self.__prefetch_stats["hits"] + self.__prefetch_stats["misses"]
+                hit_rate = 100 * self.__prefetch_stats["hits"] / taken if taken else 0.0
+                report_statement += '\n' \
+                f'Prefetch: {self.__prefetch_stats["hits"]} hits, {self.__prefetch_stats["misses"]} misses ({hit_rate:.1f}% hit rate), ' \
+                f'{self.__prefetch_stats["discarded"]} of {self.__prefetch_stats["prefetched"]} prefetched articles discarded, ' \
+                f'{self.__prefetch_stats["wasted"]} of them after their fetch had started'
+
+            if self.__parse_pool:
+                parse_stats = self.__parse_pool.get_stats()
+                report_statement += '\n' \
+                f'Parse pool: {parse_stats["extracted"]} articles ({parse_stats["characters"] / 1e6:.1f} million characters of html) ' \
+                f'extracted in {parse_stats["processes"]} worker processes'
+
+            rate_stats = self.__requester.get_rate_stats()
+            report_statement += '\n' \
+            f'Throughput: {rate_stats["throughput"]:.1f} requests per second, {rate_stats["throttled"]} throttled requests, ' \
+            f'ending at {rate_stats["limit"]} requests in flight'
+
+            cache_stats = self.__requester.get_cache_stats()
+            if cache_stats:
+                report_statement += '\n' \
+                f'Response cache: {cache_stats["hits"]} hits, {cache_stats["misses"]} misses, ' \
+                f'{cache_stats["revalidated"]} revalidated, {cache_stats["evictions"]} evicted'
+
+            if self.__article_store:
+                store_stats = self.__article_store.get_stats()
+                report_statement += '\n' \
+                f'Article store: {store_stats["memory_hits"]} memory hits, {store_stats["disk_hits"]} disk hits, {store_stats["misses"]} misses'
 
             print(report_statement)
 
@@ -159,22 +617,30 @@ class GraphBuilder:
 
         return network
 
-    def __run_build_loop(self, sorter:Sorter, verbose:bool) -> None:
+    def __run_build_loop(self, sorter:Sorter | DumpSorter, verbose:bool) -> None:
         """
         The main loop to build a graph to request an article, add the content to the graph
         and extend the queue with the found links
 
         Parameters:
         -----------
-        sorter : Sorter
+        sorter : Sorter | DumpSorter
             The object to request articles with
 
         verbose : bool
             Should the action be logged verbosely
         """
 
+        if self.__workers > 1 or self.__batch_size > 1:
+            self.__run_concurrent_build_loop(sorter, verbose)
+            return None
+
+        if self.__prefetch_window > 0:
+            self.__run_prefetching_build_loop(sorter, verbose)
+            return None
+
         while len(self.__nodes) < self.__max_graph_size:
-            next_queue_entry = self.__queue.get_next_entry()
+            next_queue_entry = self.__next_queue_entry(verbose)
 
             if next_queue_entry == None:
                 end_statement = '' \
@@ -183,47 +649,257 @@ class GraphBuilder:
                 print(end_statement)
                 break
 
-            article_name = next_queue_entry.get_name()
-            article_depth = next_queue_entry.get_depth()
-            
-            if verbose:
-                report_statement = '' \
-                f'\nNext queue entry: {article_name} at depth {article_depth}'
+            new_info = sorter.get_content(next_queue_entry.get_name(), verbose)
 
-                print(report_statement)
+            self.__integrate_article(next_queue_entry, new_info, verbose)
+            self.__checkpoint_if_due(verbose)
             
-            new_info = sorter.get_content(article_name, verbose)
+        return None
 
-            if not new_info:
-                warning_statement = '' \
-                f'Failed to get wikipedia article for {article_name}\n' \
-                'Skipping and blacklisting'
+    def __run_prefetching_build_loop(self, sorter:Sorter | DumpSorter, verbose:bool) -> None:
+        """
+        The serial main loop, fetching the next __prefetch_window queue entries in the background
+        right after an entry is taken, so they are ready when the queue returns them.
+        Entries whose ranking changed are kept for later until the prefetcher discards them
 
-                self.__queue.add_article_to_blacklist(article_name)
-                print(warning_statement)
-                continue
+        Parameters:
+        -----------
+        sorter : Sorter | DumpSorter
+            The object to request articles with
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        prefetcher = Prefetcher(sorter.get_content, self.__prefetch_window)
+
+        while len(self.__nodes) < self.__max_graph_size:
+            next_queue_entry = self.__next_queue_entry(verbose)
+
+            if next_queue_entry == None:
+                end_statement = '' \
+                'Ending graph building early as queue is empty'
+
+                print(end_statement)
+                break
+
+            prefetcher.prefetch([entry.get_name() for entry in self.__queue.peek_entries(self.__prefetch_window)])
+            new_info = prefetcher.take(next_queue_entry.get_name(), verbose)
+
+            self.__integrate_article(next_queue_entry, new_info, verbose)
+            self.__checkpoint_if_due(verbose)
+
+        prefetcher.close()
+        self.__prefetch_stats = prefetcher.get_stats()
+        return None
+
+    def __run_concurrent_build_loop(self, sorter:Sorter | DumpSorter, verbose:bool) -> None:
+        """
+        The main loop to build a graph while keeping up to __workers requests in flight,
+        each covering up to __batch_size articles.
+        Fetched articles are integrated in the order they were taken from the queue,
+        so the resulting graph doesn't depend on which request finishes first
+
+        Parameters:
+        -----------
+        sorter : Sorter | DumpSorter
+            The object to request articles with
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        in_flight:deque[tuple[list[QueueEntry], Future]] = deque()
+
+        with ThreadPoolExecutor(max_workers = self.__workers) as executor:
+            while len(self.__nodes) < self.__max_graph_size:
+                while len(in_flight) < self.__workers:
+                    next_queue_entries = self.__next_queue_entries(verbose)
 
-            article_id = new_info.get("id")
-            assert article_id
-            assert isinstance(article_id, int)
+                    if not next_queue_entries:
+                        break
 
-            new_keywords = new_info.get("keywords")
-            assert new_keywords
-            assert isinstance(new_keywords, list)
+                    names = [entry.get_name() for entry in next_queue_entries]
+                    future = executor.submit(self.__fetch_articles, sorter, names, verbose)
+                    in_flight.append((next_queue_entries, future))
 
+                    for entry in next_queue_entries:
+                        self.__in_flight[entry.get_name()] = entry
+
+                if not in_flight:
+                    end_statement = '' \
+                    'Ending graph building early as queue is empty'
+
+                    print(end_statement)
+                    break
+
+                next_queue_entries, future = in_flight.popleft()
+                contents = future.result()
+
+                for entry in next_queue_entries:
+                    del self.__in_flight[entry.get_name()]
+                    self.__integrate_article(entry, contents.get(entry.get_name()), verbose)
+
+                self.__checkpoint_if_due(verbose)
+
+            for _, future in in_flight:
+                future.cancel()
+
+        self.__in_flight.clear()
+        return None
+
+    def __next_queue_entries(self, verbose:bool) -> list[QueueEntry]:
+        """
+        Takes up to __batch_size entries from the queue, without exceeding the maximum graph size
+        together with the nodes and entries already in flight
+
+        Parameters:
+        -----------
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        free_slots = self.__max_graph_size - len(self.__nodes) - len(self.__in_flight)
+        next_queue_entries = []
+
+        while len(next_queue_entries) < min(self.__batch_size, free_slots):
+            next_queue_entry = self.__next_queue_entry(verbose)
+
+            if next_queue_entry == None:
+                break
+
+            next_queue_entries.append(next_queue_entry)
+
+        return next_queue_entries
+
+    def __fetch_articles(self, sorter:Sorter | DumpSorter, names:list[str], verbose:bool) -> dict[str, dict[str, Any] | None]:
+        """
+        Requests the given articles, in one batched query if more than one is given
+
+        Parameters:
+        -----------
+        sorter : Sorter | DumpSorter
+            The object to request articles with
+
+        names : list[str]
+            The names of the articles
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        if len(names) == 1:
+            return {names[0] : sorter.get_content(names[0], verbose)}
+
+        return sorter.get_contents(names, verbose)
+
+    def __next_queue_entry(self, verbose:bool) -> QueueEntry | None:
+        """
+        Takes the next entry, the entries returned by a resume first, or returns None if the queue is empty
+
+        Parameters:
+        -----------
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        if self.__returned_entries:
+            next_queue_entry = self.__returned_entries.popleft()
+        else:
+            next_queue_entry = self.__queue.get_next_entry()
+
+        if next_queue_entry == None and self.__unresolved_links:
+            self.__resolve_pending_links(verbose)
+            next_queue_entry = self.__queue.get_next_entry()
+
+        if next_queue_entry == None:
+            return None
+
+        if self.__journal:
+            self.__journal.record("T", next_queue_entry.get_name())
+
+        if verbose:
             report_statement = '' \
-            f'({len(self.__nodes.items()) + 1}|{self.__max_graph_size})'
+            f'\nNext queue entry: {next_queue_entry.get_name()} at depth {next_queue_entry.get_depth()}'
 
-            if verbose:
-                report_statement += f'Adding Node \"{article_name}\" with id {article_id}'
-                
             print(report_statement)
-            
-            self.__add_node(article_id, article_name, new_keywords, article_depth)
-            self.__add_edges_toward_node(next_queue_entry.get_origins(), article_id, verbose)
 
-            self.__build_edges_from_links(article_depth, new_info, article_id, verbose)
+        return next_queue_entry
+
+    def __integrate_article(self, queue_entry:QueueEntry, new_info:dict[str, Any] | None, verbose:bool) -> None:
+        """
+        Adds the fetched article of a queue entry as a node, builds its edges and updates the queue from its links.
+        If the article already is a node under another name (e.g. the entry was a redirect), only the edges toward it are added.
+        Blacklists the article instead if it couldn't be fetched
+
+        Parameters:
+        -----------
+        queue_entry : QueueEntry
+            The queue entry the article was requested for
+
+        new_info : dict[str, Any] | None
+            The sorted information from the article or None if the request failed
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        article_name = queue_entry.get_name()
+        article_depth = queue_entry.get_depth()
+
+        if self.__journal:
+            self.__journal.record("D", article_name)
+
+        if not new_info:
+            warning_statement = '' \
+            f'Failed to get wikipedia article for {article_name}\n' \
+            'Skipping and blacklisting'
+
+            self.__add_to_blacklist(article_name)
+            print(warning_statement)
+            return None
+
+        article_id = new_info.get("id")
+        assert article_id
+        assert isinstance(article_id, int)
+
+        new_keywords = new_info.get("keywords")
+        assert new_keywords != None
+        assert isinstance(new_keywords, list)
+
+        article_title = new_info.get("name", article_name)
+        assert isinstance(article_title, str)
+        title_key = self.__titles.canonicalize(article_title)
+        self.__add_to_blacklist(title_key)
+
+        if title_key != article_name:
+            self.__add_alias(article_name, title_key)
+
+        if article_id in self.__node_titles:
+            self.__add_alias(article_name, self.__node_titles[article_id])
+
+            if verbose:
+                report_statement = '' \
+                f'{article_name} is another name of the existing node {self.__node_titles[article_id]}, only adding its edges'
+
+                print(report_statement)
+
+            self.__add_edges_toward_node(queue_entry.get_origins(), article_id, verbose)
+            return None
+
+        report_statement = '' \
+        f'({len(self.__nodes.items()) + 1}|{self.__max_graph_size})'
+
+        if verbose:
+            report_statement += f'Adding Node \"{article_title}\" with id {article_id}'
             
+        print(report_statement)
+        
+        self.__add_node(article_id, article_title, new_keywords, article_depth, new_info.get("revision", 0))
+        self.__add_edges_toward_node(queue_entry.get_origins(), article_id, verbose)
+
+        self.__build_edges_from_links(article_depth, new_info, article_id, verbose)
+
         return None
 
     def __build_edges_from_links(self, article_depth:int, new_info:dict[str, Any], article_id:int, verbose:bool) -> None:
@@ -245,9 +921,6 @@ class GraphBuilder:
             Should the action be logged verbosely
         """
 
-        new_links = []
-        build_links = []
-        
         links = new_info.get("links")
         assert links != None
         assert isinstance(links, list)
@@ -257,10 +930,48 @@ class GraphBuilder:
             f'Found {len(links)} outgoing links from node'
 
             print(report_statement)
-        
-        for link in links:
+
+        self.__sort_links(article_depth, article_id, *self.__canonicalize_links(links), verbose)
+
+        if len(self.__unresolved_links) >= 50:
+            self.__resolve_pending_links(verbose)
+
+        return None
+
+    def __sort_links(self, article_depth:int, article_id:int, titles:list[str], unresolved_titles:list[str], verbose:bool) -> None:
+        """
+        Builds edges for links to existing nodes, adds the source as origin to entries in flight and updates the queue from the other links.
+        Links to titles the title resolver doesn't know yet are held back until enough of them are collected for a batch
+
+        Parameters:
+        -----------
+        article_depth : int
+            The article depth of the link source
+
+        article_id : int
+            The id of the source article
+
+        titles : list[str]
+            The canonical titles the source article links to
+
+        unresolved_titles : list[str]
+            The canonical titles the source article links to that are not resolved yet
+
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        new_links = []
+        build_links = []
+
+        for link in titles:
             if link in self.__nodes.keys():
                 build_links.append(link)
+            elif link in self.__in_flight.keys():
+                self.__in_flight[link].add_origin(article_id, article_depth)
+
+                if self.__journal:
+                    self.__journal.record("O", link, article_id, article_depth)
             else: 
                 new_links.append(link)
 
@@ -269,6 +980,43 @@ class GraphBuilder:
         
         self.__update_queue_from_links(article_depth, article_id, new_links, verbose)
 
+        if article_depth < self.__max_depth:
+            for title in unresolved_titles:
+                self.__unresolved_links.setdefault(title, []).append((article_id, article_depth))
+
+        return None
+
+    def __resolve_pending_links(self, verbose:bool) -> None:
+        """
+        Resolves the held back titles with the title resolver in batches and sorts the links to them
+        for every article they were found in. Links that lead to no article are dropped
+
+        Parameters:
+        -----------
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        if not (self.__title_resolver and self.__unresolved_links):
+            return None
+
+        unresolved_links = self.__unresolved_links
+        self.__unresolved_links = {}
+        resolved = self.__title_resolver.resolve(self.__requester, list(unresolved_links.keys()), verbose)
+        origin_links:dict[tuple[int, int], list[str]] = {}
+
+        for title, origins in unresolved_links.items():
+            target = resolved.get(title, title)
+
+            if not target:
+                continue
+
+            for origin in origins:
+                origin_links.setdefault(origin, []).append(self.__aliases.get(target, target))
+
+        for (article_id, article_depth), titles in origin_links.items():
+            self.__sort_links(article_depth, article_id, list(dict.fromkeys(titles)), [], verbose)
+
         return None
 
     def __update_queue_from_links(self, article_depth:int, article_id:int, new_links:list[str], verbose:bool) -> None:
@@ -299,6 +1047,9 @@ class GraphBuilder:
         if article_depth < self.__max_depth:
             self.__queue.add_new_entries(new_links, article_id, article_depth, verbose)
 
+            if self.__journal:
+                self.__journal.record("Q", new_links, article_id, article_depth)
+
         else:
             if verbose:
                 report_statement = '' \
@@ -307,6 +1058,9 @@ class GraphBuilder:
                 print(report_statement)
             self.__queue.only_update_entries(new_links, article_id, article_depth, verbose)
 
+            if self.__journal:
+                self.__journal.record("U", new_links, article_id, article_depth)
+
         return None
 
     def __build_egdes_to_existing_nodes(self, article_id:int, build_links:list[str], verbose:bool) -> None:
@@ -331,15 +1085,18 @@ class GraphBuilder:
 
             print(report_statement)
         
-        ids = [node.get_id() for node in self.__nodes.values() if node.get_name() in build_links]
+        ids = [self.__nodes[link].get_id() for link in build_links]
 
         for id in ids:
             new_edge = Edge(article_id, id)
             self.__edges.add(new_edge)
 
+        if self.__journal and ids:
+            self.__journal.record("E", [[article_id, id] for id in ids])
+
         return None
 
-    def __add_node(self, node_id:int, node_name:str, node_data:list[str], node_depth:int) -> None:
+    def __add_node(self, node_id:int, node_name:str, node_data:list[str], node_depth:int, node_revision:int) -> None:
         """
         Adding a new node
 
@@ -356,21 +1113,139 @@ class GraphBuilder:
 
         node_depth : int
             The depth of the article
+
+        node_revision : int
+            The revision ID of the article, 0 if unknown
         """
 
-        new_node = Node(id = node_id, name = node_name, keywords = node_data, depth = node_depth)
+        new_node = Node(id = node_id, name = node_name, keywords = node_data, depth = node_depth, revision = node_revision)
+
+        title_key = self.__titles.canonicalize(node_name)
+        self.__nodes[title_key] = new_node
+        self.__node_titles[node_id] = title_key
 
-        self.__nodes[node_name] = new_node
+        if self.__journal:
+            self.__journal.record("N", node_id, node_name, node_data, node_depth, node_revision)
 
         return None
 
-    def __add_edges_toward_node(self, id_list:list[int], node_id:int, verbose:bool) -> None:
+    def __add_to_blacklist(self, title:str) -> None:
+        """
+        Blacklists a title in the queue, so it isn't queued again
+
+        Parameters:
+        -----------
+        title : str
+            The canonical title
+        """
+
+        self.__queue.add_article_to_blacklist(title)
+
+        if self.__journal:
+            self.__journal.record("X", title)
+
+        return None
+
+    def __add_alias(self, name:str, title:str) -> None:
+        """
+        Remembers that a canonical title is another name of the node with the given title
+
+        Parameters:
+        -----------
+        name : str
+            The other name of the node
+
+        title : str
+            The canonical title of the node
+        """
+
+        self.__aliases[name] = title
+
+        if self.__journal:
+            self.__journal.record("A", name, title)
+
+        return None
+
+    def __checkpoint_if_due(self, verbose:bool) -> None:
+        """
+        Writes a checkpoint of the journal if one is due. Held back links are resolved first,
+        so the journal describes the complete builder state at every checkpoint
+
+        Parameters:
+        -----------
+        verbose : bool
+            Should the action be logged verbosely
+        """
+
+        if not (self.__journal and self.__journal.is_due()):
+            return None
+
+        self.__resolve_pending_links(verbose)
+        self.__journal.checkpoint()
+
+        if verbose:
+            report_statement = '' \
+            f'Wrote checkpoint at {len(self.__nodes)} nodes to {self.__journal.get_file_name()}'
+
+            print(report_statement)
+
+        return None
+
+    def __canonicalize_links(self, links:list[str]) -> tuple[list[str], list[str]]:
+        """
+        Returns the canonical titles of the articles links point to, each title once and in the order of the links.
+        Links to known redirects or other names of a node are resolved to the title of the article.
+        If a title resolver is used, titles it knows are resolved and dropped if they lead to no article of the main namespace,
+        the titles it doesn't know yet are returned separately
+
+        Parameters:
+        -----------
+        links : list[str]
+            The links as found in the article
+        """
+
+        titles = []
+
+        for link in links:
+            title = self.__titles.canonicalize(link)
+            alias_title = self.__aliases.get(title)
+
+            if alias_title:
+                titles.append(alias_title)
+                continue
+
+            redirect = self.__redirect_map.resolve(title) if self.__redirect_map else None
+            titles.append(redirect[0] if redirect else title)
+
+        titles = list(dict.fromkeys(titles))
+
+        if not self.__title_resolver:
+            return titles, []
+
+        unknown_titles = [title for title in titles if title not in self.__nodes and title not in self.__in_flight]
+        known_titles = self.__title_resolver.lookup(unknown_titles)
+        unresolved_titles = [title for title in unknown_titles if title not in known_titles]
+        unresolved_title_set = set(unresolved_titles)
+        resolved_titles:list[str] = []
+
+        for title in titles:
+            if title in unresolved_title_set:
+                continue
+
+            resolved_title = known_titles.get(title, title)
+
+            if resolved_title is not None:
+                resolved_titles.append(self.__aliases.get(resolved_title, resolved_title))
+
+        return list(dict.fromkeys(resolved_titles)), unresolved_titles
+
+    def __add_edges_toward_node(self, id_list:tuple[int, ...], node_id:int, verbose:bool) -> None:
         """
         Adding edges towards a node
 
         Parameters:
         -----------
-        id_list : list[int]
+        id_list : tuple[int, ...]
             The id's of nodes that link towards the article
 
         node_id : int
@@ -390,6 +1265,9 @@ class GraphBuilder:
             new_edge = Edge(start_id = connection_id, end_id = node_id)
             self.__edges.add(new_edge)
 
+        if self.__journal and id_list:
+            self.__journal.record("E", [[connection_id, node_id] for connection_id in id_list])
+
         return None
 
 
@@ -0,0 +1,27 @@
+import os
+
+
+def get_project_folder(name:str) -> str:
+    """
+    Returns the location of the folder named name in the project folder, next to the txtfiles and images folders,
+    and creates it if it doesn't exist yet. The stores keep their default files in the cache folder
+
+    Parameters:
+    -----------
+    name : str
+        The name of the folder, e.g. cache or journals
+    """
+
+    project_folder = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+    folder = os.path.join(project_folder, name)
+    os.makedirs(folder, exist_ok = True)
+    return folder
+
+
+def main() -> int:
+    print("Calling main function in project_folder")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,587 @@
+from logic.fetch.requester import Requester
+from logic.fetch.article_extractor import ArticleExtractor
+
+from collections import deque
+from itertools import accumulate
+from typing import Any
+from urllib.parse import quote, unquote
+
+import json
+import os
+import random
+import re
+
+
+class Corpus:
+    """
+    A class holding the articles a stand-in api serves, either recorded from wikipedia into a folder of
+    action=parse responses or generated from a seed. Generated articles link to each other with a skewed
+    popularity, so some articles are linked from many others like on wikipedia, some links point to redirects,
+pages of other namespaces or missing articles
+
+    Attributes:
+    -----------
+    __articles : dict[str, dict[str, Any]]
+        The articles by title, each with page ID, revision ID, html, linked titles and plain intro text
+
+    __redirects : dict[str, dict[str, Any]]
+        The redirects by title, each with its page ID and the title of the article it points to
+
+    __namespace_pages : dict[str, dict[str, Any]]
+        The linked pages outside of the main namespace by title, in the same form as articles with their namespace number
+
+    Methods:
+    --------
+    record(requester : Requester, start_name : str, amount : int, folder : str) -> int
+        Requests articles from wikipedia, starting at start_name, and saves their responses into folder
+
+    get_titles() -> list[str]
+        Returns the titles of all articles
+
+    get_article(title : str) -> dict[str, Any] | None
+        Returns an article by title in any form
+
+    get_redirect(title : str) -> dict[str, Any] | None
+        Returns a redirect by title in any form
+
+    get_namespace_page(title : str) -> dict[str, Any] | None
+        Returns a page outside of the main namespace by title in any form
+
+    normalize(title : str) -> str
+        Returns the canonical form of a title
+
+    get_parse_response(title : str, properties : list[str] | None) -> dict | None
+        Returns the action=parse response for an article, with the rendered html or with the requested properties only
+
+    get_query_page(title : str) -> dict
+        Returns the page of a batched action=query response (formatversion 2) for an article or redirect, without links
+
+    edit_articles(amount : int, seed : int) -> list[str]
+        Edits some articles like authors would, giving each a new revision, and returns their titles
+    """
+
+
+    def __init__(self, folder:str | None = None, size:int = 1000, paragraphs:int = 40, links_per_article:int = 40, seed:int = 42) -> None:
+        """
+        Sets up the object by loading the recorded responses in folder or generating articles if no folder is given
+
+        Parameters:
+        -----------
+        folder : str | None
+            The folder with recorded action=parse responses (*.json). Articles are generated if None is given
+
+        size : int
+            The amount of generated articles
+
+        paragraphs : int
+            The amount of paragraphs of each generated article
+
+        links_per_article : int
+            The amount of links of each generated article
+
+        seed : int
+            The seed of the generated articles
+        """
+
+        self.__articles:dict[str, dict[str, Any]] = {}
+        self.__redirects:dict[str, dict[str, Any]] = {}
+        self.__namespace_pages:dict[str, dict[str, Any]] = {}
+
+        if folder:
+            self.__load(folder)
+        else:
+            self.__generate(size, paragraphs, links_per_article, seed)
+
+        return None
+
+    def record(self, requester:Requester, start_name:str, amount:int, folder:str) -> int:
+        """
+        Requests up to amount articles from wikipedia in breadth first order starting at start_name and saves
+        each action=parse response as <page ID>.json into folder, so it can be served later.
+        Returns the amount of saved articles
+
+        Parameters:
+        -----------
+        requester : Requester
+            The requester to fetch the articles with
+
+        start_name : str
+            The name of the first article
+
+        amount : int
+            The maximum amount of articles to record
+
+        folder : str
+            The folder to save the responses into
+        """
+
+        os.makedirs(folder, exist_ok = True)
+        names = deque([start_name])
+        seen = {self.normalize(start_name)}
+        saved = 0
+
+        while names and saved < amount:
+            response = requester.request_content(names.popleft())
+
+            if not response or "parse" not in response:
+                continue
+
+            with open(os.path.join(folder, f'{response["parse"]["pageid"]}.json'), "w", encoding = "UTF8") as file:
+                json.dump(response, file, ensure_ascii = False)
+
+            saved += 1
+
+            for link in self.__find_links(response["parse"]["text"]["*"]):
+                if link not in seen:
+                    seen.add(link)
+                    names.append(link)
+
+        report_statement = '' \
+        f'Recorded {saved} articles into {folder}'
+
+        print(report_statement)
+        return saved
+
+    def get_titles(self) -> list[str]:
+        """
+        Returns the titles of all articles
+        """
+
+        return list(self.__articles.keys())
+
+    def get_article(self, title:str) -> dict[str, Any] | None:
+        """
+        Returns the article with its page ID, revision ID, html, linked titles and intro text,
+        or None if the corpus doesn't contain it
+
+        Parameters:
+        -----------
+        title : str
+            The title of the article, in any form
+        """
+
+        return self.__articles.get(self.normalize(title))
+
+    def get_redirect(self, title:str) -> dict[str, Any] | None:
+        """
+        Returns the redirect with its title, page ID and the title of the article it points to,
+        or None if the corpus doesn't contain such a redirect
+
+        Parameters:
+        -----------
+        title : str
+            The title of the redirect, in any form
+        """
+
+        return self.__redirects.get(self.normalize(title))
+
+    def get_namespace_page(self, title:str) -> dict[str, Any] | None:
+        """
+        Returns the page outside of the main namespace with its namespace number, page ID, revision ID and html,
+        or None if the corpus doesn't contain it
+
+        Parameters:
+        -----------
+        title : str
+            The title of the page, in any form
+        """
+
+        return self.__namespace_pages.get(self.normalize(title))
+
+    def normalize(self, title:str) -> str:
+        """
+        Returns the canonical form of a title: decoded, underscores as spaces, first letter upper case
+
+        Parameters:
+        -----------
+        title : str
+            The title in any form
+        """
+
+        normalized = " ".join(unquote(title).replace("_", " ").split())
+        return normalized[:1].upper() + normalized[1:]
+
+    def get_parse_response(self, title:str, properties:list[str] | None = None) -> dict | None:
+        """
+        Returns the action=parse response for an article or a page of another namespace,
+        or None if the corpus doesn't contain it. Without properties the response holds the rendered html (formatversion 1),
+        otherwise only the requested links, displaytitle, wikitext and revid (formatversion 2).
+        The wikitext is written back from the html, so both forms describe the same text and links
+
+        Parameters:
+        -----------
+        title : str
+            The title of the article, in any form
+
+        properties : list[str] | None
+            The requested properties (prop). The html is answered if None is given
+        """
+
+        article = self.get_article(title) or self.get_namespace_page(title)
+
+        if not article:
+            return None
+
+        if properties:
+            parse:dict[str, Any] = {"title" : article["title"], "pageid" : article["pageid"]}
+
+            if "revid" in properties:
+                parse["revid"] = article["revid"]
+
+            if "displaytitle" in properties:
+                parse["displaytitle"] = f'<span class="mw-page-title-main">{article["title"]}</span>'
+
+            if "links" in properties:
+                parse["links"] = self.__list_links(article["html"])
+
+            if "wikitext" in properties:
+                parse["wikitext"] = self.__write_wikitext(article["html"])
+
+            return {"parse" : parse}
+
+        return {
+            "parse" : {
+                "title" : article["title"],
+                "pageid" : article["pageid"],
+                "revid" : article["revid"],
+                "text" : {"*" : article["html"]}
+            }
+        }
+
+    def get_query_page(self, title:str) -> dict:
+        """
+        Returns the page of a batched action=query response (formatversion 2) for an article,
+        with page info and intro text but without links, the page of a redirect that wasn't followed,
+        the page of another namespace or a missing page if the corpus doesn't contain it
+
+        Parameters:
+        -----------
+        title : str
+            The title of the article, in any form
+        """
+
+        article = self.get_article(title)
+        redirect = self.get_redirect(title)
+
+        if redirect:
+            return {"pageid" : redirect["pageid"], "ns" : 0, "title" : redirect["title"], "redirect" : True, "extract" : ""}
+
+        if not article:
+            article = self.get_namespace_page(title)
+
+        if not article:
+            return {"ns" : 0, "title" : self.normalize(title), "missing" : True}
+
+        return {
+            "pageid" : article["pageid"],
+            "ns" : article.get("ns", 0),
+            "title" : article["title"],
+            "lastrevid" : article["revid"],
+            "extract" : article["extract"]
+        }
+
+    def edit_articles(self, amount:int, seed:int = 0) -> list[str]:
+        """
+        Edits amount randomly chosen articles: the first linked article of each is unlinked and a paragraph
+        linking to three other articles is written in front of the text, so keywords and links change.
+        Every edited article gets a new revision ID, higher than all existing ones. Returns the titles of the edited articles
+
+        Parameters:
+        -----------
+        amount : int
+            The amount of articles to edit
+
+        seed : int
+            The seed choosing the articles and the new links
+        """
+
+        generator = random.Random(seed)
+        titles = [article["title"] for article in self.__articles.values()]
+        edited_titles = generator.sample(titles, min(amount, len(titles)))
+        next_revision = max(article["revid"] for article in self.__articles.values()) + 1
+
+        for title in edited_titles:
+            article = self.__articles[self.normalize(title)]
+            html = article["html"]
+            first_link = re.search(r'<a href="/wiki/[^"]*" title="([^":]*)">', html)
+
+            if first_link:
+                html = re.sub(rf'<a href="/wiki/[^"]*" title="{re.escape(first_link.group(1))}">([^<]*)</a>', r"\1", html)
+
+            new_links = generator.sample(titles, 3)
+            new_words = [f'<a href="/wiki/{quote(link.replace(" ", "_"))}" title="{link}">{link}</a> Bearbeitung' for link in new_links]
+            html = html.replace('<p>', '<p>' + " ".join(new_words) + '</p><p>', 1)
+            links = [link for link in article["links"] if not first_link or link != first_link.group(1)]
+            self.__add_article(article["title"], article["pageid"], next_revision, html, list(dict.fromkeys(links + new_links)))
+            next_revision += 1
+
+        return edited_titles
+
+    def __load(self, folder:str) -> None:
+        """
+        Loads the recorded action=parse responses of a folder
+
+        Parameters:
+        -----------
+        folder : str
+            The folder with the recorded responses
+        """
+
+        for file_name in sorted(os.listdir(folder)):
+            if not file_name.endswith(".json"):
+                continue
+
+            with open(os.path.join(folder, file_name), "r", encoding = "UTF8") as file:
+                parse = json.load(file)["parse"]
+
+            html = parse["text"]["*"]
+            self.__add_article(parse["title"], parse["pageid"], parse.get("revid", 0), html, self.__find_links(html))
+
+            for redirect in parse.get("redirects", []):
+                self.__redirects[self.normalize(redirect["from"])] = {"title" : redirect["from"], "pageid" : 0, "target" : parse["title"]}
+
+        return None
+
+    def __generate(self, size:int, paragraphs:int, links_per_article:int, seed:int) -> None:
+        """
+        Generates articles whose links prefer a few popular articles.
+        Every fourth article can also be reached through a redirect with hyphens instead of spaces, which some links use.
+        Like links written by templates, parentheses in links are percent encoded in some articles and not in others.
+        A few words link to category or portal pages, and a few are red links to missing articles,
+        which only batched queries list as links
+
+        Parameters:
+        -----------
+        size : int
+            The amount of articles
+
+        paragraphs : int
+            The amount of paragraphs of each article
+
+        links_per_article : int
+            The amount of links of each article
+
+        seed : int
+            The seed of the generator
+        """
+
+        generator = random.Random(seed)
+        nouns = ["Linux", "Kernel (Linux)", "Freie Software", "Größe", "Entwickler", "Version", "Lizenz", "Programm", "Rechner", "Netzwerk"]
+        fillers = ["und", "der", "die", "mit", "für", "wird", "ist", "Die", "Der", "eine"]
+        titles = [f"{nouns[index % len(nouns)]} {index}" for index in range(size)]
+        namespaces = {"Kategorie" : 14, "Portal" : 100}
+        popularity = list(accumulate(1 / (rank + 1) for rank in range(size)))
+        aliases = {title : title.replace(" ", "-") for title in titles[::4]}
+
+        for index, (title, alias) in enumerate(aliases.items()):
+            self.__redirects[self.normalize(alias)] = {"title" : alias, "pageid" : size + index + 1, "target" : title}
+
+        for index, title in enumerate(titles):
+            links = generator.choices(titles, cum_weights = popularity, k = links_per_article)
+            link_positions = set(generator.sample(range(paragraphs * 30), min(links_per_article, paragraphs * 30)))
+            pending_links = iter(links)
+            written_links = []
+            html_paragraphs = []
+
+            for paragraph in range(paragraphs):
+                words = []
+
+                for position in range(paragraph * 30, paragraph * 30 + 30):
+                    if position in link_positions:
+                        target = next(pending_links)
+
+                        if target in aliases and generator.random() < 0.5:
+                            target = aliases[target]
+
+                        written_links.append(target)
+                        section = "#Geschichte" if generator.random() < 0.3 else ""
+                        safe_characters = generator.choice(["/:;@$!*(),~", "/"])
+                        words.append(f'<a href="/wiki/{quote(target.replace(" ", "_"), safe = safe_characters)}{section}" title="{target}">{target}</a>')
+                    elif generator.random() < 0.005:
+                        namespace = generator.choice(list(namespaces))
+                        target = f"{namespace}:{generator.choice(nouns)}"
+
+                        if self.normalize(target) not in self.__namespace_pages:
+                            self.__add_namespace_page(target, namespaces[namespace], 2 * size + len(self.__namespace_pages) + 1)
+
+                        words.append(f'<a href="/wiki/{quote(target.replace(" ", "_"))}" title="{target}">{target}</a>')
+                    elif generator.random() < 0.005:
+                        target = f"{generator.choice(nouns)} {size + generator.randrange(size)}"
+                        written_links.append(target)
+                        words.append(f'<a href="/w/index.php?title={quote(target.replace(" ", "_"))}&amp;action=edit&amp;redlink=1" class="new" title="{target} (Seite nicht vorhanden)">{target}</a>')
+                    elif generator.random() < 0.3:
+                        words.append(generator.choice(nouns) + generator.choice(["", ",", "."]))
+                    else:
+                        words.append(generator.choice(fillers))
+
+                html_paragraphs.append("<p>" + " ".join(words) + "</p>")
+
+            html = '' \
+            '<div class="mw-parser-output"><style>.mw-parser-output .infobox{float:right}</style>' + \
+            "\n".join(html_paragraphs) + \
+            '<!-- NewPP limit report --></div>'
+
+            self.__add_article(title, index + 1, 1000000 + index, html, list(dict.fromkeys(written_links)))
+
+        return None
+
+    def __add_article(self, title:str, page_id:int, revision:int, html:str, links:list[str]) -> None:
+        """
+        Adds an article with the plain text of its first paragraph as intro
+
+        Parameters:
+        -----------
+        title : str
+            The title of the article
+
+        page_id : int
+            The page ID of the article
+
+        revision : int
+            The revision ID of the article
+
+        html : str
+            The html of the article
+
+        links : list[str]
+            The titles the article links to
+        """
+
+        first_paragraph = re.search(r'<p>(.*?)</p>', html, re.DOTALL)
+        extract = re.sub(r'<[^>]*>', "", first_paragraph.group(1)) if first_paragraph else ""
+
+        self.__articles[self.normalize(title)] = {
+            "title" : title,
+            "pageid" : page_id,
+            "revid" : revision,
+            "html" : html,
+            "links" : links,
+            "extract" : extract
+        }
+
+        return None
+
+    def __add_namespace_page(self, title:str, namespace:int, page_id:int) -> None:
+        """
+        Adds a page outside of the main namespace without links
+
+        Parameters:
+        -----------
+        title : str
+            The title of the page, including the namespace prefix
+
+        namespace : int
+            The namespace number of the page
+
+        page_id : int
+            The page ID of the page
+        """
+
+        self.__namespace_pages[self.normalize(title)] = {
+            "title" : title,
+            "ns" : namespace,
+            "pageid" : page_id,
+            "revid" : 1000000 + page_id,
+            "html" : f'<div class="mw-parser-output"><p>Diese Seite gehört zum Namensraum {title.split(":")[0]}.</p></div>',
+            "links" : [],
+            "extract" : ""
+        }
+
+        return None
+
+    def __find_link_target(self, href:str) -> str | None:
+        """
+        Returns the canonical title a link of the html points to, or None if it points to a file, a special page or outside the wiki
+
+        Parameters:
+        -----------
+        href : str
+            The target of the link
+        """
+
+        if href.startswith("/wiki/"):
+            target = href[len("/wiki/"):].split("#", 1)[0]
+        elif "redlink=1" in href:
+            target = re.sub(r'.*[?&]title=([^&]*).*', r"\1", href)
+        else:
+            return None
+
+        if not target or "Datei:" in target or "Spezial:" in target:
+            return None
+
+        return self.normalize(target)
+
+    def __list_links(self, html:str) -> list[dict[str, Any]]:
+        """
+        Returns the links of the html like the link list of a parse response (formatversion 2):
+        every linked title once with its namespace and whether the page exists, in order of first appearance
+
+        Parameters:
+        -----------
+        html : str
+            The html of the article
+        """
+
+        links:dict[str, dict[str, Any]] = {}
+
+        for href in re.findall(r'<a href="([^"]*)"', html):
+            target = self.__find_link_target(href.replace("&amp;", "&"))
+
+            if not target or target in links:
+                continue
+
+            namespace_page = self.get_namespace_page(target)
+            exists = bool(self.get_article(target) or self.get_redirect(target) or namespace_page)
+            links[target] = {"ns" : namespace_page["ns"] if namespace_page else 0, "title" : target, "exists" : exists}
+
+        return list(links.values())
+
+    def __write_wikitext(self, html:str) -> str:
+        """
+        Returns the wikitext of an article written back from its html: links become [[target|text]],
+        paragraphs are separated by blank lines and the remaining markup is dropped
+
+        Parameters:
+        -----------
+        html : str
+            The html of the article
+        """
+
+        def write_link(match:re.Match) -> str:
+            target = self.__find_link_target(match.group(1).replace("&amp;", "&"))
+            text = match.group(2)
+
+            if not target:
+                return text
+
+            return f"[[{text}]]" if self.normalize(text) == target else f"[[{target}|{text}]]"
+
+        wikitext = re.sub(r'<style\b.*?</style>|<!--.*?-->', "", html, flags = re.DOTALL)
+        wikitext = re.sub(r'<a href="([^"]*)"[^>]*>([^<]*)</a>', write_link, wikitext)
+        wikitext = wikitext.replace("</p>", "\n\n")
+        wikitext = re.sub(r'<[^>]*>', "", wikitext)
+        return wikitext.strip()
+
+    def __find_links(self, html:str) -> list[str]:
+        """
+        Returns the titles the html of an article links to, each title once
+
+        Parameters:
+        -----------
+        html : str
+            The html of the article
+        """
+
+        extractor = ArticleExtractor()
+        extractor.feed(html)
+        extractor.close()
+        return list(dict.fromkeys(self.normalize(link) for link in extractor.get_links()))
+
+
+def main() -> int:
+    print("Calling main function in corpus")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,500 @@
+from standin.corpus import Corpus
+
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+import gzip
+import json
+import math
+import random
+import threading
+import time
+
+
+class StandinServer:
+    """
+    A class running a local stand-in for the wikipedia api on a free port of 127.0.0.1.
+    It answers action=parse and batched action=query (formatversion 2) requests from a corpus the way Requester expects them,
+    including title normalization, link continuations, ETag / Last-Modified revalidation and gzip.
+    Latency, failing requests and throttling can be configured, so builds can be measured reproducibly without network
+
+    Attributes:
+    -----------
+    __corpus : Corpus
+        The articles that are served
+
+    __latency : float
+        The seconds every response is delayed
+
+    __jitter : float
+        The maximum seconds randomly added to the latency
+
+    __error_rate : float
+        The share of requests answered with status 500
+
+    __rate_limit : float | None
+        The requests per second allowed before answering with 429 and Retry-After, unlimited if None
+
+    __burst : float
+        The amount of requests allowed at once before the rate limit applies
+
+    __lag : float
+        The simulated replication lag in seconds, requests with a lower maxlag are refused
+
+    __links_limit : int
+        The maximum amount of links in one query response, the rest is continued with plcontinue
+
+    __tokens : float
+        The requests currently allowed by the rate limit
+
+    __token_time : float
+        The time the tokens were last refilled
+
+    __generator : random.Random
+        Decides which requests fail and how long the jitter is
+
+    __stats : dict[str, int]
+        The amount of requests, parse and query requests, failed, throttled and lagged requests, 304 responses,
+        articles served more than once and sent bytes
+
+    __served_titles : set[str]
+        The canonical titles of all articles served so far
+
+    __lock : threading.Lock
+        Guards the tokens, the generator and the stats
+
+    __server : ThreadingHTTPServer | None
+        The running http server
+
+    Methods:
+    --------
+    start() -> str
+        Starts serving in the background and returns the api url
+
+    stop() -> None
+        Stops serving
+
+    get_api_url() -> str
+        Returns the api url of the running server
+
+    get_stats() -> dict[str, int]
+        Returns the counted requests and responses
+
+    reset_stats() -> None
+        Sets all counts back to 0
+
+    handle(handler : BaseHTTPRequestHandler) -> None
+        Answers a request of the http server
+    """
+
+
+    def __init__(self, corpus:Corpus, latency:float = 0.0, jitter:float = 0.0, error_rate:float = 0.0, rate_limit:float | None = None, burst:float = 10.0, lag:float = 0.0, links_limit:int = 500, seed:int = 42) -> None:
+        """
+        Sets up the object
+
+        Parameters:
+        -----------
+        corpus : Corpus
+            The articles to serve
+
+        latency : float
+            The seconds every response is delayed
+
+        jitter : float
+            The maximum seconds randomly added to the latency
+
+        error_rate : float
+            The share of requests answered with status 500
+
+        rate_limit : float | None
+            The requests per second allowed before answering with 429 and Retry-After, unlimited if None
+
+        burst : float
+            The amount of requests allowed at once before the rate limit applies
+
+        lag : float
+            The simulated replication lag in seconds, requests with a lower maxlag are refused like wikipedia does
+
+        links_limit : int
+            The maximum amount of links in one query response (500 on wikipedia)
+
+        seed : int
+            The seed deciding which requests fail and how long the jitter is
+        """
+
+        self.__corpus:Corpus = corpus
+        self.__latency:float = latency
+        self.__jitter:float = jitter
+        self.__error_rate:float = error_rate
+        self.__rate_limit:float | None = rate_limit
+        self.__burst:float = burst
+        self.__lag:float = lag
+        self.__links_limit:int = links_limit
+        self.__tokens:float = burst
+        self.__token_time:float = time.monotonic()
+        self.__generator:random.Random = random.Random(seed)
+        self.__stats:dict[str, int] = {}
+        self.__served_titles:set[str] = set()
+        self.__lock:threading.Lock = threading.Lock()
+        self.__server:ThreadingHTTPServer | None = None
+        self.reset_stats()
+        return None
+
+    def start(self) -> str:
+        """
+        Starts serving in a background thread on a free port and returns the api url to give to Requester
+        """
+
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                standin.handle(self)
+                return None
+
+            def log_message(self, format:str, *args) -> None:
+                return None
+
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.__server.daemon_threads = True
+        threading.Thread(target = self.__server.serve_forever, daemon = True).start()
+
+        return self.get_api_url()
+
+    def stop(self) -> None:
+        """
+        Stops serving
+        """
+
+        if self.__server:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+        return None
+
+    def get_api_url(self) -> str:
+        """
+        Returns the api url of the running server
+        """
+
+        assert self.__server
+        return f"http://127.0.0.1:{self.__server.server_address[1]}/w/api.php"
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the amount of requests, parse and query requests, failed, throttled and lagged requests,
+        304 responses, articles served more than once (duplicates) and sent bytes
+        """
+
+        with self.__lock:
+            return dict(self.__stats)
+
+    def reset_stats(self) -> None:
+        """
+        Sets all counts back to 0
+        """
+
+        with self.__lock:
+            self.__stats = {"requests" : 0, "parse" : 0, "query" : 0, "failed" : 0, "throttled" : 0, "lagged" : 0, "not_modified" : 0, "duplicates" : 0, "bytes" : 0}
+            self.__served_titles = set()
+
+        return None
+
+    def handle(self, handler:BaseHTTPRequestHandler) -> None:
+        """
+        Answers a request of the http server. Called from the request threads
+
+        Parameters:
+        -----------
+        handler : BaseHTTPRequestHandler
+            The handler of the request
+        """
+
+        parameters = {key : values[0] for key, values in parse_qs(urlparse(handler.path).query).items()}
+        action = parameters.get("action")
+
+        with self.__lock:
+            self.__stats["requests"] += 1
+            if action in ["parse", "query"]:
+                self.__stats[action] += 1
+
+            delay = self.__latency + self.__generator.random() * self.__jitter
+            failed = self.__generator.random() < self.__error_rate
+            retry_after = self.__take_token()
+
+        if delay:
+            time.sleep(delay)
+
+        if retry_after != None:
+            self.__count("throttled")
+            self.__send(handler, 429, {"error" : {"code" : "ratelimited", "info" : "Too many requests"}}, {"Retry-After" : str(retry_after)})
+            return None
+
+        if self.__lag and float(parameters.get("maxlag", "inf")) < self.__lag:
+            self.__count("lagged")
+            lag_error = {"error" : {"code" : "maxlag", "info" : f"Waiting for a database server: {self.__lag} seconds lagged"}}
+            self.__send(handler, 200, lag_error, {"Retry-After" : "1", "MediaWiki-API-Error" : "maxlag"})
+            return None
+
+        if failed:
+            self.__count("failed")
+            self.__send(handler, 500, {"error" : {"code" : "internal_api_error", "info" : "Simulated failure"}}, {})
+            return None
+
+        if action == "parse":
+            self.__handle_parse(handler, parameters)
+        elif action == "query":
+            self.__handle_query(handler, parameters)
+        else:
+            self.__send(handler, 200, {"error" : {"code" : "badvalue", "info" : f"Unrecognized value for parameter \"action\": {action}"}}, {})
+
+        return None
+
+    def __handle_parse(self, handler:BaseHTTPRequestHandler, parameters:dict[str, str]) -> None:
+        """
+        Answers an action=parse request with the html of an article or the properties prop asks for, or with 304 if the revision didn't change.
+        Redirects are followed if the request asks for it, otherwise the redirect page itself is answered
+
+        Parameters:
+        -----------
+        handler : BaseHTTPRequestHandler
+            The handler of the request
+
+        parameters : dict[str, str]
+            The parameters of the request
+        """
+
+        page = parameters.get("page", "")
+        redirect = self.__corpus.get_redirect(page)
+
+        if redirect and not parameters.get("redirects"):
+            target_link = f'<a href="/wiki/{quote(redirect["target"].replace(" ", "_"))}" title="{redirect["target"]}">{redirect["target"]}</a>'
+            redirect_page = {
+                "parse" : {
+                    "title" : redirect["title"],
+                    "pageid" : redirect["pageid"],
+                    "revid" : redirect["pageid"],
+                    "text" : {"*" : f'<div class="redirectMsg"><p>Weiterleitung nach:</p><ul class="redirectText"><li>{target_link}</li></ul></div>'}
+                }
+            }
+
+            self.__send(handler, 200, redirect_page, {})
+            return None
+
+        article = self.__corpus.get_article(redirect["target"] if redirect else page) or self.__corpus.get_namespace_page(page)
+
+        if not article:
+            self.__send(handler, 200, {"error" : {"code" : "missingtitle", "info" : "The page you specified doesn't exist."}}, {})
+            return None
+
+        validators = {
+            "ETag" : f'W/"{article["pageid"]}-{article["revid"]}"',
+            "Last-Modified" : formatdate(1600000000 + article["revid"] % 100000000, usegmt = True)
+        }
+
+        self.__count_served(article["title"])
+
+        if handler.headers.get("If-None-Match") == validators["ETag"]:
+            self.__count("not_modified")
+            self.__send(handler, 304, None, validators)
+            return None
+
+        response = self.__corpus.get_parse_response(article["title"], parameters["prop"].split("|") if parameters.get("prop") else None)
+        assert response
+
+        if redirect:
+            response["parse"]["redirects"] = [{"from" : redirect["title"], "to" : article["title"]}]
+
+        self.__send(handler, 200, response, validators)
+        return None
+
+    def __handle_query(self, handler:BaseHTTPRequestHandler, parameters:dict[str, str]) -> None:
+        """
+        Answers a batched action=query request with the page info, intro text and links of the titles, as far as prop asks for them.
+        Redirects are followed if the request asks for it. At most links_limit links are sent, the rest is continued with plcontinue
+
+        Parameters:
+        -----------
+        handler : BaseHTTPRequestHandler
+            The handler of the request
+
+        parameters : dict[str, str]
+            The parameters of the request
+        """
+
+        titles = parameters.get("titles", "").split("|")
+        properties = parameters.get("prop", "").split("|")
+        links_limit = self.__links_limit if parameters.get("pllimit", "max") == "max" else min(int(parameters["pllimit"]), self.__links_limit)
+        continue_page, continue_link = map(int, parameters.get("plcontinue", "0|0").split("|"))
+        normalized = []
+        redirects = []
+        page_titles = []
+
+        for title in titles:
+            canonical_title = self.__corpus.normalize(title)
+
+            if canonical_title != title:
+                normalized.append({"fromencoded" : False, "from" : title, "to" : canonical_title})
+
+            redirect = self.__corpus.get_redirect(canonical_title)
+
+            if redirect and parameters.get("redirects"):
+                redirects.append({"from" : redirect["title"], "to" : redirect["target"]})
+                canonical_title = redirect["target"]
+
+            page_titles.append(canonical_title)
+
+        pages = []
+        sent_links = 0
+        continuation = None
+
+        for position, canonical_title in enumerate(dict.fromkeys(page_titles)):
+            page = self.__corpus.get_query_page(canonical_title)
+            article = self.__corpus.get_article(canonical_title)
+
+            if "extracts" not in properties:
+                page.pop("extract", None)
+
+            if "info" not in properties:
+                page.pop("lastrevid", None)
+
+            if "links" not in properties:
+                pages.append(page)
+                continue
+
+            if continue_page or continue_link:
+                if position < continue_page or not article:
+                    continue
+
+                page.pop("extract", None)
+            elif not article:
+                pages.append(page)
+                continue
+            else:
+                self.__count_served(article["title"])
+
+            first_link = continue_link if position == continue_page else 0
+            remaining_links = article["links"][first_link:]
+
+            if not continuation and remaining_links:
+                page_links = remaining_links[:links_limit - sent_links]
+                page["links"] = [{"ns" : 0, "title" : link} for link in page_links]
+                sent_links += len(page_links)
+
+                if len(page_links) < len(remaining_links):
+                    continuation = f"{position}|{first_link + len(page_links)}"
+
+            pages.append(page)
+
+        response:dict = {"batchcomplete" : continuation == None, "query" : {"normalized" : normalized, "redirects" : redirects, "pages" : pages}}
+
+        if continuation:
+            response["continue"] = {"plcontinue" : continuation, "continue" : "||"}
+
+        self.__send(handler, 200, response, {})
+        return None
+
+    def __take_token(self) -> int | None:
+        """
+        Takes a token of the rate limit. Returns the seconds to wait if none is left, otherwise None.
+        Only call while holding the lock
+        """
+
+        if self.__rate_limit == None:
+            return None
+
+        now = time.monotonic()
+        self.__tokens = min(self.__burst, self.__tokens + (now - self.__token_time) * self.__rate_limit)
+        self.__token_time = now
+
+        if self.__tokens >= 1:
+            self.__tokens -= 1
+            return None
+
+        return math.ceil((1 - self.__tokens) / self.__rate_limit)
+
+    def __count(self, key:str) -> None:
+        """
+        Increases a count of the stats
+
+        Parameters:
+        -----------
+        key : str
+            The name of the count
+        """
+
+        with self.__lock:
+            self.__stats[key] += 1
+
+        return None
+
+    def __count_served(self, title:str) -> None:
+        """
+        Remembers that an article was served and counts it as duplicate if it was served before
+
+        Parameters:
+        -----------
+        title : str
+            The canonical title of the article
+        """
+
+        with self.__lock:
+            if title in self.__served_titles:
+                self.__stats["duplicates"] += 1
+            else:
+                self.__served_titles.add(title)
+
+        return None
+
+    def __send(self, handler:BaseHTTPRequestHandler, status:int, content:dict | None, headers:dict[str, str]) -> None:
+        """
+        Sends a json response, gzip compressed if the client accepts it
+
+        Parameters:
+        -----------
+        handler : BaseHTTPRequestHandler
+            The handler of the request
+
+        status : int
+            The status code
+
+        content : dict | None
+            The json content, None for an empty body
+
+        headers : dict[str, str]
+            Additional headers
+        """
+
+        body = json.dumps(content, ensure_ascii = False).encode("UTF8") if content != None else b""
+
+        if body and "gzip" in handler.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel = 1)
+            headers = headers | {"Content-Encoding" : "gzip"}
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Content-Length", str(len(body)))
+
+        for name, value in headers.items():
+            handler.send_header(name, value)
+
+        handler.end_headers()
+        handler.wfile.write(body)
+
+        with self.__lock:
+            self.__stats["bytes"] += len(body)
+
+        return None
+
+
+def main() -> int:
+    print("Calling main function in standin_server")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
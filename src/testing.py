@@ -1,10 +1,33 @@
 from custom_io.filehelper import FileHelper
+from datastructures.custom_queue.bucketqueue import BucketQueue
+from datastructures.custom_queue.normalqueue import NormalQueue
+from datastructures.custom_queue.priorityqueue import PriorityQueue
+from datastructures.custom_queue.queue import WikiGraphQueue
+from datastructures.custom_queue.queueentry import QueueEntry
+from datastructures.custom_queue.spillqueue import SpillQueue
+from datastructures.graph.graph import Graph
 from logic.graphbuilder import GraphBuilder
+from logic.fetch.response_cache import ResponseCache
+from logic.fetch.article_store import ArticleStore
+from logic.fetch.requester import Requester
+from logic.build_journal import BuildJournal
+from standin.corpus import Corpus
+from standin.standin_server import StandinServer
+
+import multiprocessing
+import os
+import random
+import tempfile
+import time
 
 
 def main() -> int:
     #Just used for testing out new components and how they work together with old components
     build_test()
+    standin_build_test()
+    cache_build_test()
+    queue_test()
+    resume_test()
     return 0
 
 def build_test() ->None:
@@ -17,5 +40,187 @@ def build_test() ->None:
     helper.write_graph_to_file(graph, f"{graph.get_root()}-test", True)
     return None
 
+def standin_build_test() -> None:
+    #Same build as build_test, but offline against the local stand-in api with latency, failures and throttling
+    server = StandinServer(Corpus(), latency = 0.02, jitter = 0.01, error_rate = 0.01, rate_limit = 50)
+    builder = GraphBuilder(50, 10, requester = Requester(api_url = server.start()), workers = 4)
+    graph = builder.build_graph_from_article("Linux 0", "n", True)
+    server.stop()
+
+    assert graph
+    print(server.get_stats())
+    return None
+
+def cache_build_test() -> None:
+    #Builds the same graph twice against the local stand-in api with a response cache and an article store in a temporary folder.
+    #The second build has to take every article from the article store and build the same graph without a single parse request
+    server = StandinServer(Corpus(), latency = 0.0)
+    api_url = server.start()
+
+    with tempfile.TemporaryDirectory() as cache_folder:
+        graphs = []
+
+        for _ in range(2):
+            server.reset_stats()
+            cache = ResponseCache(os.path.join(cache_folder, "responses.sqlite"))
+            article_store = ArticleStore(os.path.join(cache_folder, "articles.sqlite"))
+            builder = GraphBuilder(50, 10, requester = Requester(api_url = api_url, cache = cache), cache = cache, article_store = article_store)
+            graphs.append(describe_graph(builder.build_graph_from_article("Linux 0", "n", False)))
+            cache.close()
+            article_store.close()
+
+        assert server.get_stats()["parse"] == 0, f"cached build sent {server.get_stats()['parse']} parse requests"
+        assert graphs[0] == graphs[1], "cached build differs from the first build"
+
+    server.stop()
+    print(f"cached build matches the first build ({len(graphs[0][0])} nodes, {len(graphs[0][1])} edges) without parse requests")
+    return None
+
+def queue_test(seeds:int = 20, steps:int = 400) -> None:
+    #Runs the same random adds, updates, blacklists, peeks and takes on every queue type and checks each of them against
+    #a reference model. The spilling queue runs with every memory bound from 1 to 20 and has to take exactly what the normal queue takes
+    for seed in range(seeds):
+        normal_taken = run_queue_model(NormalQueue("root"), "n", seed, steps)
+        run_queue_model(PriorityQueue("root"), "p", seed, steps)
+        run_queue_model(BucketQueue("root"), "b", seed, steps)
+
+        for memory_entries in range(1, 21):
+            spill_queue = SpillQueue("root", memory_entries = memory_entries)
+            spill_taken = run_queue_model(spill_queue, "s", seed, steps)
+            spill_queue.close()
+
+            assert spill_taken == normal_taken, f"spilling queue with {memory_entries} entries in memory differs from the normal queue, seed {seed}"
+
+    print(f"queues n, p, b and s with memory bounds 1 to 20 match their reference models over {seeds} seeds of {steps} operations")
+    return None
+
+def run_queue_model(queue:WikiGraphQueue, queue_type:str, seed:int, steps:int) -> list[tuple[str, int, int, tuple[int, ...]] | None]:
+    #Applies the random operations of seed to queue and to a reference model with the order of queue_type, which keeps
+    #the origins, depth, add order and the order the entry reached its degree per name. Compares every peek, take and count
+    #and returns the taken entries
+    randomizer = random.Random(seed)
+    reference:dict[str, list] = {}
+    blacklist = {"root"}
+    taken:list[tuple[str, int, int, tuple[int, ...]] | None] = []
+    sequence = 0
+
+    for step in range(steps + 200):
+        operation = randomizer.random() if step < steps else 1.0
+
+        if operation < 0.6:
+            links = [f"Artikel {randomizer.randrange(120)}" for _ in range(randomizer.randrange(10))]
+            origin_depth = randomizer.randrange(4)
+            add_new = operation < 0.5
+
+            if add_new:
+                queue.add_new_entries(links, step, origin_depth, False)
+            else:
+                queue.only_update_entries(links, step, origin_depth, False)
+
+            for link in links:
+                if link in blacklist:
+                    continue
+
+                if link in reference:
+                    reference[link][0].append(step)
+                    reference[link][1] = min(reference[link][1], origin_depth + 1)
+                    reference[link][3] = sequence
+                elif add_new:
+                    reference[link] = [[step], origin_depth + 1, sequence, sequence]
+
+                sequence += 1
+        elif operation < 0.95 or step >= steps:
+            expected = sorted(reference, key = lambda name: reference_key(queue_type, reference[name]))
+            amount = randomizer.randrange(1, 6) if step < steps else 1
+
+            assert [entry.get_name() for entry in queue.peek_entries(amount)] == expected[:amount], f"queue {queue_type} peeks wrong entries, seed {seed}, step {step}"
+
+            taken_entry = describe_entry(queue.get_next_entry())
+            expected_entry = (expected[0], len(reference[expected[0]][0]), reference[expected[0]][1], tuple(reference[expected[0]][0])) if expected else None
+
+            assert taken_entry == expected_entry, f"queue {queue_type} takes {taken_entry} instead of {expected_entry}, seed {seed}, step {step}"
+
+            if expected:
+                del reference[expected[0]]
+                blacklist.add(expected[0])
+
+            taken.append(taken_entry)
+        else:
+            blacklisted_name = f"Artikel {randomizer.randrange(60)}"
+            queue.add_article_to_blacklist(blacklisted_name)
+            blacklist.add(blacklisted_name)
+
+        assert queue.get_entry_count() == len(reference), f"queue {queue_type} counts {queue.get_entry_count()} entries instead of {len(reference)}, seed {seed}, step {step}"
+
+    assert queue.get_next_entry() == None
+    return taken
+
+def reference_key(queue_type:str, reference_entry:list) -> tuple[int, int]:
+    #The normal and spilling queue take in the order entries were added, the priority queue by degree and then in the order
+    #entries were added and the bucket queue by degree and then in the order entries reached their degree
+    if queue_type == "p":
+        return -len(reference_entry[0]), reference_entry[2]
+
+    if queue_type == "b":
+        return -len(reference_entry[0]), reference_entry[3]
+
+    return 0, reference_entry[2]
+
+def describe_entry(entry:QueueEntry | None) -> tuple[str, int, int, tuple[int, ...]] | None:
+    if entry == None:
+        return None
+
+    return entry.get_name(), entry.get_degree(), entry.get_depth(), entry.get_origins()
+
+def resume_test(size:int = 250, checkpoints:int = 3) -> None:
+    #Kills journaled builds against the stand-in api after a few checkpoints, resumes them and compares the graphs
+    #with uninterrupted builds of the same settings, for every queue type, serially and concurrently
+    server = StandinServer(Corpus(), latency = 0.02)
+    api_url = server.start()
+    journal_file = os.path.join(tempfile.gettempdir(), "standin-resume-test.journal")
+
+    for queue_type in ["n", "p", "b", "s"]:
+        for workers in [1, 4]:
+            builder = GraphBuilder(size, 10, requester = Requester(api_url = api_url), workers = workers)
+            expected = describe_graph(builder.build_graph_from_article("Linux 0", queue_type, False))
+
+            if os.path.exists(journal_file):
+                os.remove(journal_file)
+
+            build_process = multiprocessing.get_context("spawn").Process(target = run_journaled_build, args = (api_url, journal_file, queue_type, workers, size))
+            build_process.start()
+
+            while build_process.is_alive() and count_checkpoints(journal_file) < checkpoints:
+                time.sleep(0.05)
+
+            build_process.kill()
+            build_process.join()
+
+            builder = GraphBuilder(size, 10, requester = Requester(api_url = api_url), workers = workers, journal = BuildJournal(journal_file, 20))
+            resumed = describe_graph(builder.resume_graph(False))
+
+            assert resumed == expected, f"resumed {queue_type} build with {workers} workers differs from the uninterrupted build"
+            print(f"queue {queue_type}, {workers} workers: resumed build matches ({len(expected[0])} nodes, {len(expected[1])} edges)")
+
+    server.stop()
+    return None
+
+def run_journaled_build(api_url:str, journal_file:str, queue_type:str, workers:int, size:int) -> None:
+    #Runs in a separate process, so resume_test can kill it in the middle of the build
+    builder = GraphBuilder(size, 10, requester = Requester(api_url = api_url), workers = workers, journal = BuildJournal(journal_file, 20))
+    builder.build_graph_from_article("Linux 0", queue_type, False)
+    return None
+
+def count_checkpoints(journal_file:str) -> int:
+    if not os.path.exists(journal_file):
+        return 0
+
+    with open(journal_file, "r", encoding = "UTF8") as file:
+        return sum(1 for line in file if line.startswith('["C"]'))
+
+def describe_graph(graph:Graph | None) -> tuple[set[tuple[int, str]], set[tuple[int, int]]]:
+    assert graph
+    return {(node.get_id(), node.get_name()) for node in graph.get_nodes()}, {(edge.get_start_id(), edge.get_end_id()) for edge in graph.get_edges()}
+
 if __name__ == "__main__":
     main()
\ No newline at end of file